@@ -1,5 +1,7 @@
 """OpenAPI core app module"""
 
+import logging
+import time
 from functools import cached_property
 from pathlib import Path
 from typing import Any
@@ -24,6 +26,7 @@ from openapi_core.exceptions import SpecError
 from openapi_core.protocols import Request
 from openapi_core.protocols import Response
 from openapi_core.protocols import WebhookRequest
+from openapi_core.schema.snapshots import create_snapshot
 from openapi_core.types import AnyRequest
 from openapi_core.unmarshalling.request import (
     UNMARSHALLERS as REQUEST_UNMARSHALLERS,
@@ -74,6 +77,8 @@ from openapi_core.validation.response.protocols import WebhookResponseValidator
 from openapi_core.validation.response.types import ResponseValidatorType
 from openapi_core.validation.response.types import WebhookResponseValidatorType
 
+log = logging.getLogger(__name__)
+
 
 class OpenAPI:
     """`OpenAPI` application class, the main entrypoint class for OpenAPI-core.
@@ -144,6 +149,14 @@ class OpenAPI:
 
         self.check_spec()
 
+        if self.config.spec_snapshot:
+            self.spec = create_snapshot(
+                self.spec, maxsize=self.config.spec_snapshot_maxsize
+            )
+
+        if self.config.eager:
+            self.precompile()
+
     @classmethod
     def from_dict(
         cls,
@@ -350,6 +363,47 @@ class OpenAPI:
         except ValidatorDetectError:
             raise SpecError("spec not detected")
 
+    def precompile(self) -> float:
+        """Builds validators and unmarshallers of the whole specification.
+
+        Walks every operation parameter, request body, response and header
+        so the first requests don't pay for building their schema
+        validators, casters and unmarshallers. The schema validators and
+        unmarshal plans caches grow to fit every precompiled schema.
+
+        Returns:
+            Precompilation time in seconds.
+        """
+        start = time.perf_counter()
+        count = 0
+        for processor in self._iter_processors():
+            precompile = getattr(processor, "precompile", None)
+            if precompile is not None:
+                count += precompile()
+        duration = time.perf_counter() - start
+        log.info("%d schemas precompiled in %.3fs", count, duration)
+        return duration
+
+    def _iter_processors(self) -> Iterator[Any]:
+        if self.request_validator_cls is not None:
+            yield self.request_validator
+        if self.response_validator_cls is not None:
+            yield self.response_validator
+        if self.request_unmarshaller_cls is not None:
+            yield self.request_unmarshaller
+        if self.response_unmarshaller_cls is not None:
+            yield self.response_unmarshaller
+        if "webhooks" not in self.spec:
+            return
+        if self.webhook_request_validator_cls is not None:
+            yield self.webhook_request_validator
+        if self.webhook_response_validator_cls is not None:
+            yield self.webhook_response_validator
+        if self.webhook_request_unmarshaller_cls is not None:
+            yield self.webhook_request_unmarshaller
+        if self.webhook_response_unmarshaller_cls is not None:
+            yield self.webhook_response_unmarshaller
+
     @property
     def version(self) -> SpecVersion:
         return self._get_version()
@@ -430,6 +484,11 @@ class OpenAPI:
             forbid_unspecified_additional_properties=self.config.additional_properties_default_policy
             == "forbid",
             security_provider_factory=self.config.security_provider_factory,
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
         )
 
     @cached_property
@@ -451,6 +510,11 @@ class OpenAPI:
             == "forbid",
             enforce_properties_required=self.config.response_properties_default_policy
             == "required",
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
         )
 
     @cached_property
@@ -471,6 +535,11 @@ class OpenAPI:
             forbid_unspecified_additional_properties=self.config.additional_properties_default_policy
             == "forbid",
             security_provider_factory=self.config.security_provider_factory,
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
         )
 
     @cached_property
@@ -492,6 +561,11 @@ class OpenAPI:
             == "forbid",
             enforce_properties_required=self.config.response_properties_default_policy
             == "required",
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
         )
 
     @cached_property
@@ -514,6 +588,14 @@ class OpenAPI:
             security_provider_factory=self.config.security_provider_factory,
             schema_unmarshallers_factory=self.config.schema_unmarshallers_factory,
             extra_format_unmarshallers=self.config.extra_format_unmarshallers,
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
+            compile_schema_unmarshallers=self.config.compile_schema_unmarshallers,
+            trusted_unmarshalling=self.config.trusted_unmarshalling,
+            lazy_unmarshalling=self.config.lazy_unmarshalling,
         )
 
     @cached_property
@@ -537,6 +619,14 @@ class OpenAPI:
             == "required",
             schema_unmarshallers_factory=self.config.schema_unmarshallers_factory,
             extra_format_unmarshallers=self.config.extra_format_unmarshallers,
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
+            compile_schema_unmarshallers=self.config.compile_schema_unmarshallers,
+            trusted_unmarshalling=self.config.trusted_unmarshalling,
+            lazy_unmarshalling=self.config.lazy_unmarshalling,
         )
 
     @cached_property
@@ -559,6 +649,14 @@ class OpenAPI:
             security_provider_factory=self.config.security_provider_factory,
             schema_unmarshallers_factory=self.config.schema_unmarshallers_factory,
             extra_format_unmarshallers=self.config.extra_format_unmarshallers,
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
+            compile_schema_unmarshallers=self.config.compile_schema_unmarshallers,
+            trusted_unmarshalling=self.config.trusted_unmarshalling,
+            lazy_unmarshalling=self.config.lazy_unmarshalling,
         )
 
     @cached_property
@@ -582,6 +680,14 @@ class OpenAPI:
             == "required",
             schema_unmarshallers_factory=self.config.schema_unmarshallers_factory,
             extra_format_unmarshallers=self.config.extra_format_unmarshallers,
+            path_finder_cache_maxsize=self.config.path_finder_cache_maxsize,
+            path_finder_cache_ttl=self.config.path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=self.config.path_finder_negative_cache_maxsize,
+            compile_schema_validators=self.config.compile_schema_validators,
+            first_schema_error_only=self.config.first_schema_error_only,
+            compile_schema_unmarshallers=self.config.compile_schema_unmarshallers,
+            trusted_unmarshalling=self.config.trusted_unmarshalling,
+            lazy_unmarshalling=self.config.lazy_unmarshalling,
         )
 
     def validate_request(
@@ -0,0 +1,90 @@
+"""OpenAPI core caches module"""
+
+from collections import OrderedDict
+from collections import namedtuple
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "ttl"]
+)
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe bounded LRU cache with optional time to live.
+
+    Entries older than `ttl` seconds are treated as missing.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be copied nor pickled
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            try:
+                created, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if self.ttl is not None and monotonic() - created > self.ttl:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = (monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def reserve(self, size: int) -> None:
+        """Grow the cache to fit `size` more entries without evictions."""
+        with self._lock:
+            self.maxsize = max(self.maxsize, len(self._data) + size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._data), self.ttl
+        )
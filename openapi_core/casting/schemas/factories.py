@@ -17,6 +17,10 @@ class SchemaCastersFactory:
         self.schema_validators_factory = schema_validators_factory
         self.types_caster = types_caster
 
+    def reserve(self, size: int) -> None:
+        """Make room for `size` more casters schema validators."""
+        self.schema_validators_factory.reserve(size)
+
     def create(
         self,
         spec: SchemaPath,
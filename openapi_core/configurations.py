@@ -41,6 +41,12 @@ class Config(UnmarshallerConfig):
         response_properties_default_policy: If true, require documented response
             properties (except writeOnly properties) in response validation and
             unmarshalling.
+        eager: If true, build validators and unmarshallers of the whole
+            specification when the OpenAPI object is created.
+        spec_snapshot: If true, keep specification paths resolved on
+            their first read.
+        spec_snapshot_maxsize: Maximum number of resolved specification
+            paths kept by the snapshot.
     """
 
     spec_validator_cls: Union[SpecValidatorType, Unset] = _UNSET
@@ -62,3 +68,6 @@ class Config(UnmarshallerConfig):
     webhook_response_unmarshaller_cls: Union[
         WebhookResponseUnmarshallerType, Unset
     ] = _UNSET
+    eager: bool = False
+    spec_snapshot: bool = False
+    spec_snapshot_maxsize: int = 4096
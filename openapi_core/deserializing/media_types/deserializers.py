@@ -137,28 +137,23 @@ class MediaTypeDeserializer:
 
         # For urlencoded/multipart, use caster for oneOf/anyOf detection if validator available
         if self.schema_validator is not None:
-            one_of_schema = self.schema_validator.get_one_of_schema(
+            composed_schemas = self.schema_validator.get_composed_schemas(
                 location, caster=self.schema_caster
             )
+            one_of_schema = composed_schemas.one_of
             if one_of_schema is not None:
                 one_of_properties = self.evolve(one_of_schema).decode(
                     location, schema_only=True
                 )
                 properties.update(one_of_properties)
 
-            any_of_schemas = self.schema_validator.iter_any_of_schemas(
-                location, caster=self.schema_caster
-            )
-            for any_of_schema in any_of_schemas:
+            for any_of_schema in composed_schemas.any_of:
                 any_of_properties = self.evolve(any_of_schema).decode(
                     location, schema_only=True
                 )
                 properties.update(any_of_properties)
 
-            all_of_schemas = self.schema_validator.iter_all_of_schemas(
-                location
-            )
-            for all_of_schema in all_of_schemas:
+            for all_of_schema in composed_schemas.all_of:
                 all_of_properties = self.evolve(all_of_schema).decode(
                     location, schema_only=True
                 )
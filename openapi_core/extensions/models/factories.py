@@ -4,11 +4,13 @@ from dataclasses import make_dataclass
 from pydoc import locate
 from typing import Any
 from typing import Dict
+from typing import Hashable
 from typing import Iterable
 from typing import Type
 
 from jsonschema_path import SchemaPath
 
+from openapi_core.caches import LRUCache
 from openapi_core.extensions.models.types import Field
 
 
@@ -22,6 +24,9 @@ class DictFactory:
 
 
 class ModelFactory(DictFactory):
+    # (schema, model name, fields) -> model class, shared between factories
+    models: LRUCache[Hashable, Type[Any]] = LRUCache(1024)
+
     def create(
         self,
         schema: SchemaPath,
@@ -31,10 +36,26 @@ class ModelFactory(DictFactory):
         if name is None:
             return super().create(schema, fields)
 
-        return make_dataclass(name, fields, frozen=True)
+        fields = tuple(fields)
+        key = (schema, name, fields)
+        try:
+            model = self.models.get(key)
+        # unhashable field types
+        except TypeError:
+            return self._make_model(name, fields)
+        if model is None:
+            model = self._make_model(name, fields)
+            self.models.set(key, model)
+        return model
+
+    def _make_model(self, name: str, fields: Iterable[Field]) -> Type[Any]:
+        return make_dataclass(name, fields, frozen=True, slots=True)
 
 
 class ModelPathFactory(ModelFactory):
+    # model class path -> located model class, shared between factories
+    model_classes: LRUCache[str, Any] = LRUCache(1024)
+
     def create(
         self,
         schema: SchemaPath,
@@ -44,4 +65,10 @@ class ModelPathFactory(ModelFactory):
         if model_class_path is None:
             return super().create(schema, fields)
 
-        return locate(model_class_path)
+        model_class = self.model_classes.get(model_class_path)
+        if model_class is None:
+            model_class = locate(model_class_path)
+            # not importable yet, try again next time
+            if model_class is not None:
+                self.model_classes.set(model_class_path, model_class)
+        return model_class
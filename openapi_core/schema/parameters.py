@@ -1,7 +1,10 @@
+from typing import Iterator
 from typing import Tuple
 
 from jsonschema_path import SchemaPath
 
+from openapi_core.schema.schemas import iter_content_schemas
+
 
 def get_style(
     param_or_header: SchemaPath, default_location: str = "header"
@@ -38,3 +41,13 @@ def get_style_and_explode(
         return style, param_or_header["explode"]
 
     return style, style == "form"
+
+
+def iter_param_or_header_schemas(
+    param_or_header: SchemaPath,
+) -> Iterator[SchemaPath]:
+    """Iterates parameter/header schemas of all scenarios"""
+    if "schema" in param_or_header:
+        yield param_or_header / "schema"
+    if "content" in param_or_header:
+        yield from iter_content_schemas(param_or_header / "content")
@@ -1,5 +1,6 @@
 from typing import Any
 from typing import Dict
+from typing import Iterator
 
 from jsonschema_path import SchemaPath
 
@@ -8,3 +9,10 @@ def get_properties(schema: SchemaPath) -> Dict[str, Any]:
     properties = schema.get("properties", SchemaPath.from_dict({}))
     properties_dict = dict(list(properties.items()))
     return properties_dict
+
+
+def iter_content_schemas(content: SchemaPath) -> Iterator[SchemaPath]:
+    """Iterates schemas of the content media types"""
+    for _, media_type in content.str_items():
+        if "schema" in media_type:
+            yield media_type / "schema"
@@ -0,0 +1,54 @@
+"""OpenAPI core schema snapshots module"""
+
+from typing import Any
+from typing import Sequence
+from typing import Tuple
+from typing import cast
+
+from jsonschema_path import SchemaAccessor
+from jsonschema_path import SchemaPath
+from jsonschema_path.typing import Schema
+from pathable.types import LookupKey
+
+from openapi_core.caches import LRUCache
+
+
+class SnapshotAccessor(SchemaAccessor):
+    """Schema accessor reading from a snapshot of the resolved spec paths.
+
+    Spec paths are resolved, with their references followed, by the
+    wrapped accessor and kept in a bounded LRU cache. Later reads of the
+    path are cache lookups. Paths of recursive schemas grow with the
+    depth of the data, so the least recently read paths are dropped.
+
+    Paths failing to resolve are not kept, hence raise the same errors
+    on every read. Paths missing from the snapshot are resolved with the
+    wrapped accessor's resolved paths cache.
+    """
+
+    def __init__(self, accessor: SchemaAccessor, maxsize: int = 4096):
+        with accessor.resolve(()) as resolved:
+            super().__init__(
+                cast(Schema, accessor.node), cast(Any, resolved.resolver)
+            )
+        self.accessor = accessor
+        # path parts -> resolved path
+        self.snapshot: LRUCache[Tuple[LookupKey, ...], Any] = LRUCache(maxsize)
+
+    def get_resolved(self, parts: Sequence[LookupKey]) -> Any:
+        key = tuple(parts)
+        resolved = self.snapshot.get(key)
+        if resolved is None:
+            resolved = self.accessor.get_resolved(key)
+            self.snapshot.set(key, resolved)
+        return resolved
+
+
+def create_snapshot(spec: SchemaPath, maxsize: int = 4096) -> SchemaPath:
+    """Create spec path backed by the snapshot of the spec paths."""
+    accessor = spec.accessor
+    if not isinstance(accessor, SnapshotAccessor):
+        accessor = SnapshotAccessor(
+            cast(SchemaAccessor, accessor), maxsize=maxsize
+        )
+    return SchemaPath(accessor, *spec.parts, separator=spec.separator)
@@ -1,7 +1,9 @@
 from openapi_core.templating.paths.finders import APICallPathFinder
+from openapi_core.templating.paths.finders import RegexAPICallPathFinder
 from openapi_core.templating.paths.finders import WebhookPathFinder
 
 __all__ = [
     "APICallPathFinder",
+    "RegexAPICallPathFinder",
     "WebhookPathFinder",
 ]
@@ -1,22 +1,47 @@
 """OpenAPI core templating paths finders module"""
 
+import logging
+from functools import cached_property
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 from jsonschema_path import SchemaPath
 from more_itertools import peekable
 
+from openapi_core.templating.datatypes import TemplateResult
+from openapi_core.templating.paths.datatypes import Path
 from openapi_core.templating.paths.datatypes import PathOperationServer
 from openapi_core.templating.paths.exceptions import OperationNotFound
+from openapi_core.templating.paths.exceptions import PathError
 from openapi_core.templating.paths.exceptions import PathNotFound
 from openapi_core.templating.paths.exceptions import ServerNotFound
 from openapi_core.templating.paths.iterators import SimpleOperationsIterator
 from openapi_core.templating.paths.iterators import SimplePathsIterator
 from openapi_core.templating.paths.iterators import SimpleServersIterator
-from openapi_core.templating.paths.iterators import TemplatePathsIterator
-from openapi_core.templating.paths.iterators import TemplateServersIterator
 from openapi_core.templating.paths.protocols import OperationsIterator
 from openapi_core.templating.paths.protocols import PathsIterator
 from openapi_core.templating.paths.protocols import ServersIterator
+from openapi_core.templating.paths.routers import PathsRouter
+from openapi_core.templating.paths.routers import RegexPathsRouter
+from openapi_core.templating.paths.routers import ServersRouter
+from openapi_core.templating.paths.routers import iter_operations
+
+PathsRouterType = Union[PathsRouter, RegexPathsRouter]
+
+# matched path location and server URL part -> whether the path has
+# the operation and its first server match
+OperationsMemo = Dict[
+    Tuple[Tuple[Any, ...], str], Tuple[bool, Optional[PathOperationServer]]
+]
+
+log = logging.getLogger(__name__)
 
 
 class BasePathFinder:
@@ -29,11 +54,66 @@ class BasePathFinder:
         self.base_url = base_url
 
     def find(self, method: str, name: str) -> PathOperationServer:
-        paths_iter = self.paths_iterator(
+        return self._resolve(method, name)
+
+    def precompile(self) -> None:
+        """Build path and server indexes ahead of the first lookup."""
+
+    def find_many(
+        self, requests: Iterable[Tuple[str, str]]
+    ) -> List[Union[PathOperationServer, PathError]]:
+        """Resolves method and URL pairs in bulk.
+
+        Requests are grouped by method. Within a group, operation and
+        server lookups are done once per matched path and server URL,
+        then shared by every URL resolving to them. Every distinct pair
+        is resolved once. Results are returned in the order of requests,
+        with failed lookups as their path error. Repeated pairs share
+        the same result object.
+        """
+        groups: Dict[str, Dict[str, List[int]]] = {}
+        count = 0
+        for method, name in requests:
+            groups.setdefault(method, {}).setdefault(name, []).append(count)
+            count += 1
+
+        results: List[Union[PathOperationServer, PathError]] = [
+            None  # type: ignore[list-item]
+        ] * count
+        for method, names in groups.items():
+            memo: OperationsMemo = {}
+            for name, indexes in names.items():
+                result: Union[PathOperationServer, PathError]
+                try:
+                    result = self._resolve(method, name, memo)
+                except PathError as exc:
+                    result = exc
+                for index in indexes:
+                    results[index] = result
+        return results
+
+    def _resolve(
+        self,
+        method: str,
+        name: str,
+        memo: Optional[OperationsMemo] = None,
+    ) -> PathOperationServer:
+        return self._find(self.paths_iterator, method, name, memo)
+
+    def _find(
+        self,
+        paths_iterator: PathsIterator,
+        method: str,
+        name: str,
+        memo: Optional[OperationsMemo] = None,
+    ) -> PathOperationServer:
+        paths_iter = paths_iterator(
             name,
             self.spec,
             base_url=self.base_url,
         )
+        if memo is not None:
+            return self._find_memoized(paths_iter, method, name, memo)
         paths_iter_peek = peekable(paths_iter)
 
         if not paths_iter_peek:
@@ -59,13 +139,126 @@ class BasePathFinder:
         except StopIteration:
             raise ServerNotFound(name)
 
+    def _find_memoized(
+        self,
+        paths_iter: Iterator[Path],
+        method: str,
+        name: str,
+        memo: OperationsMemo,
+    ) -> PathOperationServer:
+        path_found = operation_found = False
+        for path, path_result in paths_iter:
+            path_found = True
+            # servers are matched against the URL part before the path
+            key = (path.parts, name.rsplit(path_result.resolved, 1)[0])
+            try:
+                has_operation, match = memo[key]
+            except KeyError:
+                operations_iter = peekable(
+                    self.operations_iterator(
+                        method,
+                        iter([Path(path, path_result)]),
+                        self.spec,
+                        base_url=self.base_url,
+                    )
+                )
+                has_operation = bool(operations_iter)
+                servers_iter = self.servers_iterator(
+                    name, operations_iter, self.spec, base_url=self.base_url
+                )
+                match = next(servers_iter, None)
+                memo[key] = has_operation, match
+            operation_found = operation_found or has_operation
+            if match is not None:
+                # server variables are handed over to the request;
+                # don't share them between URLs
+                server_result = match.server_result
+                return match._replace(
+                    path=path,
+                    path_result=path_result,
+                    server_result=TemplateResult(
+                        server_result.pattern,
+                        dict(server_result.variables or {}),
+                    ),
+                )
+
+        if not path_found:
+            raise PathNotFound(name)
+        if not operation_found:
+            raise OperationNotFound(name, method)
+        raise ServerNotFound(name)
+
 
 class APICallPathFinder(BasePathFinder):
-    paths_iterator: PathsIterator = TemplatePathsIterator("paths")
+    paths_router_cls: Type[PathsRouterType] = PathsRouter
     operations_iterator: OperationsIterator = SimpleOperationsIterator()
-    servers_iterator: ServersIterator = TemplateServersIterator()
+
+    @cached_property
+    def paths_iterator(self) -> PathsIterator:  # type: ignore[override]
+        return self.paths_router_cls(self.spec, "paths")
+
+    @cached_property
+    def method_paths_iterators(self) -> Dict[str, PathsIterator]:
+        # custom paths iterators must not be bypassed
+        if type(self.paths_iterator) is not self.paths_router_cls:
+            return {}
+        paths = self.spec / "paths"
+        if not paths.exists():
+            return {}
+        methods = {
+            method
+            for _, path in paths.str_items()
+            for method, _ in iter_operations(path)
+        }
+        return {
+            method: self.paths_router_cls(self.spec, "paths", method=method)
+            for method in methods
+        }
+
+    def precompile(self) -> None:
+        routers = [self.paths_iterator, self.servers_iterator]
+        routers.extend(self.method_paths_iterators.values())
+        log.debug("%d path finder routers built", len(routers))
+
+    def _resolve(
+        self,
+        method: str,
+        name: str,
+        memo: Optional[OperationsMemo] = None,
+    ) -> PathOperationServer:
+        paths_iterator = self.method_paths_iterators.get(method)
+        if paths_iterator is None:
+            return super()._resolve(method, name, memo)
+        try:
+            return self._find(paths_iterator, method, name, memo)
+        # tell missing path and missing operation apart
+        except PathNotFound:
+            return super()._resolve(method, name, memo)
+
+    @cached_property
+    def servers_iterator(self) -> ServersIterator:  # type: ignore[override]
+        return ServersRouter(self.spec, "paths", base_url=self.base_url)
+
+
+class RegexAPICallPathFinder(APICallPathFinder):
+    paths_router_cls = RegexPathsRouter
 
 
 class WebhookPathFinder(APICallPathFinder):
-    paths_iterator = SimplePathsIterator("webhooks")
     servers_iterator = SimpleServersIterator()
+
+    @cached_property
+    def paths_iterator(self) -> PathsIterator:  # type: ignore[override]
+        return SimplePathsIterator("webhooks")
+
+    def precompile(self) -> None:
+        paths_iterator = self.paths_iterator
+        log.debug("path finder %r built", paths_iterator)
+
+    def _resolve(
+        self,
+        method: str,
+        name: str,
+        memo: Optional[OperationsMemo] = None,
+    ) -> PathOperationServer:
+        return self._find(self.paths_iterator, method, name, memo)
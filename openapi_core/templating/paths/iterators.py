@@ -2,6 +2,7 @@ from functools import lru_cache
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from urllib.parse import urljoin
 from urllib.parse import urlparse
 
@@ -17,34 +18,46 @@ from openapi_core.templating.paths.parsers import PathParser
 from openapi_core.templating.paths.util import template_path_len
 
 
-class SimplePathsIterator:
+class BasePathsIterator:
+    """Paths iterator with a snapshot of the spec paths.
+
+    The path names and their `SchemaPath` accessors are collected once
+    and reused for as long as the same spec object is passed in.
+    """
+
     def __init__(self, paths_part: str):
         self.paths_part = paths_part
-
+        self._snapshot: Optional[
+            Tuple[SchemaPath, List[Tuple[str, SchemaPath]]]
+        ] = None
+
+    def _get_paths(self, spec: SchemaPath) -> List[Tuple[str, SchemaPath]]:
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] is not spec:
+            paths = spec / self.paths_part
+            if not paths.exists():
+                raise PathsNotFound(paths.as_uri())
+            snapshot = (spec, list(paths.str_items()))
+            self._snapshot = snapshot
+        return snapshot[1]
+
+
+class SimplePathsIterator(BasePathsIterator):
     def __call__(
         self, name: str, spec: SchemaPath, base_url: Optional[str] = None
     ) -> Iterator[Path]:
-        paths = spec / self.paths_part
-        if not paths.exists():
-            raise PathsNotFound(paths.as_uri())
-        for path_name, path in list(paths.str_items()):
+        for path_name, path in self._get_paths(spec):
             if name == path_name:
                 path_result = TemplateResult(path_name, {})
                 yield Path(path, path_result)
 
 
-class TemplatePathsIterator:
-    def __init__(self, paths_part: str):
-        self.paths_part = paths_part
-
+class TemplatePathsIterator(BasePathsIterator):
     def __call__(
         self, name: str, spec: SchemaPath, base_url: Optional[str] = None
     ) -> Iterator[Path]:
-        paths = spec / self.paths_part
-        if not paths.exists():
-            raise PathsNotFound(paths.as_uri())
         template_paths: List[Path] = []
-        for path_pattern, path in list(paths.str_items()):
+        for path_pattern, path in self._get_paths(spec):
             # simple path.
             # Return right away since it is always the most concrete
             if name.endswith(path_pattern):
@@ -0,0 +1,527 @@
+"""OpenAPI core templating paths routers module"""
+
+import re
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from typing import Union
+from urllib.parse import urljoin
+from urllib.parse import urlparse
+
+from jsonschema_path import SchemaPath
+
+from openapi_core.schema.servers import is_absolute
+from openapi_core.templating.datatypes import TemplateResult
+from openapi_core.templating.paths.datatypes import Path
+from openapi_core.templating.paths.datatypes import PathOperation
+from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.templating.paths.exceptions import PathsNotFound
+from openapi_core.templating.paths.parsers import PathParser
+
+VARIABLE_PATTERN = re.compile(r"\{([^}]*)\}")
+# path item fixed fields other than operations
+PATH_ITEM_FIELDS = ("$ref", "summary", "description", "servers", "parameters")
+
+# literal text, variable name or parser of a mixed segment
+SegmentMatcher = Union[str, Tuple[str], PathParser]
+# pattern, path and parser of a valid template
+RegexTemplate = Tuple[str, SchemaPath, Optional[PathParser]]
+
+
+class PathTemplate:
+    """Path template compiled into per-segment matchers."""
+
+    def __init__(self, index: int, pattern: str, path: SchemaPath):
+        self.index = index
+        self.pattern = pattern
+        self.path = path
+        self.matchers = [
+            self._get_segment_matcher(segment)
+            for segment in pattern.split("/")[1:]
+        ]
+
+    def get_variables(self, segments: List[str]) -> Dict[str, str]:
+        variables: Dict[str, str] = {}
+        for matcher, segment in zip(self.matchers, segments):
+            if isinstance(matcher, tuple):
+                variables[matcher[0]] = segment
+            elif isinstance(matcher, PathParser):
+                result = matcher.parse(segment)
+                assert result is not None
+                variables.update(result.named)
+        return variables
+
+    def _get_segment_matcher(self, segment: str) -> SegmentMatcher:
+        if "{" not in segment:
+            return segment
+        if (
+            segment.startswith("{")
+            and segment.endswith("}")
+            and segment.count("{") == 1
+            and segment.count("}") == 1
+        ):
+            return (segment[1:-1],)
+        try:
+            return PathParser(segment)
+        # not a valid template; only exact match is possible
+        except ValueError:
+            return segment
+
+
+def iter_operations(path: SchemaPath) -> Iterator[Tuple[str, SchemaPath]]:
+    for method, operation in path.str_items():
+        if method in PATH_ITEM_FIELDS or method.startswith("x-"):
+            continue
+        yield method, operation
+
+
+def is_literal(pattern: str) -> bool:
+    return pattern.startswith("/") and "{" not in pattern
+
+
+class LiteralPaths:
+    """Hash index of path patterns without variables.
+
+    A pattern can only match the URL part starting at one of its slashes,
+    so a lookup takes one dict access per distinct pattern depth.
+    """
+
+    def __init__(self) -> None:
+        self.paths: Dict[str, Tuple[int, SchemaPath]] = {}
+        self.depths: List[int] = []
+
+    def add(self, index: int, pattern: str, path: SchemaPath) -> None:
+        self.paths[pattern] = (index, path)
+        depth = pattern.count("/")
+        if depth not in self.depths:
+            self.depths.append(depth)
+            self.depths.sort()
+
+    def match(self, segments: List[str]) -> List[Path]:
+        # the first segment always belongs to the server part
+        max_depth = len(segments) - 1
+        paths: List[Tuple[int, str, SchemaPath]] = []
+        for depth in self.depths:
+            if depth > max_depth:
+                break
+            pattern = "/" + "/".join(segments[-depth:])
+            try:
+                index, path = self.paths[pattern]
+            except KeyError:
+                continue
+            paths.append((index, pattern, path))
+        paths.sort(key=lambda item: item[0])
+        return [
+            Path(path, TemplateResult(pattern, {}))
+            for _, pattern, path in paths
+        ]
+
+
+class SegmentsFilter:
+    """Precomputed test rejecting URLs no path template can match.
+
+    Checks the URL segments count against the shallowest template and
+    the last URL segment against the literal last template segments.
+    """
+
+    def __init__(self) -> None:
+        self.min_depth: Optional[int] = None
+        self.tails: Set[str] = set()
+        self.any_tail = False
+
+    def add(self, pattern: str) -> None:
+        depth = 0
+        tail = ""
+        if pattern.startswith("/"):
+            segments = pattern.split("/")[1:]
+            depth = len(segments)
+            tail = segments[-1]
+        if self.min_depth is None or depth < self.min_depth:
+            self.min_depth = depth
+        if not pattern.startswith("/") or "{" in tail:
+            self.any_tail = True
+        else:
+            self.tails.add(tail)
+
+    def rejects(self, segments: List[str]) -> bool:
+        if self.min_depth is None:
+            return True
+        # the first segment always belongs to the server part
+        if len(segments) - 1 < self.min_depth:
+            return True
+        return not self.any_tail and segments[-1] not in self.tails
+
+
+class PathNode:
+    """Segment trie node keyed by segments counted from the URL end."""
+
+    __slots__ = ("literals", "variable", "parsers", "templates")
+
+    def __init__(self) -> None:
+        self.literals: Dict[str, PathNode] = {}
+        self.variable: Optional[PathNode] = None
+        self.parsers: Dict[str, Tuple[PathParser, PathNode]] = {}
+        self.templates: List[PathTemplate] = []
+
+
+class PathsRouter:
+    """Paths iterator backed by a segment trie compiled once per spec.
+
+    Path templates are indexed by their segments in reverse order, so
+    a lookup walks the URL from its end and visits only the trie nodes
+    its segments can reach. Paths without variables are looked up in
+    a hash index first and the trie is only walked when none of them
+    gets accepted and the segments filter doesn't reject the URL.
+    Whatever precedes the matched path is left for the servers
+    iterator. Matches are yielded in the same order as
+    `TemplatePathsIterator`: fewer variables first, then spec order.
+    When `method` is given, only paths defining that operation are
+    indexed.
+    """
+
+    def __init__(
+        self,
+        spec: SchemaPath,
+        paths_part: str,
+        method: Optional[str] = None,
+    ):
+        self.paths = spec / paths_part
+        self.method = method
+        self.literals = LiteralPaths()
+        self.filter = SegmentsFilter()
+        self.root: Optional[PathNode] = None
+        if self.paths.exists():
+            self.root = self._build(self.paths)
+
+    def __call__(
+        self, name: str, spec: SchemaPath, base_url: Optional[str] = None
+    ) -> Iterator[Path]:
+        if self.root is None:
+            raise PathsNotFound(self.paths.as_uri())
+        return self._iter_paths(self.root, name)
+
+    def _iter_paths(self, root: PathNode, name: str) -> Iterator[Path]:
+        segments = name.split("/")
+        yield from self.literals.match(segments)
+        if self.filter.rejects(segments):
+            return
+        yield from self._match_templates(root, segments)
+
+    def _match_templates(
+        self, root: PathNode, segments: List[str]
+    ) -> List[Path]:
+        segments_count = len(segments)
+        templates: List[Tuple[int, int, PathTemplate, Dict[str, str]]] = []
+        for template, depth in self._iter_templates(root, segments):
+            variables = template.get_variables(
+                segments[segments_count - depth :]
+            )
+            templates.append(
+                (len(variables), template.index, template, variables)
+            )
+        # Fewer variables -> more concrete path
+        templates.sort(key=lambda item: item[:2])
+        return [
+            Path(template.path, TemplateResult(template.pattern, variables))
+            for _, _, template, variables in templates
+        ]
+
+    def _iter_templates(
+        self, root: PathNode, segments: List[str]
+    ) -> Iterator[Tuple[PathTemplate, int]]:
+        # the first segment always belongs to the server part
+        max_depth = len(segments) - 1
+        nodes = [(root, 0)]
+        while nodes:
+            node, depth = nodes.pop()
+            for template in node.templates:
+                yield template, depth
+            if depth == max_depth:
+                continue
+            segment = segments[-1 - depth]
+            literal = node.literals.get(segment)
+            if literal is not None:
+                nodes.append((literal, depth + 1))
+            if node.variable is not None:
+                nodes.append((node.variable, depth + 1))
+            for parser, child in node.parsers.values():
+                if parser.parse(segment) is not None:
+                    nodes.append((child, depth + 1))
+
+    def _build(self, paths: SchemaPath) -> PathNode:
+        root = PathNode()
+        for index, (pattern, path) in enumerate(paths.str_items()):
+            if self.method is not None and self.method not in path:
+                continue
+            if is_literal(pattern):
+                self.literals.add(index, pattern, path)
+                continue
+            self.filter.add(pattern)
+            template = PathTemplate(index, pattern, path)
+            node = root
+            for matcher in reversed(template.matchers):
+                node = self._get_child(node, matcher)
+            node.templates.append(template)
+        return root
+
+    def _get_child(self, node: PathNode, matcher: SegmentMatcher) -> PathNode:
+        if isinstance(matcher, str):
+            return node.literals.setdefault(matcher, PathNode())
+        if isinstance(matcher, tuple):
+            if node.variable is None:
+                node.variable = PathNode()
+            return node.variable
+        if matcher.pattern not in node.parsers:
+            node.parsers[matcher.pattern] = (matcher, PathNode())
+        return node.parsers[matcher.pattern][1]
+
+
+class RegexPathsRouter:
+    """Paths iterator matching all path templates with a single regex.
+
+    Every template is compiled into one alternation, ordered by
+    concreteness, and matched against the reversed URL, so a single
+    `re.match` anchored at the URL end identifies the most concrete
+    matching template. Paths without variables are looked up in a hash
+    index before that and URLs no template can match are rejected by
+    a segments filter without running the regex. Less concrete
+    candidates are only searched for, template by template, when the
+    first one gets rejected by the operations or servers stage.
+    When `method` is given, only paths defining that operation are
+    indexed.
+    """
+
+    def __init__(
+        self,
+        spec: SchemaPath,
+        paths_part: str,
+        method: Optional[str] = None,
+    ):
+        self.paths = spec / paths_part
+        self.method = method
+        self.literals = LiteralPaths()
+        self.filter = SegmentsFilter()
+        self.templates: Optional[List[RegexTemplate]] = None
+        self.expressions: List[str] = []
+        # template index -> template regex, compiled on first use
+        self.regexes: Dict[int, Pattern[str]] = {}
+        if self.paths.exists():
+            self.templates = self._build(self.paths)
+            self.expressions = list(
+                map(self._get_reversed_expression, self.templates)
+            )
+        self.regex = re.compile(
+            "|".join(
+                f"(?P<t{index}>{expression})"
+                for index, expression in enumerate(self.expressions)
+            )
+        )
+
+    def __call__(
+        self, name: str, spec: SchemaPath, base_url: Optional[str] = None
+    ) -> Iterator[Path]:
+        if self.templates is None:
+            raise PathsNotFound(self.paths.as_uri())
+        return self._iter_paths(self.templates, name)
+
+    def _iter_paths(
+        self,
+        templates: List[RegexTemplate],
+        name: str,
+    ) -> Iterator[Path]:
+        segments = name.split("/")
+        yield from self.literals.match(segments)
+        if not templates or self.filter.rejects(segments):
+            return
+        reversed_name = name[::-1]
+        match = self.regex.match(reversed_name)
+        if match is None:
+            return
+        assert match.lastgroup is not None
+        index = int(match.lastgroup[1:])
+        yield self._get_path(templates[index], name, match.end())
+        for index in range(index + 1, len(templates)):
+            match = self._get_template_regex(index).match(reversed_name)
+            if match is not None:
+                yield self._get_path(templates[index], name, match.end())
+
+    def _get_path(self, template: RegexTemplate, name: str, end: int) -> Path:
+        pattern, path, parser = template
+        variables: Dict[str, str] = {}
+        if parser is not None:
+            result = parser.parse(name[len(name) - end :])
+            assert result is not None
+            variables = result.named
+        return Path(path, TemplateResult(pattern, variables))
+
+    def _get_template_regex(self, index: int) -> Pattern[str]:
+        try:
+            return self.regexes[index]
+        except KeyError:
+            pass
+        regex = self.regexes[index] = re.compile(self.expressions[index])
+        return regex
+
+    def _get_reversed_expression(self, template: RegexTemplate) -> str:
+        pattern, _, parser = template
+        if parser is None:
+            return re.escape(pattern[::-1])
+        parts: List[str] = []
+        position = 0
+        for variable in VARIABLE_PATTERN.finditer(pattern):
+            parts.append(re.escape(pattern[position : variable.start()][::-1]))
+            parts.append(PathParser._PARAM_PATTERN)
+            position = variable.end()
+        parts.append(re.escape(pattern[position:][::-1]))
+        return "".join(reversed(parts))
+
+    def _build(self, paths: SchemaPath) -> List[RegexTemplate]:
+        templates: List[RegexTemplate] = []
+        for index, (pattern, path) in enumerate(paths.str_items()):
+            if self.method is not None and self.method not in path:
+                continue
+            if is_literal(pattern):
+                self.literals.add(index, pattern, path)
+                continue
+            self.filter.add(pattern)
+            parser: Optional[PathParser] = None
+            if "{" in pattern:
+                try:
+                    parser = PathParser(pattern)
+                # not a valid template; only exact match is possible
+                except ValueError:
+                    pass
+            templates.append((pattern, path, parser))
+        # Fewer variables -> more concrete path
+        return sorted(templates, key=self._get_variables_count)
+
+    def _get_variables_count(self, template: RegexTemplate) -> int:
+        pattern, _, parser = template
+        if parser is None:
+            return 0
+        return len(set(VARIABLE_PATTERN.findall(pattern)))
+
+
+class ServerMatcher:
+    """Server URL compiled against the base URL."""
+
+    def __init__(self, server: SchemaPath, base_url: Optional[str] = None):
+        self.server = server
+        self.url: str = (server / "url").read_str()
+        url = self.url
+        # if no base url check only path part
+        self.path_only = False
+        if not is_absolute(url):
+            # relative to absolute url
+            if base_url is not None:
+                url = urljoin(base_url, url)
+            else:
+                self.path_only = True
+        if url.endswith("/"):
+            url = url[:-1]
+        self.exact_url = url
+        self.parser: Optional[PathParser] = None
+        if "{" in self.url:
+            try:
+                self.parser = PathParser(self.url, pre_expression="^")
+            # not a valid template; only exact match is possible
+            except ValueError:
+                pass
+
+    def match(self, server_url_pattern: str) -> Iterator[TemplateResult]:
+        if self.path_only:
+            server_url_pattern = urlparse(server_url_pattern).path
+        # simple path
+        if server_url_pattern == self.exact_url:
+            yield TemplateResult(self.url, {})
+            return
+        # template path
+        # servers should'n end with tailing slash
+        # but let's search for this too
+        for pattern in (server_url_pattern, server_url_pattern + "/"):
+            if self.parser is None:
+                if pattern == self.url:
+                    yield TemplateResult(self.url, {})
+                continue
+            result = self.parser.parse(pattern)
+            if result:
+                yield TemplateResult(self.url, result.named)
+
+
+class ServersRouter:
+    """Servers iterator backed by a table of compiled server matchers.
+
+    The effective servers of every path and operation pair are resolved
+    once per spec, so a lookup only compares the URL part preceding
+    the matched path with the precompiled server URLs.
+    """
+
+    def __init__(
+        self,
+        spec: SchemaPath,
+        paths_part: str,
+        base_url: Optional[str] = None,
+    ):
+        self.spec = spec
+        self.base_url = base_url
+        self.default_matchers = [
+            ServerMatcher(SchemaPath.from_dict({"url": "/"}), base_url)
+        ]
+        self.matchers: Dict[Tuple[object, ...], List[ServerMatcher]] = {}
+        paths = spec / paths_part
+        if paths.exists():
+            self.matchers = self._build(paths)
+
+    def __call__(
+        self,
+        name: str,
+        operations_iter: Iterator[PathOperation],
+        spec: SchemaPath,
+        base_url: Optional[str] = None,
+    ) -> Iterator[PathOperationServer]:
+        for path, operation, path_result in operations_iter:
+            server_url_pattern = name.rsplit(path_result.resolved, 1)[0]
+            for matcher in self._get_matchers(path, operation):
+                for server_result in matcher.match(server_url_pattern):
+                    yield PathOperationServer(
+                        path,
+                        operation,
+                        matcher.server,
+                        path_result,
+                        server_result,
+                    )
+
+    def _get_matchers(
+        self, path: SchemaPath, operation: SchemaPath
+    ) -> List[ServerMatcher]:
+        try:
+            return self.matchers[operation.parts]
+        except KeyError:
+            matchers = self._compile(path, operation)
+            self.matchers[operation.parts] = matchers
+            return matchers
+
+    def _build(
+        self, paths: SchemaPath
+    ) -> Dict[Tuple[object, ...], List[ServerMatcher]]:
+        matchers: Dict[Tuple[object, ...], List[ServerMatcher]] = {}
+        for _, path in paths.str_items():
+            for method, operation in iter_operations(path):
+                matchers[operation.parts] = self._compile(path, operation)
+        return matchers
+
+    def _compile(
+        self, path: SchemaPath, operation: SchemaPath
+    ) -> List[ServerMatcher]:
+        servers = (
+            path.get("servers", None)
+            or operation.get("servers", None)
+            or self.spec.get("servers", None)
+        )
+        if not servers:
+            return self.default_matchers
+        return [ServerMatcher(server, self.base_url) for server in servers]
@@ -19,7 +19,16 @@ class UnmarshallerConfig(ValidatorConfig):
             Schema unmarshallers factory.
         extra_format_unmarshallers
             Extra format unmarshallers.
+        compile_schema_unmarshallers
+            Compile schemas into unmarshal plans reused between values.
+        trusted_unmarshalling
+            Don't validate values again while unmarshalling them.
+        lazy_unmarshalling
+            Unmarshal objects properties and arrays items on first access.
     """
 
     schema_unmarshallers_factory: Optional[SchemaUnmarshallersFactory] = None
     extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None
+    compile_schema_unmarshallers: bool = False
+    trusted_unmarshalling: bool = False
+    lazy_unmarshalling: bool = False
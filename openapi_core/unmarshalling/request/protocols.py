@@ -61,6 +61,14 @@ class RequestUnmarshaller(Protocol):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
+        compile_schema_unmarshallers: bool = False,
+        trusted_unmarshalling: bool = False,
+        lazy_unmarshalling: bool = False,
     ): ...
 
     def unmarshal(
@@ -97,6 +105,14 @@ class WebhookRequestUnmarshaller(Protocol):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
+        compile_schema_unmarshallers: bool = False,
+        trusted_unmarshalling: bool = False,
+        lazy_unmarshalling: bool = False,
     ): ...
 
     def unmarshal(
@@ -126,6 +126,14 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
+        compile_schema_unmarshallers: bool = False,
+        trusted_unmarshalling: bool = False,
+        lazy_unmarshalling: bool = False,
     ):
         BaseUnmarshaller.__init__(
             self,
@@ -144,6 +152,14 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
             schema_unmarshallers_factory=schema_unmarshallers_factory,
             format_unmarshallers=format_unmarshallers,
             extra_format_unmarshallers=extra_format_unmarshallers,
+            path_finder_cache_maxsize=path_finder_cache_maxsize,
+            path_finder_cache_ttl=path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=path_finder_negative_cache_maxsize,
+            compile_schema_validators=compile_schema_validators,
+            first_schema_error_only=first_schema_error_only,
+            compile_schema_unmarshallers=compile_schema_unmarshallers,
+            trusted_unmarshalling=trusted_unmarshalling,
+            lazy_unmarshalling=lazy_unmarshalling,
         )
         BaseRequestValidator.__init__(
             self,
@@ -160,6 +176,11 @@ class BaseRequestUnmarshaller(BaseRequestValidator, BaseUnmarshaller):
             extra_media_type_deserializers=extra_media_type_deserializers,
             security_provider_factory=security_provider_factory,
             forbid_unspecified_additional_properties=forbid_unspecified_additional_properties,
+            path_finder_cache_maxsize=path_finder_cache_maxsize,
+            path_finder_cache_ttl=path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=path_finder_negative_cache_maxsize,
+            compile_schema_validators=compile_schema_validators,
+            first_schema_error_only=first_schema_error_only,
         )
 
     def _unmarshal(
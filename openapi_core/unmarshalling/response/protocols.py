@@ -62,6 +62,14 @@ class ResponseUnmarshaller(Protocol):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
+        compile_schema_unmarshallers: bool = False,
+        trusted_unmarshalling: bool = False,
+        lazy_unmarshalling: bool = False,
     ): ...
 
     def unmarshal(
@@ -99,6 +107,14 @@ class WebhookResponseUnmarshaller(Protocol):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
+        compile_schema_unmarshallers: bool = False,
+        trusted_unmarshalling: bool = False,
+        lazy_unmarshalling: bool = False,
     ): ...
 
     def unmarshal(
@@ -1,6 +1,12 @@
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import List
 
 FormatUnmarshaller = Callable[[Any], Any]
 FormatUnmarshallersDict = Dict[str, FormatUnmarshaller]
+# unmarshals a value with the schema resolved up front
+Plan = Callable[[Any], Any]
+# unmarshals valid values of one schema in one pass
+BatchUnmarshaller = Callable[[Iterable[Any]], List[Any]]
@@ -1,14 +1,23 @@
 import warnings
+from typing import Any
+from typing import Hashable
 from typing import Optional
+from typing import Tuple
 
 from jsonschema_path import SchemaPath
 
+from openapi_core.caches import LRUCache
 from openapi_core.unmarshalling.schemas.datatypes import (
     FormatUnmarshallersDict,
 )
+from openapi_core.unmarshalling.schemas.datatypes import Plan
 from openapi_core.unmarshalling.schemas.exceptions import (
     FormatterNotFoundError,
 )
+from openapi_core.unmarshalling.schemas.plans import UnmarshalPlanCompiler
+from openapi_core.unmarshalling.schemas.unmarshallers import (
+    CompiledSchemaUnmarshaller,
+)
 from openapi_core.unmarshalling.schemas.unmarshallers import (
     FormatsUnmarshaller,
 )
@@ -24,12 +33,23 @@ class SchemaUnmarshallersFactory:
         schema_validators_factory: SchemaValidatorsFactory,
         types_unmarshaller: TypesUnmarshaller,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        cache_maxsize: int = 1024,
     ):
         self.schema_validators_factory = schema_validators_factory
         self.types_unmarshaller = types_unmarshaller
         if format_unmarshallers is None:
             format_unmarshallers = {}
         self.format_unmarshallers = format_unmarshallers
+        self.plans: Optional[
+            LRUCache[Hashable, Tuple[Tuple[Any, ...], Plan]]
+        ] = None
+        if cache_maxsize:
+            self.plans = LRUCache(cache_maxsize)
+
+    def reserve(self, size: int) -> None:
+        """Make room for `size` more plans in the cache."""
+        if self.plans is not None:
+            self.plans.reserve(size)
 
     def create(
         self,
@@ -41,8 +61,20 @@ class SchemaUnmarshallersFactory:
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         forbid_unspecified_additional_properties: bool = False,
         enforce_properties_required: bool = False,
+        compiled: bool = False,
+        first_error_only: bool = False,
+        compiled_plan: bool = False,
+        trusted: bool = False,
+        lazy: bool = False,
     ) -> SchemaUnmarshaller:
-        """Create unmarshaller from the schema."""
+        """Create unmarshaller from the schema.
+
+        Trusted unmarshallers expect values already validated against the
+        schema and don't validate them, nor their nested values, again.
+
+        Lazy unmarshallers unmarshal objects properties and arrays items on
+        first access.
+        """
         if schema is None:
             raise TypeError("Invalid schema")
 
@@ -58,6 +90,8 @@ class SchemaUnmarshallersFactory:
             extra_format_validators=extra_format_validators,
             forbid_unspecified_additional_properties=forbid_unspecified_additional_properties,
             enforce_properties_required=enforce_properties_required,
+            compiled=compiled,
+            first_error_only=first_error_only,
         )
 
         schema_format = (schema / "format").read_str(None)
@@ -76,9 +110,80 @@ class SchemaUnmarshallersFactory:
         ):
             raise FormatterNotFoundError(schema_format)
 
-        return SchemaUnmarshaller(
+        schema_unmarshaller = SchemaUnmarshaller(
             schema,
             schema_validator,
             self.types_unmarshaller,
             formats_unmarshaller,
+            trusted=trusted,
+            lazy=lazy,
+        )
+        if not compiled_plan:
+            return schema_unmarshaller
+
+        validator_key = self.schema_validators_factory.get_cache_key(
+            spec,
+            schema,
+            format_validators,
+            extra_format_validators,
+            forbid_unspecified_additional_properties,
+            enforce_properties_required,
+            compiled=compiled,
+            first_error_only=first_error_only,
         )
+        return CompiledSchemaUnmarshaller(
+            schema,
+            schema_validator,
+            self.types_unmarshaller,
+            formats_unmarshaller,
+            self.get_plan(spec, schema_unmarshaller, validator_key),
+            trusted=trusted,
+            lazy=lazy,
+        )
+
+    def get_plan(
+        self,
+        spec: SchemaPath,
+        schema_unmarshaller: SchemaUnmarshaller,
+        validator_key: Optional[Hashable] = None,
+    ) -> Plan:
+        """Get unmarshal plan of the schema unmarshaller.
+
+        Plans are compiled once per schema validators key, format
+        unmarshallers, trust and laziness. Plans of validators without
+        a key are compiled every time.
+        """
+        if self.plans is None or validator_key is None:
+            return self._compile_plan(schema_unmarshaller)
+
+        formats_unmarshaller = schema_unmarshaller.formats_unmarshaller
+        key = (
+            validator_key,
+            schema_unmarshaller.trusted,
+            schema_unmarshaller.lazy,
+            tuple(formats_unmarshaller.format_unmarshallers.items()),
+            tuple(formats_unmarshaller.extra_format_unmarshallers.items()),
+        )
+        try:
+            hash(key)
+        # unhashable format unmarshallers
+        except TypeError:
+            return self._compile_plan(schema_unmarshaller)
+
+        cached = self.plans.get(key)
+        if cached is not None:
+            return cached[1]
+        plan = self._compile_plan(schema_unmarshaller)
+        # keep the accessors alive so their ids in the key can't be reused
+        self.plans.set(
+            key,
+            (
+                (spec.accessor, schema_unmarshaller.schema.accessor),
+                plan,
+            ),
+        )
+        return plan
+
+    def _compile_plan(self, schema_unmarshaller: SchemaUnmarshaller) -> Plan:
+        compiler = UnmarshalPlanCompiler(schema_unmarshaller)
+        return compiler.compile()
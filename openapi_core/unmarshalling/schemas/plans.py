@@ -0,0 +1,278 @@
+"""OpenAPI core unmarshalling schemas plans module"""
+
+from functools import partial
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+from jsonschema_path import SchemaPath
+
+from openapi_core.extensions.models.factories import ModelPathFactory
+from openapi_core.schema.schemas import get_properties
+from openapi_core.unmarshalling.schemas.datatypes import FormatUnmarshaller
+from openapi_core.unmarshalling.schemas.datatypes import Plan
+from openapi_core.unmarshalling.schemas.proxies import ArrayProxy
+from openapi_core.unmarshalling.schemas.proxies import ObjectProxy
+from openapi_core.unmarshalling.schemas.unmarshallers import (
+    COMPOSITION_KEYWORDS,
+)
+from openapi_core.unmarshalling.schemas.unmarshallers import ArrayUnmarshaller
+from openapi_core.unmarshalling.schemas.unmarshallers import ObjectUnmarshaller
+from openapi_core.unmarshalling.schemas.unmarshallers import (
+    PrimitiveUnmarshaller,
+)
+from openapi_core.unmarshalling.schemas.unmarshallers import SchemaUnmarshaller
+
+# property name, property plan, whether the property has a default, default
+PropertyPlan = Tuple[str, Plan, bool, Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class UnmarshalPlanCompiler:
+    """Compiles a schema unmarshaller into an unmarshal plan.
+
+    A plan is a tree of closures with the schema type dispatch, format
+    unmarshaller and properties table resolved up front, so unmarshalling
+    a value doesn't read the schema again. Subschemas whose unmarshalling
+    depends on the value, such as composed or multi-type schemas, are
+    unmarshalled by their schema unmarshaller.
+    """
+
+    def __init__(self, schema_unmarshaller: SchemaUnmarshaller):
+        self.schema_unmarshaller = schema_unmarshaller
+        self.types_unmarshaller = schema_unmarshaller.types_unmarshaller
+        self.formats_unmarshaller = schema_unmarshaller.formats_unmarshaller
+        # schema contents id -> plan
+        self._plans: Dict[int, Plan] = {}
+
+    def compile(self) -> Plan:
+        return self._compile(self.schema_unmarshaller)
+
+    def _compile(self, unmarshaller: SchemaUnmarshaller) -> Plan:
+        with unmarshaller.schema.resolve() as resolved:
+            contents = resolved.contents
+        key = id(contents)
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+
+        # recursive schemas refer to the plan being compiled
+        compiled: List[Plan] = []
+        self._plans[key] = lambda value: compiled[0](value)
+        plan = self._compile_schema(unmarshaller, contents)
+        compiled.append(plan)
+        self._plans[key] = plan
+        return plan
+
+    def _compile_schema(
+        self, unmarshaller: SchemaUnmarshaller, contents: Any
+    ) -> Plan:
+        if not isinstance(contents, Mapping) or any(
+            keyword in contents for keyword in COMPOSITION_KEYWORDS
+        ):
+            return unmarshaller.unmarshal
+        schema_type = contents.get("type")
+        nullable = contents.get("nullable", False)
+        if not isinstance(schema_type, str) or not isinstance(nullable, bool):
+            return unmarshaller.unmarshal
+        unmarshaller_cls = self.types_unmarshaller.unmarshallers.get(
+            schema_type
+        )
+
+        if unmarshaller_cls is PrimitiveUnmarshaller:
+            return self._compile_primitive(unmarshaller, schema_type, contents)
+
+        typed_plan: Optional[Plan] = None
+        if unmarshaller_cls is ArrayUnmarshaller:
+            typed_plan = self._compile_array(unmarshaller)
+        elif unmarshaller_cls is ObjectUnmarshaller:
+            typed_plan = self._compile_object(unmarshaller, contents)
+        if typed_plan is None:
+            return unmarshaller.unmarshal
+
+        if unmarshaller.trusted:
+            if not nullable:
+                return typed_plan
+            nullable_plan = typed_plan
+
+            def trusted_plan(value: Any) -> Any:
+                if value is None:
+                    return value
+                return nullable_plan(value)
+
+            return trusted_plan
+
+        validate = unmarshaller.schema_validator.validate
+
+        def plan(value: Any) -> Any:
+            validate(value)
+            # skip unmarshalling for nullable in OpenAPI 3.0
+            if value is None and nullable:
+                return value
+            return typed_plan(value)
+
+        return plan
+
+    def _compile_primitive(
+        self,
+        unmarshaller: SchemaUnmarshaller,
+        schema_type: str,
+        contents: Mapping[str, Any],
+    ) -> Plan:
+        validate = self._get_validate(unmarshaller)
+        format_unmarshaller = None
+        # formats apply to strings only
+        if schema_type == "string":
+            format_unmarshaller = self._get_format_unmarshaller(contents)
+
+        if format_unmarshaller is None:
+            if unmarshaller.trusted:
+                return _identity
+
+            def primitive_plan(value: Any) -> Any:
+                validate(value)
+                return value
+
+            return primitive_plan
+
+        binary = contents["format"] in ["binary", "byte"]
+
+        def format_plan(value: Any) -> Any:
+            validate(value)
+            # ignore incompatible formats
+            if not (
+                isinstance(value, str)
+                # Workaround allows bytes for binary and byte formats
+                or (binary and isinstance(value, bytes))
+            ):
+                return value
+            try:
+                return format_unmarshaller(value)
+            except (AttributeError, ValueError, TypeError):
+                return value
+
+        return format_plan
+
+    def _get_validate(self, unmarshaller: SchemaUnmarshaller) -> Plan:
+        if unmarshaller.trusted:
+            return _identity
+        return unmarshaller.schema_validator.validate
+
+    def _get_format_unmarshaller(
+        self, contents: Mapping[str, Any]
+    ) -> Optional[FormatUnmarshaller]:
+        schema_format = contents.get("format")
+        if not isinstance(schema_format, str):
+            return None
+        return self.formats_unmarshaller.get_unmarshaller(schema_format)
+
+    def _compile_array(
+        self, unmarshaller: SchemaUnmarshaller
+    ) -> Optional[Plan]:
+        # sometimes we don't have any schema i.e. free-form objects
+        items_schema = unmarshaller.schema.get(
+            "items", SchemaPath.from_dict({})
+        )
+        if not isinstance(items_schema, SchemaPath):
+            return None
+        items_unmarshaller = unmarshaller.evolve(items_schema)
+        items_plan = self._compile(items_unmarshaller)
+
+        if unmarshaller.lazy:
+            return partial(ArrayProxy, items_plan)
+
+        # array validation covers its items
+        batch_unmarshaller = items_unmarshaller.get_batch_unmarshaller()
+        if batch_unmarshaller is not None:
+            return batch_unmarshaller
+
+        def array_plan(value: Any) -> Any:
+            return [items_plan(item) for item in value]
+
+        return array_plan
+
+    def _compile_object(
+        self, unmarshaller: SchemaUnmarshaller, contents: Mapping[str, Any]
+    ) -> Optional[Plan]:
+        schema = unmarshaller.schema
+        properties: List[PropertyPlan] = []
+        for prop_name, prop_schema in get_properties(schema).items():
+            prop_plan = self._compile(unmarshaller.evolve(prop_schema))
+            has_default = "default" in prop_schema
+            default = None
+            if has_default:
+                default = (prop_schema / "default").read_value()
+            properties.append((prop_name, prop_plan, has_default, default))
+
+        additional_properties = schema.get("additionalProperties", True)
+        additional_plan: Optional[Plan] = None
+        if additional_properties is True:
+            # free-form object
+            additional_plan = self._compile(
+                unmarshaller.evolve(SchemaPath.from_dict({"nullable": True}))
+            )
+        elif isinstance(additional_properties, SchemaPath):
+            # defined schema
+            additional_plan = self._compile(
+                unmarshaller.evolve(additional_properties)
+            )
+        elif additional_properties is not False:
+            return None
+
+        model = "x-model" in contents or "x-model-path" in contents
+        model_factory = ModelPathFactory()
+
+        def lazy_object_plan(value: Any) -> Any:
+            unmarshallers = {}
+            for prop_name, prop_plan, has_default, default in properties:
+                try:
+                    prop_value = value[prop_name]
+                except KeyError:
+                    if not has_default:
+                        continue
+                    prop_value = default
+                unmarshallers[prop_name] = (prop_plan, prop_value)
+
+            if additional_plan is not None:
+                for prop_name, prop_value in value.items():
+                    if prop_name in unmarshallers:
+                        continue
+                    unmarshallers[prop_name] = (additional_plan, prop_value)
+
+            return ObjectProxy(unmarshallers)
+
+        if unmarshaller.lazy and not model:
+            return lazy_object_plan
+
+        def object_plan(value: Any) -> Any:
+            result = {}
+            for prop_name, prop_plan, has_default, default in properties:
+                try:
+                    prop_value = value[prop_name]
+                except KeyError:
+                    if not has_default:
+                        continue
+                    prop_value = default
+                result[prop_name] = prop_plan(prop_value)
+
+            if additional_plan is not None:
+                for prop_name, prop_value in value.items():
+                    if prop_name in result:
+                        continue
+                    result[prop_name] = additional_plan(prop_value)
+
+            if not model:
+                return result
+            fields: Iterable[str] = result and result.keys() or []
+            object_class = model_factory.create(schema, fields)
+            return object_class(**result)
+
+        return object_plan
@@ -0,0 +1,90 @@
+"""OpenAPI core unmarshalling schemas proxies module"""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+from typing import overload
+
+# unmarshals raw value
+Unmarshal = Callable[[Any], Any]
+
+_missing = object()
+
+
+class ObjectProxy(Mapping[str, Any]):
+    """Object unmarshalling its properties on first access.
+
+    Properties are unmarshalled at most once, then memoized.
+    """
+
+    def __init__(self, properties: Mapping[str, Tuple[Unmarshal, Any]]):
+        # property name -> unmarshal and raw value
+        self._properties = properties
+        self._unmarshalled: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._unmarshalled[name]
+        except KeyError:
+            pass
+        unmarshal, value = self._properties[name]
+        unmarshalled = self._unmarshalled[name] = unmarshal(value)
+        return unmarshalled
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._properties)
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._properties
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+
+class ArrayProxy(Sequence[Any]):
+    """Array unmarshalling its items on first access.
+
+    Items are unmarshalled at most once, then memoized.
+    """
+
+    def __init__(self, unmarshal: Unmarshal, items: Sequence[Any]):
+        self._unmarshal = unmarshal
+        self._items = items
+        self._unmarshalled: List[Any] = [_missing] * len(items)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        unmarshalled = self._unmarshalled[index]
+        if unmarshalled is _missing:
+            unmarshalled = self._unmarshal(self._items[index])
+            self._unmarshalled[index] = unmarshalled
+        return unmarshalled
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArrayProxy):
+            other = list(other)
+        return list(self) == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
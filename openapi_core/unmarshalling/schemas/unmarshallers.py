@@ -1,9 +1,12 @@
 import logging
 from typing import Any
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -11,14 +14,22 @@ from jsonschema_path import SchemaPath
 
 from openapi_core.extensions.models.factories import ModelPathFactory
 from openapi_core.schema.schemas import get_properties
+from openapi_core.unmarshalling.schemas.datatypes import BatchUnmarshaller
 from openapi_core.unmarshalling.schemas.datatypes import FormatUnmarshaller
 from openapi_core.unmarshalling.schemas.datatypes import (
     FormatUnmarshallersDict,
 )
+from openapi_core.unmarshalling.schemas.datatypes import Plan
+from openapi_core.unmarshalling.schemas.proxies import ArrayProxy
+from openapi_core.unmarshalling.schemas.proxies import ObjectProxy
+from openapi_core.unmarshalling.schemas.proxies import Unmarshal
+from openapi_core.validation.schemas.datatypes import ComposedSchemas
 from openapi_core.validation.schemas.validators import SchemaValidator
 
 log = logging.getLogger(__name__)
 
+COMPOSITION_KEYWORDS = ("oneOf", "anyOf", "allOf")
+
 
 class PrimitiveUnmarshaller:
     def __init__(
@@ -26,18 +37,28 @@ class PrimitiveUnmarshaller:
         schema: SchemaPath,
         schema_validator: SchemaValidator,
         schema_unmarshaller: "SchemaUnmarshaller",
+        composed_schemas: Optional[ComposedSchemas] = None,
     ) -> None:
         self.schema = schema
         self.schema_validator = schema_validator
         self.schema_unmarshaller = schema_unmarshaller
+        # composed schemas matched by the value to unmarshal, if known
+        self.composed_schemas = composed_schemas
 
     def __call__(self, value: Any) -> Any:
         return value
 
 
 class ArrayUnmarshaller(PrimitiveUnmarshaller):
-    def __call__(self, value: Any) -> Optional[List[Any]]:
-        return list(map(self.items_unmarshaller.unmarshal, value))
+    def __call__(self, value: Any) -> Optional[Sequence[Any]]:
+        items_unmarshaller = self.items_unmarshaller
+        if self.schema_unmarshaller.lazy:
+            return ArrayProxy(items_unmarshaller.unmarshal, value)
+        # array validation covers its items
+        batch_unmarshaller = items_unmarshaller.get_batch_unmarshaller()
+        if batch_unmarshaller is not None:
+            return batch_unmarshaller(value)
+        return list(map(items_unmarshaller.unmarshal, value))
 
     @property
     def items_unmarshaller(self) -> "SchemaUnmarshaller":
@@ -48,11 +69,17 @@ class ArrayUnmarshaller(PrimitiveUnmarshaller):
 
 class ObjectUnmarshaller(PrimitiveUnmarshaller):
     def __call__(self, value: Any) -> Any:
-        properties = self._unmarshal_properties(value)
+        unmarshallers = self._get_properties_unmarshallers(value)
 
-        fields: Iterable[str] = properties and properties.keys() or []
+        fields: Iterable[str] = unmarshallers and unmarshallers.keys() or []
         object_class = self.object_class_factory.create(self.schema, fields)
+        if self.schema_unmarshaller.lazy and object_class is dict:
+            return ObjectProxy(unmarshallers)
 
+        properties = {
+            prop_name: unmarshal(prop_value)
+            for prop_name, (unmarshal, prop_value) in unmarshallers.items()
+        }
         return object_class(**properties)
 
     @property
@@ -68,30 +95,35 @@ class ObjectUnmarshaller(PrimitiveUnmarshaller):
             self.schema_unmarshaller,
         )
 
-    def _unmarshal_properties(
+    def _get_properties_unmarshallers(
         self, value: Any, schema_only: bool = False
-    ) -> Any:
-        properties = {}
+    ) -> Dict[str, Tuple[Unmarshal, Any]]:
+        # property name -> unmarshal and raw value
+        properties: Dict[str, Tuple[Unmarshal, Any]] = {}
+
+        composed_schemas = self.composed_schemas
+        if composed_schemas is None:
+            composed_schemas = self.schema_validator.get_composed_schemas(
+                value
+            )
 
-        one_of_schema = self.schema_validator.get_one_of_schema(value)
+        one_of_schema = composed_schemas.one_of
         if one_of_schema is not None:
             one_of_properties = self.evolve(
                 one_of_schema
-            )._unmarshal_properties(value, schema_only=True)
+            )._get_properties_unmarshallers(value, schema_only=True)
             properties.update(one_of_properties)
 
-        any_of_schemas = self.schema_validator.iter_any_of_schemas(value)
-        for any_of_schema in any_of_schemas:
+        for any_of_schema in composed_schemas.any_of:
             any_of_properties = self.evolve(
                 any_of_schema
-            )._unmarshal_properties(value, schema_only=True)
+            )._get_properties_unmarshallers(value, schema_only=True)
             properties.update(any_of_properties)
 
-        all_of_schemas = self.schema_validator.iter_all_of_schemas(value)
-        for all_of_schema in all_of_schemas:
+        for all_of_schema in composed_schemas.all_of:
             all_of_properties = self.evolve(
                 all_of_schema
-            )._unmarshal_properties(value, schema_only=True)
+            )._get_properties_unmarshallers(value, schema_only=True)
             properties.update(all_of_properties)
 
         for prop_name, prop_schema in get_properties(self.schema).items():
@@ -102,9 +134,10 @@ class ObjectUnmarshaller(PrimitiveUnmarshaller):
                     continue
                 prop_value = (prop_schema / "default").read_value()
 
-            properties[prop_name] = self.schema_unmarshaller.evolve(
-                prop_schema
-            ).unmarshal(prop_value)
+            properties[prop_name] = (
+                self.schema_unmarshaller.evolve(prop_schema).unmarshal,
+                prop_value,
+            )
 
         if schema_only:
             return properties
@@ -125,8 +158,9 @@ class ObjectUnmarshaller(PrimitiveUnmarshaller):
             for prop_name, prop_value in value.items():
                 if prop_name in properties:
                     continue
-                properties[prop_name] = additional_prop_unmarshaler.unmarshal(
-                    prop_value
+                properties[prop_name] = (
+                    additional_prop_unmarshaler.unmarshal,
+                    prop_value,
                 )
 
         return properties
@@ -139,7 +173,7 @@ class MultiTypeUnmarshaller(PrimitiveUnmarshaller):
         if primitive_type is None:
             return None
         unmarshaller = self.schema_unmarshaller.get_type_unmarshaller(
-            primitive_type
+            primitive_type, composed_schemas=self.composed_schemas
         )
         return unmarshaller(value)
 
@@ -231,15 +265,22 @@ class SchemaUnmarshaller:
         schema_validator: SchemaValidator,
         types_unmarshaller: TypesUnmarshaller,
         formats_unmarshaller: FormatsUnmarshaller,
+        trusted: bool = False,
+        lazy: bool = False,
     ):
         self.schema = schema
         self.schema_validator = schema_validator
 
         self.types_unmarshaller = types_unmarshaller
         self.formats_unmarshaller = formats_unmarshaller
+        # values are validated by the caller, don't validate them again
+        self.trusted = trusted
+        # unmarshal objects and arrays contents on first access
+        self.lazy = lazy
 
     def unmarshal(self, value: Any) -> Any:
-        self.schema_validator.validate(value)
+        if not self.trusted:
+            self.schema_validator.validate(value)
 
         # skip unmarshalling for nullable in OpenAPI 3.0
         if value is None and (self.schema / "nullable").read_bool(
@@ -247,22 +288,25 @@ class SchemaUnmarshaller:
         ):
             return value
 
+        # composed schemas are matched on demand, by object unmarshallers
+        # and by the format lookup of strings only
         schema_type = (self.schema / "type").read_str_or_list(None)
         type_unmarshaller = self.get_type_unmarshaller(schema_type)
         typed = type_unmarshaller(value)
         # skip finding format for None
         if typed is None:
             return None
+        # ignore incompatible formats
+        if not isinstance(value, (str, bytes)):
+            return typed
         schema_format = self.find_format(value)
         if schema_format is None:
             return typed
-        # ignore incompatible formats
-        if not (
-            isinstance(value, str)
-            or
-            # Workaround allows bytes for binary and byte formats
-            (isinstance(value, bytes) and schema_format in ["binary", "byte"])
-        ):
+        # Workaround allows bytes for binary and byte formats
+        if isinstance(value, bytes) and schema_format not in [
+            "binary",
+            "byte",
+        ]:
             return typed
 
         format_unmarshaller = self.get_format_unmarshaller(schema_format)
@@ -276,12 +320,14 @@ class SchemaUnmarshaller:
     def get_type_unmarshaller(
         self,
         schema_type: Optional[Union[Iterable[str], str]],
+        composed_schemas: Optional[ComposedSchemas] = None,
     ) -> PrimitiveUnmarshaller:
         klass = self.types_unmarshaller.get_unmarshaller_cls(schema_type)
         return klass(
             self.schema,
             self.schema_validator,
             self,
+            composed_schemas=composed_schemas,
         )
 
     def get_format_unmarshaller(
@@ -290,6 +336,55 @@ class SchemaUnmarshaller:
     ) -> Optional[FormatUnmarshaller]:
         return self.formats_unmarshaller.get_unmarshaller(schema_format)
 
+    def get_batch_unmarshaller(self) -> Optional[BatchUnmarshaller]:
+        """Get unmarshaller of valid values batch.
+
+        Only primitive schemas, without composition, are unmarshalled in
+        batches. The format unmarshaller is resolved once per batch.
+        """
+        with self.schema.resolve() as resolved:
+            contents = resolved.contents
+        if not isinstance(contents, Mapping) or any(
+            keyword in contents for keyword in COMPOSITION_KEYWORDS
+        ):
+            return None
+        schema_type = contents.get("type")
+        if not isinstance(schema_type, str):
+            return None
+        unmarshaller_cls = self.types_unmarshaller.unmarshallers.get(
+            schema_type
+        )
+        if unmarshaller_cls is not PrimitiveUnmarshaller:
+            return None
+
+        schema_format = contents.get("format")
+        format_unmarshaller = None
+        # formats apply to strings only
+        if schema_type == "string" and isinstance(schema_format, str):
+            format_unmarshaller = self.get_format_unmarshaller(schema_format)
+        if format_unmarshaller is None:
+            return list
+
+        binary = schema_format in ["binary", "byte"]
+
+        def unmarshal_batch(values: Iterable[Any]) -> List[Any]:
+            result = []
+            for value in values:
+                # ignore incompatible formats
+                if isinstance(value, str) or (
+                    # Workaround allows bytes for binary and byte formats
+                    binary
+                    and isinstance(value, bytes)
+                ):
+                    try:
+                        value = format_unmarshaller(value)
+                    except (AttributeError, ValueError, TypeError):
+                        pass
+                result.append(value)
+            return result
+
+        return unmarshal_batch
+
     def evolve(self, schema: SchemaPath) -> "SchemaUnmarshaller":
         cls = self.__class__
 
@@ -298,10 +393,19 @@ class SchemaUnmarshaller:
             self.schema_validator.evolve(schema),
             self.types_unmarshaller,
             self.formats_unmarshaller,
+            trusted=self.trusted,
+            lazy=self.lazy,
         )
 
-    def find_format(self, value: Any) -> Optional[str]:
-        for schema in self.schema_validator.iter_valid_schemas(value):
+    def find_format(
+        self,
+        value: Any,
+        composed_schemas: Optional[ComposedSchemas] = None,
+    ) -> Optional[str]:
+        valid_schemas = self.schema_validator.iter_valid_schemas(
+            value, composed_schemas=composed_schemas
+        )
+        for schema in valid_schemas:
             schema_validator = self.schema_validator.evolve(schema)
             primitive_type = schema_validator.get_primitive_type(value)
             if primitive_type != "string":
@@ -309,3 +413,44 @@ class SchemaUnmarshaller:
             if "format" in schema:
                 return (schema / "format").read_str()
         return None
+
+
+class CompiledSchemaUnmarshaller(SchemaUnmarshaller):
+    """Schema unmarshaller running a compiled unmarshal plan.
+
+    The plan is compiled once per schema validator and reused, see
+    `SchemaUnmarshallersFactory`.
+    """
+
+    def __init__(
+        self,
+        schema: SchemaPath,
+        schema_validator: SchemaValidator,
+        types_unmarshaller: TypesUnmarshaller,
+        formats_unmarshaller: FormatsUnmarshaller,
+        plan: Plan,
+        trusted: bool = False,
+        lazy: bool = False,
+    ):
+        super().__init__(
+            schema,
+            schema_validator,
+            types_unmarshaller,
+            formats_unmarshaller,
+            trusted=trusted,
+            lazy=lazy,
+        )
+        self.plan = plan
+
+    def unmarshal(self, value: Any) -> Any:
+        return self.plan(value)
+
+    def evolve(self, schema: SchemaPath) -> SchemaUnmarshaller:
+        return SchemaUnmarshaller(
+            schema,
+            self.schema_validator.evolve(schema),
+            self.types_unmarshaller,
+            self.formats_unmarshaller,
+            trusted=self.trusted,
+            lazy=self.lazy,
+        )
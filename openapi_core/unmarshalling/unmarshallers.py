@@ -1,3 +1,4 @@
+import warnings
 from typing import Any
 from typing import Mapping
 from typing import Optional
@@ -23,6 +24,7 @@ from openapi_core.unmarshalling.schemas.datatypes import (
 from openapi_core.unmarshalling.schemas.factories import (
     SchemaUnmarshallersFactory,
 )
+from openapi_core.unmarshalling.schemas.unmarshallers import SchemaUnmarshaller
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
 from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
 from openapi_core.validation.validators import BaseValidator
@@ -57,6 +59,14 @@ class BaseUnmarshaller(BaseValidator):
         ] = None,
         format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
         extra_format_unmarshallers: Optional[FormatUnmarshallersDict] = None,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
+        compile_schema_unmarshallers: bool = False,
+        trusted_unmarshalling: bool = False,
+        lazy_unmarshalling: bool = False,
     ):
         if schema_validators_factory is None and schema_unmarshallers_factory:
             schema_validators_factory = (
@@ -77,6 +87,11 @@ class BaseUnmarshaller(BaseValidator):
             extra_media_type_deserializers=extra_media_type_deserializers,
             forbid_unspecified_additional_properties=forbid_unspecified_additional_properties,
             enforce_properties_required=enforce_properties_required,
+            path_finder_cache_maxsize=path_finder_cache_maxsize,
+            path_finder_cache_ttl=path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=path_finder_negative_cache_maxsize,
+            compile_schema_validators=compile_schema_validators,
+            first_schema_error_only=first_schema_error_only,
         )
         self.schema_unmarshallers_factory = (
             schema_unmarshallers_factory or self.schema_unmarshallers_factory
@@ -87,9 +102,14 @@ class BaseUnmarshaller(BaseValidator):
             )
         self.format_unmarshallers = format_unmarshallers
         self.extra_format_unmarshallers = extra_format_unmarshallers
+        self.compile_schema_unmarshallers = compile_schema_unmarshallers
+        self.trusted_unmarshalling = trusted_unmarshalling
+        self.lazy_unmarshalling = lazy_unmarshalling
 
-    def _unmarshal_schema(self, schema: SchemaPath, value: Any) -> Any:
-        unmarshaller = self.schema_unmarshallers_factory.create(
+    def _get_schema_unmarshaller(
+        self, schema: SchemaPath
+    ) -> SchemaUnmarshaller:
+        return self.schema_unmarshallers_factory.create(
             self.spec,
             schema,
             format_validators=self.format_validators,
@@ -98,9 +118,36 @@ class BaseUnmarshaller(BaseValidator):
             enforce_properties_required=self.enforce_properties_required,
             format_unmarshallers=self.format_unmarshallers,
             extra_format_unmarshallers=self.extra_format_unmarshallers,
+            compiled=self.compile_schema_validators,
+            first_error_only=self.first_schema_error_only,
+            compiled_plan=self.compile_schema_unmarshallers,
+            # values are validated before they are unmarshalled
+            trusted=self.trusted_unmarshalling,
+            lazy=self.lazy_unmarshalling,
         )
+
+    def _unmarshal_schema(self, schema: SchemaPath, value: Any) -> Any:
+        unmarshaller = self._get_schema_unmarshaller(schema)
         return unmarshaller.unmarshal(value)
 
+    def _reserve_precompile(self, count: int) -> None:
+        super()._reserve_precompile(count)
+        validators_factory = (
+            self.schema_unmarshallers_factory.schema_validators_factory
+        )
+        if validators_factory is not self.schema_validators_factory:
+            validators_factory.reserve(count)
+        if self.compile_schema_unmarshallers:
+            self.schema_unmarshallers_factory.reserve(count)
+
+    def _precompile_schema(self, schema: SchemaPath) -> None:
+        super()._precompile_schema(schema)
+        # deprecated schemas warn when they are used, not built
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            unmarshaller = self._get_schema_unmarshaller(schema)
+        unmarshaller.schema_validator.precompile()
+
     def _get_param_or_header_and_schema(
         self,
         param_or_header: SchemaPath,
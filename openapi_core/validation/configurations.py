@@ -51,6 +51,24 @@ class ValidatorConfig:
             If true, response schema properties are treated as required during
             response validation/unmarshalling, except properties marked as
             writeOnly.
+        path_finder_cache_maxsize
+            Maximum number of resolved operations cached per method and URL.
+            Zero disables the cache.
+        path_finder_cache_ttl
+            Time to live of cached resolved operations in seconds. None means
+            entries never expire.
+        path_finder_negative_cache_maxsize
+            Maximum number of unresolved method and URL pairs cached with
+            their path error, so repeated 404 and 405 lookups are rejected
+            right away. Entries share `path_finder_cache_ttl`. Zero disables
+            the cache.
+        compile_schema_validators
+            If true, schemas are compiled into specialized validation
+            functions. Valid values skip the jsonschema validator; invalid
+            ones are validated again by it to report the same errors.
+        first_schema_error_only
+            If true, schema validation stops at the first error, so invalid
+            values report a single schema error.
     """
 
     server_base_url: Optional[str] = None
@@ -74,3 +92,8 @@ class ValidatorConfig:
     response_properties_default_policy: Literal["optional", "required"] = (
         "optional"
     )
+    path_finder_cache_maxsize: int = 0
+    path_finder_cache_ttl: Optional[float] = None
+    path_finder_negative_cache_maxsize: int = 0
+    compile_schema_validators: bool = False
+    first_schema_error_only: bool = False
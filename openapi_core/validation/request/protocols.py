@@ -50,6 +50,11 @@ class RequestValidator(Protocol):
         ] = None,
         security_provider_factory: SecurityProviderFactory = security_provider_factory,
         forbid_unspecified_additional_properties: bool = False,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
     ): ...
 
     def iter_errors(
@@ -86,6 +91,11 @@ class WebhookRequestValidator(Protocol):
         ] = None,
         security_provider_factory: SecurityProviderFactory = security_provider_factory,
         forbid_unspecified_additional_properties: bool = False,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
     ): ...
 
     def iter_errors(
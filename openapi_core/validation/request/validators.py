@@ -30,6 +30,8 @@ from openapi_core.deserializing.styles.factories import (
 from openapi_core.protocols import BaseRequest
 from openapi_core.protocols import Request
 from openapi_core.protocols import WebhookRequest
+from openapi_core.schema.parameters import iter_param_or_header_schemas
+from openapi_core.schema.schemas import iter_content_schemas
 from openapi_core.security import security_provider_factory
 from openapi_core.security.exceptions import SecurityProviderError
 from openapi_core.security.factories import SecurityProviderFactory
@@ -87,6 +89,11 @@ class BaseRequestValidator(BaseValidator):
         ] = None,
         security_provider_factory: SecurityProviderFactory = security_provider_factory,
         forbid_unspecified_additional_properties: bool = False,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
     ):
 
         BaseValidator.__init__(
@@ -103,6 +110,11 @@ class BaseRequestValidator(BaseValidator):
             extra_format_validators=extra_format_validators,
             extra_media_type_deserializers=extra_media_type_deserializers,
             forbid_unspecified_additional_properties=forbid_unspecified_additional_properties,
+            path_finder_cache_maxsize=path_finder_cache_maxsize,
+            path_finder_cache_ttl=path_finder_cache_ttl,
+            path_finder_negative_cache_maxsize=path_finder_negative_cache_maxsize,
+            compile_schema_validators=compile_schema_validators,
+            first_schema_error_only=first_schema_error_only,
         )
         self.security_provider_factory = security_provider_factory
 
@@ -152,6 +164,15 @@ class BaseRequestValidator(BaseValidator):
         except SecurityValidationError as exc:
             yield exc
 
+    def _iter_precompile_schemas(self) -> Iterator[SchemaPath]:
+        for path, operation in self._iter_operations():
+            for parameters in (path, operation):
+                for param in parameters.get("parameters", ()):
+                    yield from iter_param_or_header_schemas(param)
+            if "requestBody" in operation:
+                content = operation / "requestBody" / "content"
+                yield from iter_content_schemas(content)
+
     def _get_parameters(
         self,
         parameters: RequestParameters,
@@ -49,6 +49,11 @@ class ResponseValidator(Protocol):
         ] = None,
         forbid_unspecified_additional_properties: bool = False,
         enforce_properties_required: bool = False,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
     ): ...
 
     def iter_errors(
@@ -87,6 +92,11 @@ class WebhookResponseValidator(Protocol):
         ] = None,
         forbid_unspecified_additional_properties: bool = False,
         enforce_properties_required: bool = False,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
     ): ...
 
     def iter_errors(
@@ -21,6 +21,8 @@ from openapi_core.protocols import HeadersType
 from openapi_core.protocols import Request
 from openapi_core.protocols import Response
 from openapi_core.protocols import WebhookRequest
+from openapi_core.schema.parameters import iter_param_or_header_schemas
+from openapi_core.schema.schemas import iter_content_schemas
 from openapi_core.templating.paths.exceptions import PathError
 from openapi_core.templating.responses.exceptions import ResponseFinderError
 from openapi_core.validation.decorators import ValidationErrorWrapper
@@ -112,6 +114,17 @@ class BaseResponseValidator(BaseValidator):
         except HeadersError as exc:
             yield from exc.context
 
+    def _iter_precompile_schemas(self) -> Iterator[SchemaPath]:
+        for _, operation in self._iter_operations():
+            if "responses" not in operation:
+                continue
+            for _, response in (operation / "responses").str_items():
+                if "content" in response:
+                    yield from iter_content_schemas(response / "content")
+                if "headers" in response:
+                    for _, header in (response / "headers").str_items():
+                        yield from iter_param_or_header_schemas(header)
+
     def _find_operation_response(
         self,
         status_code: int,
@@ -1,6 +1,8 @@
 from typing import Any
+from typing import Dict
 from typing import Iterator
 from typing import Mapping
+from typing import Tuple
 from typing import cast
 
 from jsonschema._utils import extras_msg
@@ -9,6 +11,41 @@ from jsonschema.exceptions import ValidationError
 from jsonschema.protocols import Validator
 from jsonschema.validators import extend
 
+_strict_validators: Dict[
+    Tuple[type[Validator], bool, bool], type[Validator]
+] = {}
+
+
+def build_strict_validator(
+    validator_class: type[Validator],
+    forbid_unspecified_additional_properties: bool = False,
+    enforce_properties_required: bool = False,
+) -> type[Validator]:
+    """Returns the validator class extended once per flag combination."""
+    key = (
+        validator_class,
+        forbid_unspecified_additional_properties,
+        enforce_properties_required,
+    )
+    try:
+        return _strict_validators[key]
+    except KeyError:
+        pass
+
+    strict_validator_class = validator_class
+    if enforce_properties_required:
+        strict_validator_class = build_enforce_properties_required_validator(
+            strict_validator_class
+        )
+    if forbid_unspecified_additional_properties:
+        strict_validator_class = (
+            build_forbid_unspecified_additional_properties_validator(
+                strict_validator_class
+            )
+        )
+    _strict_validators[key] = strict_validator_class
+    return strict_validator_class
+
 
 def build_forbid_unspecified_additional_properties_validator(
     validator_class: type[Validator],
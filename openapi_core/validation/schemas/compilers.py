@@ -0,0 +1,914 @@
+"""OpenAPI core validation schemas compilers module"""
+
+import re
+from threading import RLock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from typing import Tuple
+
+from jsonschema import Draft4Validator
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import UndefinedTypeCheck
+from jsonschema.protocols import Validator
+from openapi_schema_validator import OAS30ReadValidator
+from openapi_schema_validator import OAS30StrictValidator
+from openapi_schema_validator import OAS30Validator
+from openapi_schema_validator import OAS30WriteValidator
+from referencing.exceptions import Unresolvable
+
+try:
+    from regress import Regex as ECMARegex
+    from regress import RegressError
+except ImportError:
+    ECMARegex = None
+
+Check = Callable[[Any], bool]
+
+
+class Resolved(Protocol):
+    @property
+    def contents(self) -> Any: ...
+
+    @property
+    def resolver(self) -> "Resolver": ...
+
+
+class Resolver(Protocol):
+    """Resolver of references, such as `referencing` resolvers."""
+
+    def lookup(self, ref: str) -> Resolved: ...
+
+
+KeywordCompiler = Callable[
+    ["SchemaCompiler", Any, Mapping[str, Any], Resolver], Optional[Check]
+]
+
+
+class NotCompilable(Exception):
+    """Schema uses features the compiler does not support."""
+
+
+def _valid(instance: Any) -> bool:
+    return True
+
+
+def _invalid(instance: Any) -> bool:
+    return False
+
+
+def _unbool(value: Any, true: Any = object(), false: Any = object()) -> Any:
+    # booleans are not equal to numbers in JSON Schema
+    if value is True:
+        return true
+    if value is False:
+        return false
+    return value
+
+
+def equal(one: Any, two: Any) -> bool:
+    """Check JSON values equality the way JSON Schema `enum` does."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return bool(one == two)
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(
+            equal(each_one, each_two) for each_one, each_two in zip(one, two)
+        )
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(
+            key in two and equal(value, two[key]) for key, value in one.items()
+        )
+    return bool(_unbool(one) == _unbool(two))
+
+
+def _all(checks: List[Check]) -> Check:
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda instance: first(instance) and second(instance)
+    return lambda instance: all(check(instance) for check in checks)
+
+
+class SchemaCompiler:
+    """Compiles schemas into specialized validity check functions.
+
+    Every keyword is compiled according to the keyword function its
+    jsonschema validator class uses, so a compiled check accepts exactly
+    the instances `iter_errors` yields no errors for. Schemas with
+    keywords the compiler doesn't know raise `NotCompilable`, at compile
+    time or, for discriminator references resolved on demand, when the
+    check runs.
+    """
+
+    def __init__(self, validator: Validator):
+        self.validator = validator
+        self.validator_cls = validator.__class__
+        self.validators = validator.VALIDATORS
+        self.type_checker = validator.TYPE_CHECKER
+        self.format_checker = validator.format_checker
+        # schema id -> (schema, check); keeps schemas alive so ids are unique
+        self._checks: Dict[int, Tuple[Any, Check]] = {}
+        self._compiling: Dict[int, Any] = {}
+        self._lock = RLock()
+
+    def compile(self, schema: Any, resolver: Resolver) -> Check:
+        """Compile the resolved schema."""
+        with self._lock:
+            return self._compile(schema, resolver)
+
+    def compile_ref(self, ref: str, resolver: Resolver) -> Optional[Check]:
+        """Compile the referenced schema or `None` if it's unresolvable."""
+        try:
+            resolved = resolver.lookup(ref)
+        except Unresolvable:
+            return None
+        with self._lock:
+            return self._compile(resolved.contents, resolved.resolver)
+
+    def _compile(self, schema: Any, resolver: Resolver) -> Check:
+        if schema is True:
+            return _valid
+        if schema is False:
+            return _invalid
+        if not isinstance(schema, Mapping):
+            raise NotCompilable(f"Unsupported schema {schema!r}")
+
+        key = id(schema)
+        try:
+            return self._checks[key][1]
+        except KeyError:
+            pass
+        # recursive schema; resolve the check once it is compiled
+        if key in self._compiling:
+            checks = self._checks
+            return lambda instance: checks[key][1](instance)
+
+        self._compiling[key] = schema
+        try:
+            check = self._compile_schema(schema, resolver)
+        finally:
+            del self._compiling[key]
+        self._checks[key] = (schema, check)
+        return check
+
+    def _compile_schema(
+        self, schema: Mapping[str, Any], resolver: Resolver
+    ) -> Check:
+        for id_keyword in ("$id", "id"):
+            if isinstance(schema.get(id_keyword), str):
+                raise NotCompilable("Schema identifiers are not supported")
+
+        checks: List[Check] = []
+        for keyword, value in schema.items():
+            keyword_validator = self.validators.get(keyword)
+            if keyword_validator is None:
+                continue
+            try:
+                keyword_compiler = KEYWORD_COMPILERS[keyword_validator]
+            except (KeyError, TypeError):
+                raise NotCompilable(f"Unsupported keyword {keyword!r}")
+            check = keyword_compiler(self, value, schema, resolver)
+            if check is not None:
+                checks.append(check)
+        # whether $ref siblings apply depends on the JSON Schema draft
+        if "$ref" in schema and len(checks) > 1:
+            raise NotCompilable("Keywords next to $ref are not supported")
+        return _all(checks)
+
+    def _compile_ref(self, ref: str, resolver: Resolver) -> Check:
+        try:
+            resolved = resolver.lookup(ref)
+        except Unresolvable:
+            raise NotCompilable(f"Unresolvable reference {ref!r}")
+        return self._compile(resolved.contents, resolved.resolver)
+
+    def _compile_all(
+        self, schemas: Iterable[Any], resolver: Resolver
+    ) -> List[Check]:
+        return [self._compile(schema, resolver) for schema in schemas]
+
+    def _get_type_check(self, data_type: Any) -> Check:
+        if not isinstance(data_type, str):
+            raise NotCompilable(f"Unsupported type {data_type!r}")
+        type_checker = self.type_checker
+        try:
+            type_checker.is_type(None, data_type)
+        except UndefinedTypeCheck:
+            raise NotCompilable(f"Unknown type {data_type!r}")
+        return lambda instance: type_checker.is_type(instance, data_type)
+
+    def _is_object(self) -> Check:
+        return self._get_type_check("object")
+
+    def _is_array(self) -> Check:
+        return self._get_type_check("array")
+
+    def _is_string(self) -> Check:
+        return self._get_type_check("string")
+
+    def _is_number(self) -> Check:
+        return self._get_type_check("number")
+
+    def _is_boolean(self) -> Check:
+        return self._get_type_check("boolean")
+
+
+def compile_oas_type(
+    compiler: SchemaCompiler,
+    data_type: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+    strict: bool = False,
+) -> Check:
+    is_type = compiler._get_type_check(data_type)
+    nullable = schema.get("nullable") is True
+    binary = (
+        not strict
+        and data_type == "string"
+        and schema.get("format") == "binary"
+    )
+
+    def check(instance: Any) -> bool:
+        if instance is None:
+            return nullable
+        if binary and isinstance(instance, bytes):
+            return True
+        return is_type(instance)
+
+    return check
+
+
+def compile_oas_strict_type(
+    compiler: SchemaCompiler,
+    data_type: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return compile_oas_type(compiler, data_type, schema, resolver, strict=True)
+
+
+def compile_type(
+    compiler: SchemaCompiler,
+    types: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    if isinstance(types, str):
+        types = [types]
+    type_checks = [compiler._get_type_check(data_type) for data_type in types]
+    return lambda instance: any(check(instance) for check in type_checks)
+
+
+def compile_enum(
+    compiler: SchemaCompiler,
+    enums: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    strings = frozenset(each for each in enums if isinstance(each, str))
+
+    def check(instance: Any) -> bool:
+        if isinstance(instance, str):
+            return instance in strings
+        return any(equal(each, instance) for each in enums)
+
+    return check
+
+
+def compile_const(
+    compiler: SchemaCompiler,
+    const: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return lambda instance: equal(instance, const)
+
+
+def compile_format(
+    compiler: SchemaCompiler,
+    schema_format: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+    skip_none: bool = False,
+) -> Optional[Check]:
+    format_checker = compiler.format_checker
+    if format_checker is None:
+        return None
+    if schema_format not in format_checker.checkers:
+        return None
+    conforms = format_checker.conforms
+
+    def check(instance: Any) -> bool:
+        if skip_none and instance is None:
+            return True
+        return bool(conforms(instance, schema_format))
+
+    return check
+
+
+def compile_oas_format(
+    compiler: SchemaCompiler,
+    schema_format: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Optional[Check]:
+    return compile_format(
+        compiler, schema_format, schema, resolver, skip_none=True
+    )
+
+
+def compile_pattern(
+    compiler: SchemaCompiler,
+    pattern: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+    ecma: bool = False,
+) -> Check:
+    is_string = compiler._is_string()
+    if ecma and ECMARegex is not None:
+        try:
+            find = ECMARegex(pattern).find
+        # invalid patterns match no strings
+        except RegressError:
+            return lambda instance: not is_string(instance)
+        return lambda instance: not is_string(instance) or (
+            find(instance) is not None
+        )
+
+    try:
+        search = re.compile(pattern).search
+    except (re.error, TypeError):
+        raise NotCompilable(f"Unsupported pattern {pattern!r}")
+    return lambda instance: not is_string(instance) or (
+        search(instance) is not None
+    )
+
+
+def compile_oas_pattern(
+    compiler: SchemaCompiler,
+    pattern: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return compile_pattern(compiler, pattern, schema, resolver, ecma=True)
+
+
+def _compile_size(
+    is_type: Check, minimum: Optional[int], maximum: Optional[int]
+) -> Check:
+    def check(instance: Any) -> bool:
+        if not is_type(instance):
+            return True
+        size = len(instance)
+        if minimum is not None and size < minimum:
+            return False
+        return maximum is None or size <= maximum
+
+    return check
+
+
+def compile_min_length(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_size(compiler._is_string(), value, None)
+
+
+def compile_max_length(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_size(compiler._is_string(), None, value)
+
+
+def compile_min_items(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_size(compiler._is_array(), value, None)
+
+
+def compile_max_items(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_size(compiler._is_array(), None, value)
+
+
+def compile_min_properties(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_size(compiler._is_object(), value, None)
+
+
+def compile_max_properties(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_size(compiler._is_object(), None, value)
+
+
+def _compile_bound(
+    compiler: SchemaCompiler,
+    bound: Any,
+    compare: Callable[[Any, Any], bool],
+) -> Check:
+    is_number = compiler._is_number()
+    return lambda instance: not is_number(instance) or compare(instance, bound)
+
+
+def compile_minimum(
+    compiler: SchemaCompiler,
+    minimum: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_bound(
+        compiler, minimum, lambda value, bound: value >= bound
+    )
+
+
+def compile_maximum(
+    compiler: SchemaCompiler,
+    maximum: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_bound(
+        compiler, maximum, lambda value, bound: value <= bound
+    )
+
+
+def compile_exclusive_minimum(
+    compiler: SchemaCompiler,
+    minimum: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_bound(
+        compiler, minimum, lambda value, bound: value > bound
+    )
+
+
+def compile_exclusive_maximum(
+    compiler: SchemaCompiler,
+    maximum: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _compile_bound(
+        compiler, maximum, lambda value, bound: value < bound
+    )
+
+
+def compile_minimum_draft4(
+    compiler: SchemaCompiler,
+    minimum: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    if schema.get("exclusiveMinimum", False):
+        return compile_exclusive_minimum(compiler, minimum, schema, resolver)
+    return compile_minimum(compiler, minimum, schema, resolver)
+
+
+def compile_maximum_draft4(
+    compiler: SchemaCompiler,
+    maximum: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    if schema.get("exclusiveMaximum", False):
+        return compile_exclusive_maximum(compiler, maximum, schema, resolver)
+    return compile_maximum(compiler, maximum, schema, resolver)
+
+
+def compile_required(
+    compiler: SchemaCompiler,
+    required: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+    skip: Callable[[Mapping[str, Any]], bool] = lambda prop_schema: False,
+) -> Check:
+    is_object = compiler._is_object()
+    properties = schema.get("properties", {})
+    names = [
+        name
+        for name in required
+        if not (properties.get(name) and skip(properties[name]))
+    ]
+
+    def check(instance: Any) -> bool:
+        if not is_object(instance):
+            return True
+        for name in names:
+            if name not in instance:
+                return False
+        return True
+
+    return check
+
+
+def compile_oas_required(
+    compiler: SchemaCompiler,
+    required: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return compile_required(
+        compiler,
+        required,
+        schema,
+        resolver,
+        skip=lambda prop_schema: bool(
+            prop_schema.get("readOnly", False)
+            or prop_schema.get("writeOnly", False)
+        ),
+    )
+
+
+def compile_oas_read_required(
+    compiler: SchemaCompiler,
+    required: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return compile_required(
+        compiler,
+        required,
+        schema,
+        resolver,
+        skip=lambda prop_schema: bool(prop_schema.get("writeOnly", False)),
+    )
+
+
+def compile_oas_write_required(
+    compiler: SchemaCompiler,
+    required: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return compile_required(
+        compiler,
+        required,
+        schema,
+        resolver,
+        skip=lambda prop_schema: bool(prop_schema.get("readOnly", False)),
+    )
+
+
+def compile_access_mode(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Optional[Check]:
+    # readOnly property in request or writeOnly property in response
+    if not value:
+        return None
+    return _invalid
+
+
+def compile_properties(
+    compiler: SchemaCompiler,
+    properties: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    is_object = compiler._is_object()
+    property_checks = [
+        (name, compiler._compile(subschema, resolver))
+        for name, subschema in properties.items()
+    ]
+
+    def check(instance: Any) -> bool:
+        if not is_object(instance):
+            return True
+        for name, property_check in property_checks:
+            if name in instance and not property_check(instance[name]):
+                return False
+        return True
+
+    return check
+
+
+def compile_additional_properties(
+    compiler: SchemaCompiler,
+    additional_properties: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Optional[Check]:
+    is_object = compiler._is_object()
+    properties = schema.get("properties", {})
+    patterns = "|".join(schema.get("patternProperties", {}))
+    search = re.compile(patterns).search if patterns else None
+
+    def iter_extras(instance: Any) -> Iterable[Any]:
+        for name in instance:
+            if name in properties:
+                continue
+            if search is not None and search(name):
+                continue
+            yield name
+
+    if compiler._is_object()(additional_properties):
+        extra_check = compiler._compile(additional_properties, resolver)
+
+        def check_extras(instance: Any) -> bool:
+            if not is_object(instance):
+                return True
+            return all(
+                extra_check(instance[name]) for name in iter_extras(instance)
+            )
+
+        return check_extras
+
+    if additional_properties:
+        return None
+
+    def forbid_extras(instance: Any) -> bool:
+        if not is_object(instance):
+            return True
+        return next(iter(iter_extras(instance)), None) is None
+
+    return forbid_extras
+
+
+def compile_oas_additional_properties(
+    compiler: SchemaCompiler,
+    additional_properties: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Optional[Check]:
+    if compiler._is_object()(additional_properties):
+        return compile_additional_properties(
+            compiler, additional_properties, schema, resolver
+        )
+    if compiler._is_boolean()(additional_properties):
+        return compile_additional_properties(
+            compiler, additional_properties, schema, resolver
+        )
+    return None
+
+
+def compile_oas_items(
+    compiler: SchemaCompiler,
+    items: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    is_array = compiler._is_array()
+    item_check = compiler._compile(items, resolver)
+
+    def check(instance: Any) -> bool:
+        if not is_array(instance):
+            return True
+        return all(item_check(item) for item in instance)
+
+    return check
+
+
+def compile_items(
+    compiler: SchemaCompiler,
+    items: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    if "prefixItems" in schema:
+        raise NotCompilable("Unsupported keyword 'prefixItems'")
+    if items is False:
+        is_array = compiler._is_array()
+        return lambda instance: not is_array(instance) or not instance
+    return compile_oas_items(compiler, items, schema, resolver)
+
+
+def compile_not(
+    compiler: SchemaCompiler,
+    not_schema: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    not_check = compiler._compile(not_schema, resolver)
+    return lambda instance: not not_check(instance)
+
+
+def compile_ref(
+    compiler: SchemaCompiler,
+    ref: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return compiler._compile_ref(ref, resolver)
+
+
+def compile_all_of(
+    compiler: SchemaCompiler,
+    all_of: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    return _all(compiler._compile_all(all_of, resolver))
+
+
+def compile_any_of(
+    compiler: SchemaCompiler,
+    any_of: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    checks = compiler._compile_all(any_of, resolver)
+    return lambda instance: any(check(instance) for check in checks)
+
+
+def compile_one_of(
+    compiler: SchemaCompiler,
+    one_of: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> Check:
+    checks = compiler._compile_all(one_of, resolver)
+
+    def check(instance: Any) -> bool:
+        matched = False
+        for subschema_check in checks:
+            if subschema_check(instance):
+                if matched:
+                    return False
+                matched = True
+        return matched
+
+    return check
+
+
+def compile_discriminator(
+    compiler: SchemaCompiler, schema: Mapping[str, Any], resolver: Resolver
+) -> Check:
+    discriminator = schema["discriminator"]
+    prop_name = discriminator["propertyName"]
+    mapping = discriminator.get("mapping", {})
+    is_object = compiler._is_object()
+    # mapped and implicit references resolved so far
+    ref_checks: Dict[str, Check] = {}
+
+    def get_ref_check(ref: str) -> Optional[Check]:
+        try:
+            return ref_checks[ref]
+        except KeyError:
+            pass
+        ref_check = compiler.compile_ref(ref, resolver)
+        if ref_check is not None:
+            ref_checks[ref] = ref_check
+        return ref_check
+
+    for ref in mapping.values():
+        if isinstance(ref, str):
+            get_ref_check(ref)
+
+    def check(instance: Any) -> bool:
+        if not is_object(instance):
+            return False
+        prop_value = instance.get(prop_name)
+        if not prop_value:
+            return False
+        ref = mapping.get(prop_value) or f"#/components/schemas/{prop_value}"
+        if not isinstance(ref, str):
+            return False
+        ref_check = get_ref_check(ref)
+        if ref_check is None:
+            return False
+        return ref_check(instance)
+
+    return check
+
+
+def _with_discriminator(
+    keyword_compiler: KeywordCompiler,
+) -> KeywordCompiler:
+    def compile_keyword(
+        compiler: SchemaCompiler,
+        value: Any,
+        schema: Mapping[str, Any],
+        resolver: Resolver,
+    ) -> Optional[Check]:
+        if "discriminator" in schema:
+            return compile_discriminator(compiler, schema, resolver)
+        return keyword_compiler(compiler, value, schema, resolver)
+
+    return compile_keyword
+
+
+def compile_leaf(
+    keyword_validator: Callable[..., Iterable[Any]],
+) -> KeywordCompiler:
+    # keywords that don't descend; reuse their jsonschema implementation
+    def compile_keyword(
+        compiler: SchemaCompiler,
+        value: Any,
+        schema: Mapping[str, Any],
+        resolver: Resolver,
+    ) -> Check:
+        validator = compiler.validator
+
+        def check(instance: Any) -> bool:
+            errors = keyword_validator(validator, value, instance, schema)
+            return next(iter(errors), None) is None
+
+        return check
+
+    return compile_keyword
+
+
+def compile_nothing(
+    compiler: SchemaCompiler,
+    value: Any,
+    schema: Mapping[str, Any],
+    resolver: Resolver,
+) -> None:
+    return None
+
+
+JSON_SCHEMA_KEYWORDS = Draft202012Validator.VALIDATORS
+DRAFT4_KEYWORDS = Draft4Validator.VALIDATORS
+OAS30_KEYWORDS = OAS30Validator.VALIDATORS
+
+# keyword functions, as used by the public validator classes -> compiler
+KEYWORD_COMPILERS: Dict[Any, KeywordCompiler] = {
+    # OpenAPI keywords
+    OAS30_KEYWORDS["type"]: compile_oas_type,
+    OAS30StrictValidator.VALIDATORS["type"]: compile_oas_strict_type,
+    OAS30_KEYWORDS["format"]: compile_oas_format,
+    OAS30_KEYWORDS["pattern"]: compile_oas_pattern,
+    OAS30_KEYWORDS["items"]: compile_oas_items,
+    OAS30_KEYWORDS["required"]: compile_oas_required,
+    OAS30ReadValidator.VALIDATORS["required"]: compile_oas_read_required,
+    OAS30WriteValidator.VALIDATORS["required"]: compile_oas_write_required,
+    OAS30_KEYWORDS["additionalProperties"]: compile_oas_additional_properties,
+    OAS30WriteValidator.VALIDATORS["readOnly"]: compile_access_mode,
+    OAS30ReadValidator.VALIDATORS["writeOnly"]: compile_access_mode,
+    OAS30_KEYWORDS["allOf"]: _with_discriminator(compile_all_of),
+    OAS30_KEYWORDS["anyOf"]: _with_discriminator(compile_any_of),
+    OAS30_KEYWORDS["oneOf"]: _with_discriminator(compile_one_of),
+    OAS30_KEYWORDS["discriminator"]: compile_nothing,
+    # JSON Schema keywords
+    JSON_SCHEMA_KEYWORDS["type"]: compile_type,
+    JSON_SCHEMA_KEYWORDS["format"]: compile_format,
+    JSON_SCHEMA_KEYWORDS["pattern"]: compile_pattern,
+    JSON_SCHEMA_KEYWORDS["items"]: compile_items,
+    JSON_SCHEMA_KEYWORDS["required"]: compile_required,
+    JSON_SCHEMA_KEYWORDS[
+        "additionalProperties"
+    ]: compile_additional_properties,
+    JSON_SCHEMA_KEYWORDS["allOf"]: compile_all_of,
+    JSON_SCHEMA_KEYWORDS["anyOf"]: compile_any_of,
+    JSON_SCHEMA_KEYWORDS["oneOf"]: compile_one_of,
+    JSON_SCHEMA_KEYWORDS["enum"]: compile_enum,
+    JSON_SCHEMA_KEYWORDS["const"]: compile_const,
+    JSON_SCHEMA_KEYWORDS["not"]: compile_not,
+    JSON_SCHEMA_KEYWORDS["$ref"]: compile_ref,
+    JSON_SCHEMA_KEYWORDS["properties"]: compile_properties,
+    JSON_SCHEMA_KEYWORDS["minLength"]: compile_min_length,
+    JSON_SCHEMA_KEYWORDS["maxLength"]: compile_max_length,
+    JSON_SCHEMA_KEYWORDS["minItems"]: compile_min_items,
+    JSON_SCHEMA_KEYWORDS["maxItems"]: compile_max_items,
+    JSON_SCHEMA_KEYWORDS["minProperties"]: compile_min_properties,
+    JSON_SCHEMA_KEYWORDS["maxProperties"]: compile_max_properties,
+    JSON_SCHEMA_KEYWORDS["minimum"]: compile_minimum,
+    JSON_SCHEMA_KEYWORDS["maximum"]: compile_maximum,
+    JSON_SCHEMA_KEYWORDS["exclusiveMinimum"]: compile_exclusive_minimum,
+    JSON_SCHEMA_KEYWORDS["exclusiveMaximum"]: compile_exclusive_maximum,
+    JSON_SCHEMA_KEYWORDS["multipleOf"]: compile_leaf(
+        JSON_SCHEMA_KEYWORDS["multipleOf"]
+    ),
+    JSON_SCHEMA_KEYWORDS["uniqueItems"]: compile_leaf(
+        JSON_SCHEMA_KEYWORDS["uniqueItems"]
+    ),
+    JSON_SCHEMA_KEYWORDS["dependentRequired"]: compile_leaf(
+        JSON_SCHEMA_KEYWORDS["dependentRequired"]
+    ),
+    DRAFT4_KEYWORDS["minimum"]: compile_minimum_draft4,
+    DRAFT4_KEYWORDS["maximum"]: compile_maximum_draft4,
+}
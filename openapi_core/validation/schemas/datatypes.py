@@ -1,7 +1,21 @@
+from dataclasses import dataclass
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from jsonschema_path import SchemaPath
 
 FormatValidator = Callable[[Any], bool]
 
 FormatValidatorsDict = Dict[str, FormatValidator]
+
+
+@dataclass(frozen=True)
+class ComposedSchemas:
+    """Composed schemas a value matches."""
+
+    one_of: Optional[SchemaPath] = None
+    any_of: Tuple[SchemaPath, ...] = ()
+    all_of: Tuple[SchemaPath, ...] = ()
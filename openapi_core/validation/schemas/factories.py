@@ -1,7 +1,9 @@
 from copy import deepcopy
 from functools import lru_cache
 from typing import Any
+from typing import Hashable
 from typing import Optional
+from typing import Tuple
 from typing import cast
 
 from jsonschema._format import FormatChecker
@@ -9,13 +11,11 @@ from jsonschema.protocols import Validator
 from jsonschema.validators import validator_for
 from jsonschema_path import SchemaPath
 
-from openapi_core.validation.schemas._validators import (
-    build_enforce_properties_required_validator,
-)
-from openapi_core.validation.schemas._validators import (
-    build_forbid_unspecified_additional_properties_validator,
-)
+from openapi_core.caches import LRUCache
+from openapi_core.validation.schemas._validators import build_strict_validator
+from openapi_core.validation.schemas.compilers import SchemaCompiler
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
+from openapi_core.validation.schemas.validators import CompiledSchemaValidator
 from openapi_core.validation.schemas.validators import SchemaValidator
 
 
@@ -24,12 +24,30 @@ class SchemaValidatorsFactory:
         self,
         schema_validator_cls: type[Validator],
         format_checker: Optional[FormatChecker] = None,
+        cache_maxsize: int = 1024,
+        compilers_cache_maxsize: int = 32,
+        format_checkers_cache_maxsize: int = 32,
     ):
         self.schema_validator_cls = schema_validator_cls
         if format_checker is None:
             format_checker = self.schema_validator_cls.FORMAT_CHECKER
         assert format_checker is not None
         self.format_checker = format_checker
+        self.cache: Optional[
+            LRUCache[Hashable, Tuple[Tuple[Any, ...], SchemaValidator]]
+        ] = None
+        if cache_maxsize:
+            self.cache = LRUCache(cache_maxsize)
+        self._format_checkers: Optional[LRUCache[Hashable, FormatChecker]] = (
+            None
+        )
+        if format_checkers_cache_maxsize:
+            self._format_checkers = LRUCache(format_checkers_cache_maxsize)
+        self._compilers: Optional[
+            LRUCache[Hashable, Tuple[Tuple[Any, ...], SchemaCompiler]]
+        ] = None
+        if compilers_cache_maxsize:
+            self._compilers = LRUCache(compilers_cache_maxsize)
 
     def get_validator_cls(
         self, spec: SchemaPath, schema: SchemaPath
@@ -40,9 +58,45 @@ class SchemaValidatorsFactory:
         self,
         format_validators: Optional[FormatValidatorsDict] = None,
         extra_format_validators: Optional[FormatValidatorsDict] = None,
+    ) -> FormatChecker:
+        """Get format checker for the format validators.
+
+        Format checkers are composed once per format validators and shared
+        between validators, hence must not be modified. Format checkers of
+        the least recently used format validators are dropped.
+        """
+        if self._format_checkers is None:
+            return self._build_format_checker(
+                format_validators, extra_format_validators
+            )
+
+        key = (
+            self._get_format_validators_key(format_validators),
+            self._get_format_validators_key(extra_format_validators),
+        )
+        try:
+            format_checker = self._format_checkers.get(key)
+        # unhashable format validators
+        except TypeError:
+            return self._build_format_checker(
+                format_validators, extra_format_validators
+            )
+        if format_checker is None:
+            format_checker = self._build_format_checker(
+                format_validators, extra_format_validators
+            )
+            self._format_checkers.set(key, format_checker)
+        return format_checker
+
+    def _build_format_checker(
+        self,
+        format_validators: Optional[FormatValidatorsDict] = None,
+        extra_format_validators: Optional[FormatValidatorsDict] = None,
     ) -> FormatChecker:
         format_checker: FormatChecker
         if format_validators is None:
+            if not extra_format_validators:
+                return self.format_checker
             format_checker = deepcopy(cast(FormatChecker, self.format_checker))
         else:
             format_checker = FormatChecker([])
@@ -72,19 +126,114 @@ class SchemaValidatorsFactory:
         extra_format_validators: Optional[FormatValidatorsDict] = None,
         forbid_unspecified_additional_properties: bool = False,
         enforce_properties_required: bool = False,
+        compiled: bool = False,
+        first_error_only: bool = False,
     ) -> SchemaValidator:
-        validator_cls: type[Validator] = self.get_validator_cls(spec, schema)
-        if enforce_properties_required:
-            validator_cls = build_enforce_properties_required_validator(
-                validator_cls
-            )
-        if forbid_unspecified_additional_properties:
-            validator_cls = (
-                build_forbid_unspecified_additional_properties_validator(
-                    validator_cls
-                )
+        key = self.get_cache_key(
+            spec,
+            schema,
+            format_validators,
+            extra_format_validators,
+            forbid_unspecified_additional_properties,
+            enforce_properties_required,
+            compiled,
+            first_error_only,
+        )
+        if self.cache is None or key is None:
+            return self._create(
+                spec,
+                schema,
+                format_validators,
+                extra_format_validators,
+                forbid_unspecified_additional_properties,
+                enforce_properties_required,
+                compiled,
+                first_error_only,
             )
 
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached[1]
+        schema_validator = self._create(
+            spec,
+            schema,
+            format_validators,
+            extra_format_validators,
+            forbid_unspecified_additional_properties,
+            enforce_properties_required,
+            compiled,
+            first_error_only,
+        )
+        # keep the accessors alive so their ids in the key can't be reused
+        self.cache.set(
+            key, ((spec.accessor, schema.accessor), schema_validator)
+        )
+        return schema_validator
+
+    def reserve(self, size: int) -> None:
+        """Make room for `size` more validators in the cache."""
+        if self.cache is not None:
+            self.cache.reserve(size)
+
+    def get_cache_key(
+        self,
+        spec: SchemaPath,
+        schema: SchemaPath,
+        format_validators: Optional[FormatValidatorsDict],
+        extra_format_validators: Optional[FormatValidatorsDict],
+        forbid_unspecified_additional_properties: bool,
+        enforce_properties_required: bool,
+        compiled: bool = False,
+        first_error_only: bool = False,
+    ) -> Optional[Hashable]:
+        """Get key of validators of the schema location and options.
+
+        The key holds ids of the spec and schema accessors, so its
+        holder must keep them alive. None if the options are unhashable.
+        """
+        # schema location, not its URI, since specs can share a base URI
+        key = (
+            id(spec.accessor),
+            id(schema.accessor),
+            schema.parts,
+            self._get_format_validators_key(format_validators),
+            self._get_format_validators_key(extra_format_validators),
+            forbid_unspecified_additional_properties,
+            enforce_properties_required,
+            compiled,
+            first_error_only,
+        )
+        try:
+            hash(key)
+        # unhashable format validators
+        except TypeError:
+            return None
+        return key
+
+    def _get_format_validators_key(
+        self, format_validators: Optional[FormatValidatorsDict]
+    ) -> Optional[Tuple[Any, ...]]:
+        if format_validators is None:
+            return None
+        return tuple(format_validators.items())
+
+    def _create(
+        self,
+        spec: SchemaPath,
+        schema: SchemaPath,
+        format_validators: Optional[FormatValidatorsDict] = None,
+        extra_format_validators: Optional[FormatValidatorsDict] = None,
+        forbid_unspecified_additional_properties: bool = False,
+        enforce_properties_required: bool = False,
+        compiled: bool = False,
+        first_error_only: bool = False,
+    ) -> SchemaValidator:
+        validator_cls = build_strict_validator(
+            self.get_validator_cls(spec, schema),
+            forbid_unspecified_additional_properties,
+            enforce_properties_required,
+        )
+
         format_checker = self.get_format_checker(
             format_validators, extra_format_validators
         )
@@ -95,7 +244,45 @@ class SchemaValidatorsFactory:
                 format_checker=format_checker,
             )
 
-        return SchemaValidator(schema, jsonschema_validator)
+        if compiled:
+            compiler = self.get_compiler(spec, jsonschema_validator)
+            return CompiledSchemaValidator(
+                schema,
+                jsonschema_validator,
+                compiler,
+                first_error_only=first_error_only,
+            )
+
+        return SchemaValidator(
+            schema, jsonschema_validator, first_error_only=first_error_only
+        )
+
+    def get_compiler(
+        self, spec: SchemaPath, validator: Validator
+    ) -> SchemaCompiler:
+        """Get schema compiler shared by validators of the spec.
+
+        Compiled checks are reused for every schema of the spec that
+        validates with the same validator class and format checker.
+        Compilers of the least recently used specs are dropped.
+        """
+        if self._compilers is None:
+            return SchemaCompiler(validator)
+
+        key = (
+            id(spec.accessor),
+            validator.__class__,
+            id(validator.format_checker),
+        )
+        cached = self._compilers.get(key)
+        if cached is not None:
+            return cached[1]
+        compiler = SchemaCompiler(validator)
+        # keep the accessor and format checker alive so their ids can't be reused
+        self._compilers.set(
+            key, ((spec.accessor, validator.format_checker), compiler)
+        )
+        return compiler
 
 
 class DialectSchemaValidatorsFactory(SchemaValidatorsFactory):
@@ -104,8 +291,17 @@ class DialectSchemaValidatorsFactory(SchemaValidatorsFactory):
         schema_validator_cls: type[Validator],
         default_jsonschema_dialect_id: str,
         format_checker: Optional[FormatChecker] = None,
+        cache_maxsize: int = 1024,
+        compilers_cache_maxsize: int = 32,
+        format_checkers_cache_maxsize: int = 32,
     ):
-        super().__init__(schema_validator_cls, format_checker)
+        super().__init__(
+            schema_validator_cls,
+            format_checker,
+            cache_maxsize=cache_maxsize,
+            compilers_cache_maxsize=compilers_cache_maxsize,
+            format_checkers_cache_maxsize=format_checkers_cache_maxsize,
+        )
         self.default_jsonschema_dialect_id = default_jsonschema_dialect_id
 
     def get_validator_cls(
@@ -3,16 +3,25 @@ from functools import cached_property
 from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Dict
 from typing import Iterator
+from typing import Mapping
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from jsonschema.exceptions import FormatError
+from jsonschema.exceptions import ValidationError
 from jsonschema.protocols import Validator
 from jsonschema_path import SchemaPath
 
+from openapi_core.caches import LRUCache
+from openapi_core.validation.schemas.compilers import Check
+from openapi_core.validation.schemas.compilers import NotCompilable
+from openapi_core.validation.schemas.compilers import SchemaCompiler
+from openapi_core.validation.schemas.datatypes import ComposedSchemas
 from openapi_core.validation.schemas.datatypes import FormatValidator
 from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
-from openapi_core.validation.schemas.exceptions import ValidateError
 
 if TYPE_CHECKING:
     from openapi_core.casting.schemas.casters import SchemaCaster
@@ -21,32 +30,102 @@ log = logging.getLogger(__name__)
 
 
 class SchemaValidator:
+    # evolved validators kept per root validator; recursive schemas evolve
+    # a validator per nesting level of the data
+    evolved_maxsize = 1024
+
     def __init__(
         self,
         schema: SchemaPath,
         validator: Validator,
+        first_error_only: bool = False,
+        evolved: Optional[LRUCache[Tuple[Any, ...], "SchemaValidator"]] = None,
     ):
         self.schema = schema
         self.validator = validator
+        self.first_error_only = first_error_only
+        # subschema path -> evolved validator, shared with evolved validators
+        if evolved is None:
+            evolved = LRUCache(self.evolved_maxsize)
+        self._evolved = evolved
 
     def __contains__(self, schema_format: str) -> bool:
         return schema_format in self.validator.format_checker.checkers
 
+    def is_valid(self, value: Any) -> bool:
+        """Check the value without building all of its errors."""
+        return bool(self.validator.is_valid(value))
+
     def validate(self, value: Any) -> None:
         errors_iter = self.validator.iter_errors(value)
-        errors = tuple(errors_iter)
-        if errors:
-            schema_type = (self.schema / "type").read_str_or_list("any")
-            raise InvalidSchemaValue(value, schema_type, schema_errors=errors)
+        # valid values are done after a single pass; errors are collected
+        # only once the first one is found
+        first_error = next(errors_iter, None)
+        if first_error is None:
+            return
+        errors: Tuple[ValidationError, ...] = (first_error,)
+        if not self.first_error_only:
+            errors += tuple(errors_iter)
+        schema_type = (self.schema / "type").read_str_or_list("any")
+        raise InvalidSchemaValue(value, schema_type, schema_errors=errors)
 
     def evolve(self, schema: SchemaPath) -> "SchemaValidator":
+        # only subschemas of the same spec can be told apart by their path
+        if schema.accessor is not self.schema.accessor:
+            return self._evolve(schema)
+        validator = self._evolved.get(schema.parts)
+        if validator is None:
+            validator = self._evolve(schema)
+            self._evolved.set(schema.parts, validator)
+        return validator
+
+    def precompile(self) -> None:
+        """Evolve validators of all the subschemas ahead of time."""
+        self._precompile(set())
+
+    def _precompile(self, visited: Set[int]) -> None:
+        with self.schema.resolve() as resolved:
+            contents = resolved.contents
+        # recursive schemas resolve to the contents already visited
+        if not isinstance(contents, Mapping) or id(contents) in visited:
+            return
+        visited.add(id(contents))
+        for subschema in self._iter_subschemas(contents):
+            validator = self._evolved.get(subschema.parts)
+            if validator is None:
+                # precompiled validators are bounded by the spec size
+                self._evolved.reserve(1)
+                validator = self.evolve(subschema)
+            validator._precompile(visited)
+
+    def _iter_subschemas(
+        self, contents: Mapping[str, Any]
+    ) -> Iterator[SchemaPath]:
+        for keyword in ("properties", "patternProperties"):
+            if isinstance(contents.get(keyword), Mapping):
+                for name in contents[keyword]:
+                    yield self.schema / keyword / name
+        for keyword in ("items", "additionalProperties", "not"):
+            if isinstance(contents.get(keyword), Mapping):
+                yield self.schema / keyword
+        for keyword in ("oneOf", "anyOf", "allOf"):
+            if isinstance(contents.get(keyword), list):
+                for index in range(len(contents[keyword])):
+                    yield self.schema / keyword / index
+
+    def _evolve(self, schema: SchemaPath) -> "SchemaValidator":
         cls = self.__class__
 
         with schema.resolve() as resolved:
             validator = self.validator.evolve(
                 schema=resolved.contents, _resolver=resolved.resolver
             )
-            return cls(schema, validator)
+            return cls(
+                schema,
+                validator,
+                first_error_only=self.first_error_only,
+                evolved=self._evolved,
+            )
 
     def type_validator(
         self, value: Any, type_override: Optional[str] = None
@@ -104,15 +183,40 @@ class SchemaValidator:
         # OpenAPI 3.0: None is not a primitive type so None value will not find any type
         return None
 
-    def iter_valid_schemas(self, value: Any) -> Iterator[SchemaPath]:
+    def iter_valid_schemas(
+        self,
+        value: Any,
+        composed_schemas: Optional[ComposedSchemas] = None,
+    ) -> Iterator[SchemaPath]:
         yield self.schema
 
-        one_of_schema = self.get_one_of_schema(value)
-        if one_of_schema is not None:
-            yield one_of_schema
+        if composed_schemas is None:
+            composed_schemas = self.get_composed_schemas(value)
+        if composed_schemas.one_of is not None:
+            yield composed_schemas.one_of
+
+        yield from composed_schemas.any_of
+        yield from composed_schemas.all_of
+
+    def get_composed_schemas(
+        self,
+        value: Any,
+        caster: Optional["SchemaCaster"] = None,
+    ) -> ComposedSchemas:
+        """Match the oneOf, anyOf and allOf schemas at once.
+
+        The result can be passed around, so every composed schema is
+        evaluated once per value.
 
-        yield from self.iter_any_of_schemas(value)
-        yield from self.iter_all_of_schemas(value)
+        Args:
+            value: The value to match against schemas
+            caster: Optional caster for type coercion during matching.
+        """
+        return ComposedSchemas(
+            one_of=self.get_one_of_schema(value, caster=caster),
+            any_of=tuple(self.iter_any_of_schemas(value, caster=caster)),
+            all_of=tuple(self.iter_all_of_schemas(value)),
+        )
 
     def get_one_of_schema(
         self,
@@ -129,30 +233,29 @@ class SchemaValidator:
         if "oneOf" not in self.schema:
             return None
 
-        one_of_schemas = self.schema / "oneOf"
+        discriminated_schema = self.get_discriminated_schema(value)
+        one_of_schemas = self._iter_composed_schemas(
+            "oneOf", discriminated_schema
+        )
         for subschema in one_of_schemas:
             validator = self.evolve(subschema)
-            try:
-                test_value = value
-                # Only cast if caster provided (opt-in behavior)
-                if caster is not None:
-                    try:
-                        # Convert to dict if it's not exactly a plain dict
-                        # (e.g., ImmutableMultiDict from werkzeug)
-                        if type(value) is not dict:
-                            test_value = dict(value)
-                        else:
-                            test_value = value
-                        test_value = caster.evolve(subschema).cast(test_value)
-                    except (ValueError, TypeError, Exception):
-                        # If casting fails, try validation with original value
-                        # We catch generic Exception to handle CastError without circular import
+            test_value = value
+            # Only cast if caster provided (opt-in behavior)
+            if caster is not None:
+                try:
+                    # Convert to dict if it's not exactly a plain dict
+                    # (e.g., ImmutableMultiDict from werkzeug)
+                    if type(value) is not dict:
+                        test_value = dict(value)
+                    else:
                         test_value = value
+                    test_value = caster.evolve(subschema).cast(test_value)
+                except (ValueError, TypeError, Exception):
+                    # If casting fails, try validation with original value
+                    # We catch generic Exception to handle CastError without circular import
+                    test_value = value
 
-                validator.validate(test_value)
-            except ValidateError:
-                continue
-            else:
+            if validator.is_valid(test_value):
                 return subschema
 
         log.warning("valid oneOf schema not found")
@@ -173,29 +276,86 @@ class SchemaValidator:
         if "anyOf" not in self.schema:
             return
 
-        any_of_schemas = self.schema / "anyOf"
-        for subschema in any_of_schemas:
+        # every matching schema is merged in spec order, hence
+        # the discriminator can't narrow nor reorder them
+        for subschema in self.schema / "anyOf":
             validator = self.evolve(subschema)
-            try:
-                test_value = value
-                # Only cast if caster provided (opt-in behavior)
-                if caster is not None:
-                    try:
-                        # Convert to dict if it's not exactly a plain dict
-                        if type(value) is not dict:
-                            test_value = dict(value)
-                        else:
-                            test_value = value
-                        test_value = caster.evolve(subschema).cast(test_value)
-                    except (ValueError, TypeError, Exception):
-                        # If casting fails, try validation with original value
-                        # We catch generic Exception to handle CastError without circular import
+            test_value = value
+            # Only cast if caster provided (opt-in behavior)
+            if caster is not None:
+                try:
+                    # Convert to dict if it's not exactly a plain dict
+                    if type(value) is not dict:
+                        test_value = dict(value)
+                    else:
                         test_value = value
+                    test_value = caster.evolve(subschema).cast(test_value)
+                except (ValueError, TypeError, Exception):
+                    # If casting fails, try validation with original value
+                    # We catch generic Exception to handle CastError without circular import
+                    test_value = value
 
-                validator.validate(test_value)
-            except ValidateError:
-                continue
-            else:
+            if validator.is_valid(test_value):
+                yield subschema
+
+    def get_discriminated_schema(self, value: Any) -> Optional[SchemaPath]:
+        """Find the oneOf schema the discriminator value refers to.
+
+        Args:
+            value: The value to read the discriminator property from
+        """
+        if self._discriminator is None:
+            return None
+        if not isinstance(value, Mapping):
+            return None
+        property_name, mapping, refs = self._discriminator
+        prop_value = value.get(property_name)
+        if not prop_value or not isinstance(prop_value, str):
+            return None
+        ref = mapping.get(prop_value) or f"#/components/schemas/{prop_value}"
+        index = refs.get(ref)
+        if index is None:
+            return None
+        return self.schema / "oneOf" / index
+
+    @cached_property
+    def _discriminator(
+        self,
+    ) -> Optional[Tuple[str, Mapping[str, str], Dict[str, int]]]:
+        with self.schema.resolve() as resolved:
+            contents = resolved.contents
+        if not isinstance(contents, Mapping):
+            return None
+        discriminator = contents.get("discriminator")
+        if not isinstance(discriminator, Mapping):
+            return None
+        property_name = discriminator.get("propertyName")
+        if not isinstance(property_name, str):
+            return None
+        # mapping values are either schema names or references
+        mapping = {
+            prop_value: (
+                ref
+                if "/" in ref or "#" in ref
+                else f"#/components/schemas/{ref}"
+            )
+            for prop_value, ref in (discriminator.get("mapping") or {}).items()
+            if isinstance(ref, str)
+        }
+        # oneOf branch reference -> branch index
+        refs: Dict[str, int] = {}
+        for index, subschema in enumerate(contents.get("oneOf", [])):
+            if isinstance(subschema, Mapping) and "$ref" in subschema:
+                refs.setdefault(subschema["$ref"], index)
+        return property_name, mapping, refs
+
+    def _iter_composed_schemas(
+        self, keyword: str, first_schema: Optional[SchemaPath] = None
+    ) -> Iterator[SchemaPath]:
+        if first_schema is not None:
+            yield first_schema
+        for subschema in self.schema / keyword:
+            if subschema != first_schema:
                 yield subschema
 
     def iter_all_of_schemas(
@@ -210,9 +370,77 @@ class SchemaValidator:
             if "type" not in subschema:
                 continue
             validator = self.evolve(subschema)
-            try:
-                validator.validate(value)
-            except ValidateError:
+            if not validator.is_valid(value):
                 log.warning("invalid allOf schema found")
-            else:
-                yield subschema
+                continue
+            yield subschema
+
+
+class CompiledSchemaValidator(SchemaValidator):
+    """Schema validator backed by a compiled validity check.
+
+    Valid values are accepted by the compiled check alone. Invalid values,
+    and schemas the compiler doesn't support, go through the jsonschema
+    validator, so raised errors are the same as the ones of
+    `SchemaValidator`.
+    """
+
+    def __init__(
+        self,
+        schema: SchemaPath,
+        validator: Validator,
+        compiler: SchemaCompiler,
+        first_error_only: bool = False,
+        evolved: Optional[LRUCache[Tuple[Any, ...], "SchemaValidator"]] = None,
+    ):
+        super().__init__(
+            schema,
+            validator,
+            first_error_only=first_error_only,
+            evolved=evolved,
+        )
+        self.compiler = compiler
+
+    @cached_property
+    def check(self) -> Optional[Check]:
+        try:
+            with self.schema.resolve() as resolved:
+                return self.compiler.compile(
+                    resolved.contents, resolved.resolver
+                )
+        except NotCompilable as exc:
+            log.debug("schema %s not compiled: %s", self.schema, exc)
+            return None
+
+    def _precompile(self, visited: Set[int]) -> None:
+        compiled = self.check is not None
+        log.debug("schema %s precompiled, compiled: %s", self.schema, compiled)
+        super()._precompile(visited)
+
+    def is_valid(self, value: Any) -> bool:
+        if self.check is None:
+            return super().is_valid(value)
+        try:
+            return self.check(value)
+        except NotCompilable:
+            return super().is_valid(value)
+
+    def validate(self, value: Any) -> None:
+        if self.check is not None and self.is_valid(value):
+            return
+        super().validate(value)
+
+    def _evolve(self, schema: SchemaPath) -> "CompiledSchemaValidator":
+        cls = self.__class__
+
+        with schema.resolve() as resolved:
+            validator = self.validator.evolve(
+                schema=resolved.contents, _resolver=resolved.resolver
+            )
+            return cls(
+                schema,
+                validator,
+                self.compiler,
+                first_error_only=self.first_error_only,
+                evolved=self._evolved,
+            )
@@ -1,8 +1,9 @@
 """OpenAPI core validation validators module"""
 
 import warnings
-from functools import cached_property
 from typing import Any
+from typing import Callable
+from typing import Iterator
 from typing import Mapping
 from typing import Optional
 from typing import Tuple
@@ -11,6 +12,7 @@ from urllib.parse import urljoin
 from jsonschema_path import SchemaPath
 from openapi_spec_validator.validation.types import SpecValidatorType
 
+from openapi_core.caches import LRUCache
 from openapi_core.casting.schemas.factories import SchemaCastersFactory
 from openapi_core.deserializing.media_types import media_type_deserializers
 from openapi_core.deserializing.media_types.datatypes import (
@@ -29,14 +31,18 @@ from openapi_core.deserializing.styles.factories import (
 from openapi_core.protocols import Request
 from openapi_core.protocols import WebhookRequest
 from openapi_core.schema.parameters import get_style_and_explode
+from openapi_core.templating.datatypes import TemplateResult
 from openapi_core.templating.media_types.datatypes import MediaType
 from openapi_core.templating.paths.datatypes import PathOperationServer
+from openapi_core.templating.paths.exceptions import PathError
 from openapi_core.templating.paths.finders import APICallPathFinder
 from openapi_core.templating.paths.finders import BasePathFinder
 from openapi_core.templating.paths.finders import WebhookPathFinder
+from openapi_core.templating.paths.routers import iter_operations
 from openapi_core.templating.paths.types import PathFinderType
 from openapi_core.validation.schemas.datatypes import FormatValidatorsDict
 from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
+from openapi_core.validation.schemas.validators import SchemaValidator
 
 
 class BaseValidator:
@@ -44,6 +50,7 @@ class BaseValidator:
     schema_validators_factory: SchemaValidatorsFactory = NotImplemented
     path_finder_cls: PathFinderType = NotImplemented
     spec_validator_cls: Optional[SpecValidatorType] = None
+    paths_part = "paths"
 
     def __init__(
         self,
@@ -66,6 +73,11 @@ class BaseValidator:
         ] = None,
         forbid_unspecified_additional_properties: bool = False,
         enforce_properties_required: bool = False,
+        path_finder_cache_maxsize: int = 0,
+        path_finder_cache_ttl: Optional[float] = None,
+        path_finder_negative_cache_maxsize: int = 0,
+        compile_schema_validators: bool = False,
+        first_schema_error_only: bool = False,
     ):
         self.spec = spec
         self.base_url = base_url
@@ -107,10 +119,39 @@ class BaseValidator:
             forbid_unspecified_additional_properties
         )
         self.enforce_properties_required = enforce_properties_required
+        self.compile_schema_validators = compile_schema_validators
+        self.first_schema_error_only = first_schema_error_only
+        self.path_finder_cache: Optional[
+            LRUCache[Tuple[str, str], PathOperationServer]
+        ] = None
+        if path_finder_cache_maxsize:
+            self.path_finder_cache = LRUCache(
+                path_finder_cache_maxsize, ttl=path_finder_cache_ttl
+            )
+        self.path_finder_negative_cache: Optional[
+            LRUCache[Tuple[str, str], Callable[[], PathError]]
+        ] = None
+        if path_finder_negative_cache_maxsize:
+            self.path_finder_negative_cache = LRUCache(
+                path_finder_negative_cache_maxsize, ttl=path_finder_cache_ttl
+            )
+        self._path_finder: Optional[BasePathFinder] = None
 
-    @cached_property
+    @property
     def path_finder(self) -> BasePathFinder:
-        return self.path_finder_cls(self.spec, base_url=self.base_url)
+        # path finder and its cached results follow the spec object
+        if (
+            self._path_finder is None
+            or self._path_finder.spec is not self.spec
+        ):
+            self._path_finder = self.path_finder_cls(
+                self.spec, base_url=self.base_url
+            )
+            if self.path_finder_cache is not None:
+                self.path_finder_cache.clear()
+            if self.path_finder_negative_cache is not None:
+                self.path_finder_negative_cache.clear()
+        return self._path_finder
 
     def check_spec(self, spec: SchemaPath) -> None:
         if self.spec_validator_cls is None:
@@ -142,14 +183,7 @@ class BaseValidator:
             encoding = media_type.get("encoding")
         schema_validator = None
         if schema is not None:
-            schema_validator = self.schema_validators_factory.create(
-                self.spec,
-                schema,
-                format_validators=self.format_validators,
-                extra_format_validators=self.extra_format_validators,
-                forbid_unspecified_additional_properties=self.forbid_unspecified_additional_properties,
-                enforce_properties_required=self.enforce_properties_required,
-            )
+            schema_validator = self._get_schema_validator(schema)
         deserializer = self.media_type_deserializers_factory.create(
             self.spec,
             mimetype,
@@ -175,17 +209,57 @@ class BaseValidator:
         )
         return deserializer.deserialize(location)
 
-    def _validate_schema(self, schema: SchemaPath, value: Any) -> None:
-        validator = self.schema_validators_factory.create(
+    def _get_schema_validator(self, schema: SchemaPath) -> SchemaValidator:
+        return self.schema_validators_factory.create(
             self.spec,
             schema,
             format_validators=self.format_validators,
             extra_format_validators=self.extra_format_validators,
             forbid_unspecified_additional_properties=self.forbid_unspecified_additional_properties,
             enforce_properties_required=self.enforce_properties_required,
+            compiled=self.compile_schema_validators,
+            first_error_only=self.first_schema_error_only,
         )
+
+    def _validate_schema(self, schema: SchemaPath, value: Any) -> None:
+        validator = self._get_schema_validator(schema)
         validator.validate(value)
 
+    def precompile(self) -> int:
+        """Build path finder and schema validators ahead of time.
+
+        Caches are grown to fit the precompiled schemas, so none of them
+        gets evicted by the warm-up itself.
+
+        Returns number of the precompiled schemas.
+        """
+        self.path_finder.precompile()
+        schemas = list(self._iter_precompile_schemas())
+        self._reserve_precompile(len(schemas))
+        for schema in schemas:
+            self._precompile_schema(schema)
+        return len(schemas)
+
+    def _reserve_precompile(self, count: int) -> None:
+        self.schema_validators_factory.reserve(count)
+        self.schema_casters_factory.reserve(count)
+
+    def _precompile_schema(self, schema: SchemaPath) -> None:
+        self._get_schema_validator(schema).precompile()
+        caster = self.schema_casters_factory.create(self.spec, schema)
+        caster.schema_validator.precompile()
+
+    def _iter_precompile_schemas(self) -> Iterator[SchemaPath]:
+        return iter(())
+
+    def _iter_operations(self) -> Iterator[Tuple[SchemaPath, SchemaPath]]:
+        paths = self.spec / self.paths_part
+        if not paths.exists():
+            return
+        for _, path in paths.str_items():
+            for _, operation in iter_operations(path):
+                yield path, operation
+
     def _get_param_or_header_and_schema(
         self,
         param_or_header: SchemaPath,
@@ -292,6 +366,51 @@ class BaseValidator:
         self._validate_schema(schema, deserialised)
         return deserialised, schema
 
+    def _resolve_path(self, method: str, name: str) -> PathOperationServer:
+        path_finder = self.path_finder
+        if (
+            self.path_finder_cache is None
+            and self.path_finder_negative_cache is None
+        ):
+            return path_finder.find(method, name)
+
+        key = (method, name)
+        result = None
+        if self.path_finder_cache is not None:
+            result = self.path_finder_cache.get(key)
+        if result is None:
+            result = self._find_path_result(path_finder, key)
+            if self.path_finder_cache is not None:
+                self.path_finder_cache.set(key, result)
+        # path and server variables are handed over to the request;
+        # don't share them
+        path_result = result.path_result
+        server_result = result.server_result
+        return result._replace(
+            path_result=TemplateResult(
+                path_result.pattern, dict(path_result.variables or {})
+            ),
+            server_result=TemplateResult(
+                server_result.pattern, dict(server_result.variables or {})
+            ),
+        )
+
+    def _find_path_result(
+        self, path_finder: BasePathFinder, key: Tuple[str, str]
+    ) -> PathOperationServer:
+        if self.path_finder_negative_cache is None:
+            return path_finder.find(*key)
+
+        error_factory = self.path_finder_negative_cache.get(key)
+        if error_factory is not None:
+            # raise a new error each time; raised errors carry tracebacks
+            raise error_factory()
+        try:
+            return path_finder.find(*key)
+        except PathError as exc:
+            self.path_finder_negative_cache.set(key, _copy_error_factory(exc))
+            raise
+
     def _get_media_type_value(
         self,
         param_or_header: SchemaPath,
@@ -308,11 +427,30 @@ class BaseAPICallValidator(BaseValidator):
     def _find_path(self, request: Request) -> PathOperationServer:
         path_pattern = getattr(request, "path_pattern", None) or request.path
         full_url = urljoin(request.host_url, path_pattern)
-        return self.path_finder.find(request.method, full_url)
+        return self._resolve_path(request.method, full_url)
 
 
 class BaseWebhookValidator(BaseValidator):
     path_finder_cls = WebhookPathFinder
+    paths_part = "webhooks"
 
     def _find_path(self, request: WebhookRequest) -> PathOperationServer:
-        return self.path_finder.find(request.method, request.name)
+        return self._resolve_path(request.method, request.name)
+
+
+def _copy_error_factory(error: PathError) -> Callable[[], PathError]:
+    """Create factory of copies of the error.
+
+    Copies aren't built with the error class constructor, whose signature
+    may not match the error arguments, and keep the error attributes.
+    """
+    error_cls = error.__class__
+    args = error.args
+    attrs = error.__dict__.copy()
+
+    def factory() -> PathError:
+        error_copy = error_cls.__new__(error_cls, *args)
+        error_copy.__dict__.update(attrs)
+        return error_copy
+
+    return factory
@@ -9,14 +9,35 @@ from dataclasses import dataclass
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Type
 
 from jsonschema_path import SchemaPath
 
 from openapi_core.templating.paths.finders import APICallPathFinder
+from openapi_core.templating.paths.finders import BasePathFinder
+from openapi_core.templating.paths.finders import RegexAPICallPathFinder
+from openapi_core.templating.paths.iterators import SimpleOperationsIterator
+from openapi_core.templating.paths.iterators import TemplatePathsIterator
+from openapi_core.templating.paths.iterators import TemplateServersIterator
+
+
+class IteratorAPICallPathFinder(BasePathFinder):
+    paths_iterator = TemplatePathsIterator("paths")
+    operations_iterator = SimpleOperationsIterator()
+    servers_iterator = TemplateServersIterator()
+
+
+FINDERS: Dict[str, Type[BasePathFinder]] = {
+    "router": APICallPathFinder,
+    "regex": RegexAPICallPathFinder,
+    "iterator": IteratorAPICallPathFinder,
+}
 
 
 @dataclass(frozen=True)
 class Result:
+    finder: str
+    batch: bool
     paths: int
     templates_ratio: float
     lookups: int
@@ -26,6 +47,8 @@ class Result:
 
     def as_dict(self) -> Dict[str, Any]:
         return {
+            "finder": self.finder,
+            "batch": self.batch,
             "paths": self.paths,
             "templates_ratio": self.templates_ratio,
             "lookups": self.lookups,
@@ -90,15 +113,22 @@ def build_urls(
     return urls
 
 
-def run_once(finder: APICallPathFinder, urls: List[str]) -> float:
+def run_once(finder: BasePathFinder, urls: List[str]) -> float:
     t0 = time.perf_counter()
     for u in urls:
         finder.find("get", u)
     return time.perf_counter() - t0
 
 
+def run_batch_once(finder: BasePathFinder, urls: List[str]) -> float:
+    t0 = time.perf_counter()
+    finder.find_many([("get", u) for u in urls])
+    return time.perf_counter() - t0
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
+    ap.add_argument("--finder", choices=sorted(FINDERS), default="router")
     ap.add_argument("--paths", type=int, default=2000)
     ap.add_argument("--templates-ratio", type=float, default=0.6)
     ap.add_argument("--lookups", type=int, default=100_000)
@@ -107,10 +137,11 @@ def main() -> None:
     ap.add_argument("--seed", type=int, default=1)
     ap.add_argument("--output", type=str, default="")
     ap.add_argument("--no-gc", action="store_true")
+    ap.add_argument("--batch", action="store_true")
     args = ap.parse_args()
 
     spec = build_spec(args.paths, args.templates_ratio)
-    finder = APICallPathFinder(spec)
+    finder = FINDERS[args.finder](spec)
 
     urls = build_urls(
         args.paths, args.templates_ratio, args.lookups, args.seed
@@ -119,18 +150,22 @@ def main() -> None:
     if args.no_gc:
         gc.disable()
 
+    run = run_batch_once if args.batch else run_once
+
     # Warmup (JIT-less, but warms caches, alloc patterns, etc.)
     for _ in range(args.warmup):
-        run_once(finder, urls)
+        run(finder, urls)
 
     seconds: List[float] = []
     for _ in range(args.repeats):
-        seconds.append(run_once(finder, urls))
+        seconds.append(run(finder, urls))
 
     if args.no_gc:
         gc.enable()
 
     result = Result(
+        finder=args.finder,
+        batch=args.batch,
         paths=args.paths,
         templates_ratio=args.templates_ratio,
         lookups=args.lookups,
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Path finder scalability benchmark matrix.
+
+Sweeps one spec shape axis at a time around a baseline scenario and
+reports lookup throughput of every selected finder. Results are keyed
+by finder and scenario, so two runs can be compared with `--baseline`.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import replace
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from bench_paths import FINDERS
+from jsonschema_path import SchemaPath
+
+from openapi_core.templating.paths.exceptions import PathError
+from openapi_core.templating.paths.finders import BasePathFinder
+
+FORMAT_VERSION = 1
+
+Lookup = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    paths: int = 1000
+    depth: int = 3
+    templates_ratio: float = 0.5
+    servers: int = 1
+    server_variables: bool = False
+    miss_rate: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return ",".join(f"{k}={v}" for k, v in asdict(self).items())
+
+
+AXES: Dict[str, Callable[[str], Any]] = {
+    "paths": int,
+    "depth": int,
+    "templates_ratio": float,
+    "servers": int,
+    "server_variables": lambda value: value.lower() in ("1", "true", "yes"),
+    "miss_rate": float,
+}
+
+DEFAULT_SWEEP = {
+    "paths": "10,100,1000,10000,50000",
+    "depth": "1,3,6",
+    "templates_ratio": "0,0.5,1",
+    "servers": "1,5,20",
+    "server_variables": "false,true",
+    "miss_rate": "0,0.5,0.9",
+}
+
+
+def build_scenarios(
+    baseline: Scenario, sweep: Dict[str, List[Any]]
+) -> List[Scenario]:
+    scenarios = [baseline]
+    for axis, values in sweep.items():
+        for value in values:
+            scenario = replace(baseline, **{axis: value})
+            if scenario not in scenarios:
+                scenarios.append(scenario)
+    return scenarios
+
+
+def is_templated(scenario: Scenario, index: int) -> bool:
+    return index < int(scenario.paths * scenario.templates_ratio)
+
+
+def path_segments(scenario: Scenario, index: int) -> List[str]:
+    # unique leading segment, then alternating literals and variables
+    segments = [f"r{index}"]
+    templated = is_templated(scenario, index)
+    for position in range(1, scenario.depth):
+        if templated and position % 2:
+            segments.append(f"{{p{position}}}")
+        else:
+            segments.append(f"s{position}")
+    return segments
+
+
+def server_url(scenario: Scenario, index: int) -> str:
+    if scenario.server_variables:
+        return f"https://{{tenant}}.s{index}.example.com/{{version}}"
+    return f"https://s{index}.example.com/v1"
+
+
+def build_spec(scenario: Scenario) -> SchemaPath:
+    servers = []
+    for index in range(scenario.servers):
+        server: Dict[str, Any] = {"url": server_url(scenario, index)}
+        if scenario.server_variables:
+            server["variables"] = {
+                "tenant": {"default": "acme"},
+                "version": {"default": "v1"},
+            }
+        servers.append(server)
+
+    operation = {"responses": {"200": {"description": "ok"}}}
+    paths: Dict[str, Any] = {}
+    for index in range(scenario.paths):
+        pattern = "/" + "/".join(path_segments(scenario, index))
+        path = {"get": operation}
+        # every other path also accepts writes
+        if index % 2:
+            path["post"] = operation
+        paths[pattern] = path
+
+    return SchemaPath.from_dict(
+        {
+            "openapi": "3.0.0",
+            "info": {"title": "bench", "version": "0"},
+            "servers": servers,
+            "paths": paths,
+        }
+    )
+
+
+def build_lookups(scenario: Scenario, lookups: int, seed: int) -> List[Lookup]:
+    rnd = random.Random(seed)
+    result: List[Lookup] = []
+    for _ in range(lookups):
+        server = rnd.randrange(scenario.servers)
+        prefix = server_url(scenario, server).format(
+            tenant=f"t{rnd.randrange(100)}", version="v1"
+        )
+        index = rnd.randrange(scenario.paths)
+        segments = [
+            (
+                str(rnd.randrange(1_000_000))
+                if segment.startswith("{")
+                else segment
+            )
+            for segment in path_segments(scenario, index)
+        ]
+        method = "get"
+        if rnd.random() < scenario.miss_rate:
+            # half of the misses are 404s, the other half 405s
+            if rnd.random() < 0.5:
+                segments[0] = f"missing{index}"
+            else:
+                method = "delete"
+        result.append((method, prefix + "/" + "/".join(segments)))
+    return result
+
+
+def run_once(finder: BasePathFinder, lookups: List[Lookup]) -> float:
+    t0 = time.perf_counter()
+    for method, url in lookups:
+        try:
+            finder.find(method, url)
+        except PathError:
+            pass
+    return time.perf_counter() - t0
+
+
+def run_scenario(
+    finder_name: str, scenario: Scenario, args: argparse.Namespace
+) -> Dict[str, Any]:
+    spec = build_spec(scenario)
+    lookups = build_lookups(scenario, args.lookups, args.seed)
+
+    t0 = time.perf_counter()
+    finder = FINDERS[finder_name](spec)
+    # compiled finders build their indexes on first use
+    run_once(finder, lookups[:1])
+    build_s = time.perf_counter() - t0
+
+    for _ in range(args.warmup):
+        run_once(finder, lookups)
+
+    if args.no_gc:
+        gc.disable()
+    seconds = [run_once(finder, lookups) for _ in range(args.repeats)]
+    if args.no_gc:
+        gc.enable()
+
+    median_s = statistics.median(seconds)
+    return {
+        "key": f"{finder_name}:{scenario.key}",
+        "finder": finder_name,
+        "scenario": asdict(scenario),
+        "lookups": args.lookups,
+        "build_s": build_s,
+        "seconds": seconds,
+        "median_s": median_s,
+        "stdev_s": statistics.pstdev(seconds),
+        "ops_per_sec_median": args.lookups / median_s,
+    }
+
+
+def find_regressions(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[Tuple[str, float, float]]:
+    previous = {
+        result["key"]: result["ops_per_sec_median"]
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        before = previous.get(result["key"])
+        if before is None:
+            continue
+        after = result["ops_per_sec_median"]
+        if after < before * (1 - threshold):
+            regressions.append((result["key"], before, after))
+    return regressions
+
+
+def parse_values(axis: str, values: str) -> List[Any]:
+    return [AXES[axis](value) for value in values.split(",") if value]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--finder",
+        action="append",
+        choices=sorted(FINDERS),
+        help="finder to benchmark; can be repeated (default: router, regex)",
+    )
+    for axis, values in DEFAULT_SWEEP.items():
+        ap.add_argument(
+            f"--{axis.replace('_', '-')}",
+            dest=axis,
+            default=values,
+            help=f"comma separated values to sweep (default: {values})",
+        )
+    ap.add_argument("--lookups", type=int, default=2000)
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--warmup", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--output", type=str, default="")
+    ap.add_argument(
+        "--baseline",
+        type=str,
+        default="",
+        help="results of a previous run to compare against",
+    )
+    ap.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed throughput drop against the baseline (default: 0.2)",
+    )
+    ap.add_argument("--no-gc", action="store_true")
+    args = ap.parse_args()
+
+    finders = args.finder or ["router", "regex"]
+    sweep = {axis: parse_values(axis, getattr(args, axis)) for axis in AXES}
+    scenarios = build_scenarios(Scenario(), sweep)
+
+    results: List[Dict[str, Any]] = []
+    for scenario in scenarios:
+        for finder_name in finders:
+            result = run_scenario(finder_name, scenario, args)
+            print(
+                f"{result['ops_per_sec_median']:>12.0f} ops/s  {result['key']}",
+                file=sys.stderr,
+            )
+            results.append(result)
+
+    payload = {
+        "version": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "lookups": args.lookups,
+        "repeats": args.repeats,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "results": results,
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for key, before, after in regressions:
+            print(
+                f"REGRESSION {key}: {before:.0f} -> {after:.0f} ops/s",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
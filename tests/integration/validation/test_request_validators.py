@@ -1,12 +1,14 @@
 from base64 import b64encode
 
 import pytest
+from jsonschema_path import SchemaPath
 
 from openapi_core import OpenAPI
 from openapi_core import V30RequestValidator
 from openapi_core.templating.media_types.exceptions import MediaTypeNotFound
 from openapi_core.templating.paths.exceptions import OperationNotFound
 from openapi_core.templating.paths.exceptions import PathNotFound
+from openapi_core.templating.paths.finders import APICallPathFinder
 from openapi_core.templating.security.exceptions import SecurityNotFound
 from openapi_core.testing import MockRequest
 from openapi_core.validation.request.exceptions import MissingRequiredParameter
@@ -241,3 +243,140 @@ class TestRequestValidator:
         result = spec.validate_request(request)
 
         assert result is None
+
+
+class TestRequestValidatorPathFinderCache:
+    host_url = "http://petstore.swagger.io"
+
+    @pytest.fixture
+    def request_validator(self, v30_petstore_spec):
+        return V30RequestValidator(
+            v30_petstore_spec, path_finder_cache_maxsize=8
+        )
+
+    def test_cached(self, request_validator):
+        request = MockRequest(self.host_url, "get", "/v1/pets/1")
+
+        result = request_validator._find_path(request)
+        result_cached = request_validator._find_path(request)
+
+        assert result_cached == result
+        assert result_cached.path_result.variables == {"petId": "1"}
+        assert result_cached.path_result.variables is not (
+            result.path_result.variables
+        )
+        cache_info = request_validator.path_finder_cache.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
+    def test_cached_result_mutated(self, request_validator):
+        request = MockRequest(self.host_url, "get", "/v1/pets/1")
+        result = request_validator._find_path(request)
+
+        result.path_result.variables["petId"] = "2"
+        result.server_result.variables["version"] = "v2"
+
+        result_cached = request_validator._find_path(request)
+        assert result_cached.path_result.variables == {"petId": "1"}
+        assert result_cached.server_result.variables == {"version": "v1"}
+        cache_info = request_validator.path_finder_cache.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
+    def test_not_found_not_cached(self, request_validator):
+        request = MockRequest(self.host_url, "patch", "/v1/pets")
+
+        with pytest.raises(OperationNotFound):
+            request_validator._find_path(request)
+
+        assert len(request_validator.path_finder_cache) == 0
+
+    def test_spec_changed(self, request_validator, v30_petstore_content):
+        request = MockRequest(self.host_url, "get", "/v1/pets/1")
+        request_validator._find_path(request)
+        path_finder = request_validator.path_finder
+
+        request_validator.spec = SchemaPath.from_dict(v30_petstore_content)
+
+        assert request_validator.path_finder is not path_finder
+        assert len(request_validator.path_finder_cache) == 0
+
+
+class TestRequestValidatorPathFinderNegativeCache:
+    host_url = "http://petstore.swagger.io"
+
+    @pytest.fixture
+    def request_validator(self, v30_petstore_spec):
+        return V30RequestValidator(
+            v30_petstore_spec, path_finder_negative_cache_maxsize=8
+        )
+
+    def test_cached(self, request_validator):
+        request = MockRequest(self.host_url, "patch", "/v1/pets")
+
+        with pytest.raises(OperationNotFound):
+            request_validator._find_path(request)
+        with pytest.raises(OperationNotFound):
+            request_validator._find_path(request)
+
+        cache_info = request_validator.path_finder_negative_cache.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
+    def test_cached_raises_new_error(self, request_validator):
+        request = MockRequest(self.host_url, "patch", "/v1/pets")
+
+        with pytest.raises(OperationNotFound) as exc_info:
+            request_validator._find_path(request)
+        with pytest.raises(OperationNotFound) as exc_info_2:
+            request_validator._find_path(request)
+
+        assert exc_info_2.value is not exc_info.value
+        assert exc_info_2.value == exc_info.value
+
+    def test_cached_error_copied(self, v30_petstore_spec):
+        class CustomPathError(PathNotFound):
+            def __init__(self, url, reason):
+                super().__init__(url)
+                self.reason = reason
+
+        class CustomPathFinder(APICallPathFinder):
+            def find(self, method, name):
+                error = CustomPathError(name, "unknown")
+                error.request_method = method
+                raise error
+
+        class CustomRequestValidator(V30RequestValidator):
+            path_finder_cls = CustomPathFinder
+
+        request_validator = CustomRequestValidator(
+            v30_petstore_spec, path_finder_negative_cache_maxsize=8
+        )
+        request = MockRequest(self.host_url, "get", "/v1/unknown")
+
+        with pytest.raises(CustomPathError) as exc_info:
+            request_validator._find_path(request)
+        with pytest.raises(CustomPathError) as exc_info_2:
+            request_validator._find_path(request)
+
+        assert exc_info_2.value is not exc_info.value
+        assert exc_info_2.value.url == exc_info.value.url
+        assert exc_info_2.value.reason == "unknown"
+        assert exc_info_2.value.request_method == "get"
+
+    def test_found_not_cached(self, request_validator):
+        request = MockRequest(self.host_url, "get", "/v1/pets/1")
+
+        request_validator._find_path(request)
+
+        assert len(request_validator.path_finder_negative_cache) == 0
+
+    def test_spec_changed(self, request_validator, v30_petstore_content):
+        request = MockRequest(self.host_url, "get", "/v1/unknown")
+        with pytest.raises(PathNotFound):
+            request_validator._find_path(request)
+
+        request_validator.spec = SchemaPath.from_dict(v30_petstore_content)
+        request_validator.path_finder
+
+        assert len(request_validator.path_finder_negative_cache) == 0
@@ -44,3 +44,26 @@ class TestImportModelCreate:
         test_model_class = factory.create(schema, ["a", "b"])
 
         assert test_model_class == loaded_model_class
+
+    def test_dynamic_model_cached(self):
+        factory = ModelPathFactory()
+        schema = SchemaPath.from_dict({"x-model": "TestModel"})
+
+        test_model_class = factory.create(schema, ["name"])
+        result = ModelPathFactory().create(schema, ["name"])
+
+        assert result is test_model_class
+        assert test_model_class.__slots__ == ("name",)
+        assert factory.create(schema, ["name", "age"]) is not result
+
+    def test_model_path_cached(self, loaded_model_class):
+        factory = ModelPathFactory()
+        schema = SchemaPath.from_dict({"x-model-path": "foo.BarCachedModel"})
+
+        assert factory.create(schema, ["a", "b"]) is None
+
+        modules["foo"].BarCachedModel = loaded_model_class
+        assert factory.create(schema, ["a", "b"]) == loaded_model_class
+
+        del modules["foo"].BarCachedModel
+        assert factory.create(schema, ["a", "b"]) == loaded_model_class
@@ -0,0 +1,122 @@
+import pytest
+from jsonschema_path import SchemaPath
+from referencing.exceptions import Unresolvable
+
+from openapi_core.schema.snapshots import SnapshotAccessor
+from openapi_core.schema.snapshots import create_snapshot
+
+
+class TestCreateSnapshot:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "paths": {
+                    "/pets": {
+                        "parameters": [
+                            {"$ref": "#/components/parameters/Limit"},
+                        ],
+                    },
+                },
+                "components": {
+                    "parameters": {
+                        "Limit": {
+                            "name": "limit",
+                            "in": "query",
+                            "schema": {"$ref": "#/components/schemas/Int"},
+                        },
+                    },
+                    "schemas": {
+                        "Int": {"type": "integer"},
+                        "Node": {
+                            "type": "object",
+                            "properties": {
+                                "next": {"$ref": "#/components/schemas/Node"},
+                                "broken": {"$ref": "#/missing"},
+                            },
+                        },
+                    },
+                },
+            }
+        )
+
+    def test_paths(self, spec):
+        snapshot = create_snapshot(spec)
+
+        assert isinstance(snapshot.accessor, SnapshotAccessor)
+        assert snapshot == spec
+        param = snapshot / "paths" / "/pets" / "parameters" / 0
+        assert param == spec / "paths" / "/pets" / "parameters" / 0
+        assert (param / "name").read_str() == "limit"
+        assert (param / "schema" / "type").read_str() == "integer"
+        assert "schema" in param
+        assert "style" not in param
+
+    def test_references_followed(self, spec):
+        snapshot = create_snapshot(spec)
+
+        schema = snapshot / "paths" / "/pets" / "parameters" / 0 / "schema"
+        with schema.resolve() as resolved:
+            contents = resolved.contents
+
+        assert contents is spec.read_value()["components"]["schemas"]["Int"]
+
+    def test_recursive(self, spec):
+        snapshot = create_snapshot(spec)
+
+        node = snapshot / "components" / "schemas" / "Node"
+        nested = node / "properties" / "next" / "properties" / "next"
+
+        assert (nested / "type").read_str() == "object"
+        assert list((nested / "properties").keys()) == ["next", "broken"]
+
+    def test_missing(self, spec):
+        snapshot = create_snapshot(spec)
+
+        with pytest.raises(KeyError):
+            (snapshot / "paths" / "/pets" / "get").read_value()
+        broken = snapshot / "components" / "schemas" / "Node" / "properties"
+        with pytest.raises(Unresolvable):
+            (broken / "broken" / "type").read_value()
+
+    def test_snapshot_reused(self, spec):
+        snapshot = create_snapshot(spec)
+
+        result = create_snapshot(snapshot / "components")
+
+        assert result.accessor is snapshot.accessor
+        assert result == spec / "components"
+
+    def test_resolved_once(self, spec):
+        snapshot = create_snapshot(spec)
+        param = snapshot / "paths" / "/pets" / "parameters" / 0
+        schema = param / "schema"
+
+        with schema.resolve() as resolved:
+            pass
+        with (param / "schema").resolve() as resolved_2:
+            pass
+
+        assert resolved_2 is resolved
+        assert snapshot.accessor.snapshot.get(schema.parts) is resolved
+
+    def test_recursive_bounded(self, spec):
+        snapshot = create_snapshot(spec, maxsize=8)
+        node = snapshot / "components" / "schemas" / "Node"
+
+        for _ in range(32):
+            node = node / "properties" / "next"
+            assert (node / "type").read_str() == "object"
+
+        assert len(snapshot.accessor.snapshot) == 8
+
+    def test_resolved_cache_kept(self):
+        spec = SchemaPath.from_dict(
+            {"components": {"schemas": {"Int": {"type": "integer"}}}},
+            resolved_cache_maxsize=8,
+        )
+
+        snapshot = create_snapshot(spec)
+
+        assert snapshot.accessor.accessor is spec.accessor
+        assert (snapshot / "components" / "schemas" / "Int").exists()
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from jsonschema_path import SchemaPath
 
@@ -7,6 +9,7 @@ from openapi_core.templating.paths.exceptions import PathNotFound
 from openapi_core.templating.paths.exceptions import PathsNotFound
 from openapi_core.templating.paths.exceptions import ServerNotFound
 from openapi_core.templating.paths.finders import APICallPathFinder
+from openapi_core.templating.paths.finders import RegexAPICallPathFinder
 
 
 class BaseTestSimpleServer:
@@ -125,9 +128,9 @@ class BaseTestSpecServer:
         }
         return SchemaPath.from_dict(spec)
 
-    @pytest.fixture
-    def finder(self, spec):
-        return APICallPathFinder(spec)
+    @pytest.fixture(params=[APICallPathFinder, RegexAPICallPathFinder])
+    def finder(self, request, spec):
+        return request.param(spec)
 
 
 class BaseTestPathServer(BaseTestSpecServer):
@@ -804,3 +807,179 @@ class TestTemplateConcretePaths(BaseTestSpecServer, BaseTestSimpleServer):
             path_result,
             server_result,
         )
+
+
+@pytest.mark.parametrize(
+    "finder_cls", [APICallPathFinder, RegexAPICallPathFinder]
+)
+class TestMethodPathsIterators:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "servers": [{"url": "http://petstore.swagger.io"}],
+                "paths": {
+                    "/pets/{petId}": {
+                        "parameters": [],
+                        "get": {},
+                    },
+                    "/pets/{name}": {
+                        "post": {},
+                    },
+                },
+            }
+        )
+
+    def test_methods(self, finder_cls, spec):
+        finder = finder_cls(spec)
+
+        assert set(finder.method_paths_iterators) == {"get", "post"}
+
+    def test_method_first(self, finder_cls, spec):
+        finder = finder_cls(spec)
+
+        result = finder.find("post", "http://petstore.swagger.io/pets/1")
+
+        assert result.path == spec / "paths" / "/pets/{name}"
+        assert result.path_result == TemplateResult(
+            "/pets/{name}", {"name": "1"}
+        )
+
+    def test_operation_not_found(self, finder_cls, spec):
+        finder = finder_cls(spec)
+
+        with pytest.raises(OperationNotFound):
+            finder.find("put", "http://petstore.swagger.io/pets/1")
+
+    def test_path_not_found(self, finder_cls, spec):
+        finder = finder_cls(spec)
+
+        with pytest.raises(PathNotFound):
+            finder.find("post", "http://petstore.swagger.io/tokens/1")
+
+    def test_custom_paths_iterator(self, finder_cls, spec):
+        router = finder_cls.paths_router_cls(spec, "paths")
+
+        class CustomPathFinder(finder_cls):
+            paths_iterator = mock.Mock(wraps=router)
+
+        finder = CustomPathFinder(spec)
+
+        result = finder.find("post", "http://petstore.swagger.io/pets/1")
+
+        assert result.path == spec / "paths" / "/pets/{name}"
+        assert finder.method_paths_iterators == {}
+        CustomPathFinder.paths_iterator.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "finder_cls", [APICallPathFinder, RegexAPICallPathFinder]
+)
+class TestFindMany:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "servers": [{"url": "http://petstore.swagger.io"}],
+                "paths": {
+                    "/pets": {"get": {}},
+                    "/pets/{petId}": {"get": {}},
+                },
+            }
+        )
+
+    def test_order(self, finder_cls, spec):
+        finder = finder_cls(spec)
+        requests = [
+            ("get", "http://petstore.swagger.io/pets/1"),
+            ("get", "http://petstore.swagger.io/pets"),
+            ("post", "http://petstore.swagger.io/pets"),
+            ("get", "http://petstore.swagger.io/tokens"),
+            ("get", "http://other.io/pets"),
+        ]
+
+        results = finder.find_many(requests)
+
+        assert results[0] == finder.find(*requests[0])
+        assert results[1] == finder.find(*requests[1])
+        assert isinstance(results[2], OperationNotFound)
+        assert isinstance(results[3], PathNotFound)
+        assert isinstance(results[4], ServerNotFound)
+
+    def test_duplicates(self, finder_cls, spec):
+        finder = finder_cls(spec)
+        request = ("get", "http://petstore.swagger.io/pets/1")
+
+        results = finder.find_many([request, request])
+
+        assert results[0] is results[1]
+
+    def test_empty(self, finder_cls, spec):
+        finder = finder_cls(spec)
+
+        assert finder.find_many([]) == []
+
+    def test_operations_shared(self, finder_cls, spec):
+        finder = finder_cls(spec)
+        finder.operations_iterator = mock.Mock(
+            wraps=finder.operations_iterator
+        )
+        requests = [
+            ("get", "http://petstore.swagger.io/pets/1"),
+            ("get", "http://petstore.swagger.io/pets/2"),
+            ("get", "http://petstore.swagger.io/pets/3"),
+        ]
+
+        results = finder.find_many(requests)
+
+        assert finder.operations_iterator.call_count == 1
+        assert [result.path_result.variables for result in results] == [
+            {"petId": "1"},
+            {"petId": "2"},
+            {"petId": "3"},
+        ]
+        assert results == [finder.find(*request) for request in requests]
+
+    def test_servers_per_url(self, finder_cls):
+        spec = SchemaPath.from_dict(
+            {
+                "servers": [{"url": "http://{host}.io"}],
+                "paths": {
+                    "/pets": {"get": {}},
+                },
+            }
+        )
+        finder = finder_cls(spec)
+        requests = [
+            ("get", "http://petstore.io/pets"),
+            ("get", "http://store.io/pets"),
+            ("get", "http://petstore.com/pets"),
+        ]
+
+        results = finder.find_many(requests)
+
+        assert results[0].server_result.variables == {"host": "petstore"}
+        assert results[1].server_result.variables == {"host": "store"}
+        assert isinstance(results[2], ServerNotFound)
+
+    def test_server_variables_not_shared(self, finder_cls):
+        spec = SchemaPath.from_dict(
+            {
+                "servers": [{"url": "http://{host}.io"}],
+                "paths": {
+                    "/pets/{petId}": {"get": {}},
+                },
+            }
+        )
+        finder = finder_cls(spec)
+        requests = [
+            ("get", "http://petstore.io/pets/1"),
+            ("get", "http://petstore.io/pets/2"),
+        ]
+        results = finder.find_many(requests)
+
+        results[0].server_result.variables["host"] = "store"
+
+        assert results[1].server_result.variables == {"host": "petstore"}
+        result = finder.find(*requests[0])
+        assert result.server_result.variables == {"host": "petstore"}
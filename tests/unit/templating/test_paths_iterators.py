@@ -0,0 +1,72 @@
+import pytest
+from jsonschema_path import SchemaPath
+
+from openapi_core.templating.datatypes import TemplateResult
+from openapi_core.templating.paths.exceptions import PathsNotFound
+from openapi_core.templating.paths.iterators import SimplePathsIterator
+from openapi_core.templating.paths.iterators import TemplatePathsIterator
+
+
+class TestSimplePathsIterator:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {"webhooks": {"newPet": {}, "deletedPet": {}}}
+        )
+
+    def test_found(self, spec):
+        iterator = SimplePathsIterator("webhooks")
+
+        result = list(iterator("newPet", spec))
+
+        assert result == [
+            (spec / "webhooks" / "newPet", TemplateResult("newPet", {})),
+        ]
+
+    def test_snapshot_reused(self, spec):
+        iterator = SimplePathsIterator("webhooks")
+        list(iterator("newPet", spec))
+        snapshot = iterator._snapshot
+
+        list(iterator("deletedPet", spec))
+
+        assert iterator._snapshot is snapshot
+
+    def test_snapshot_spec_changed(self, spec):
+        iterator = SimplePathsIterator("webhooks")
+        list(iterator("newPet", spec))
+        spec_2 = SchemaPath.from_dict({"webhooks": {"updatedPet": {}}})
+
+        result = list(iterator("updatedPet", spec_2))
+
+        assert result == [
+            (
+                spec_2 / "webhooks" / "updatedPet",
+                TemplateResult("updatedPet", {}),
+            ),
+        ]
+
+    def test_paths_not_found(self):
+        iterator = SimplePathsIterator("webhooks")
+        spec = SchemaPath.from_dict({})
+
+        with pytest.raises(PathsNotFound):
+            list(iterator("newPet", spec))
+
+
+class TestTemplatePathsIterator:
+    def test_snapshot_reused(self):
+        spec = SchemaPath.from_dict({"paths": {"/pets/{petId}": {}}})
+        iterator = TemplatePathsIterator("paths")
+        list(iterator("http://petstore.swagger.io/pets/1", spec))
+        snapshot = iterator._snapshot
+
+        result = list(iterator("http://petstore.swagger.io/pets/2", spec))
+
+        assert iterator._snapshot is snapshot
+        assert result == [
+            (
+                spec / "paths" / "/pets/{petId}",
+                TemplateResult("/pets/{petId}", {"petId": "2"}),
+            ),
+        ]
@@ -0,0 +1,312 @@
+from unittest import mock
+
+import pytest
+from jsonschema_path import SchemaPath
+
+from openapi_core.templating.datatypes import TemplateResult
+from openapi_core.templating.paths.datatypes import PathOperation
+from openapi_core.templating.paths.exceptions import PathsNotFound
+from openapi_core.templating.paths.routers import LiteralPaths
+from openapi_core.templating.paths.routers import PathsRouter
+from openapi_core.templating.paths.routers import RegexPathsRouter
+from openapi_core.templating.paths.routers import SegmentsFilter
+from openapi_core.templating.paths.routers import ServersRouter
+
+
+@pytest.mark.parametrize("router_cls", [PathsRouter, RegexPathsRouter])
+class TestPathsRouter:
+    @pytest.fixture
+    def paths(self):
+        return {
+            "/keys/{id}/tokens/{id2}": {},
+            "/keys/{id}/tokens/master": {},
+            "/keys/master/tokens/master": {},
+            "/tokens": {},
+            "/files/{name}.{ext}": {},
+        }
+
+    @pytest.fixture
+    def spec(self, paths):
+        return SchemaPath.from_dict({"paths": paths})
+
+    @pytest.fixture
+    def router(self, router_cls, spec):
+        return router_cls(spec, "paths")
+
+    def test_precedence(self, router, spec):
+        full_url = "http://petstore.swagger.io/keys/master/tokens/master"
+
+        result = list(router(full_url, spec))
+
+        paths = spec / "paths"
+        assert result == [
+            (
+                paths / "/keys/master/tokens/master",
+                TemplateResult("/keys/master/tokens/master", {}),
+            ),
+            (
+                paths / "/keys/{id}/tokens/master",
+                TemplateResult("/keys/{id}/tokens/master", {"id": "master"}),
+            ),
+            (
+                paths / "/keys/{id}/tokens/{id2}",
+                TemplateResult(
+                    "/keys/{id}/tokens/{id2}",
+                    {"id": "master", "id2": "master"},
+                ),
+            ),
+        ]
+
+    def test_suffix(self, router, spec):
+        full_url = "http://petstore.swagger.io/v1/tokens"
+
+        result = list(router(full_url, spec))
+
+        assert result == [
+            (spec / "paths" / "/tokens", TemplateResult("/tokens", {})),
+        ]
+
+    def test_mixed_segment(self, router, spec):
+        full_url = "http://petstore.swagger.io/files/report.tar.gz"
+
+        result = list(router(full_url, spec))
+
+        path_result = TemplateResult(
+            "/files/{name}.{ext}", {"name": "report.tar", "ext": "gz"}
+        )
+        assert result == [
+            (spec / "paths" / "/files/{name}.{ext}", path_result),
+        ]
+
+    def test_literal_first(self, router, spec):
+        full_url = "http://petstore.swagger.io/keys/master/tokens/master"
+
+        result = router(full_url, spec)
+
+        assert next(result) == (
+            spec / "paths" / "/keys/master/tokens/master",
+            TemplateResult("/keys/master/tokens/master", {}),
+        )
+
+    def test_not_found(self, router, spec):
+        full_url = "http://petstore.swagger.io/keys/master"
+
+        result = list(router(full_url, spec))
+
+        assert result == []
+
+    def test_filter_rejected(self, router, spec):
+        full_url = "http://petstore.swagger.io/keys/1/tokens/2"
+
+        with mock.patch.object(router.filter, "rejects", return_value=True):
+            result = list(router(full_url, spec))
+
+        assert result == []
+
+    def test_paths_not_found(self, router_cls):
+        spec = SchemaPath.from_dict({})
+        router = router_cls(spec, "paths")
+
+        with pytest.raises(PathsNotFound):
+            router("http://petstore.swagger.io/tokens", spec)
+
+
+class TestRegexPathsRouter:
+    def test_literals_only(self):
+        spec = SchemaPath.from_dict({"paths": {"/tokens": {}}})
+        router = RegexPathsRouter(spec, "paths")
+
+        result = list(router("http://petstore.swagger.io/keys", spec))
+
+        assert result == []
+
+    def test_template_regexes_compiled_once(self):
+        spec = SchemaPath.from_dict(
+            {
+                "paths": {
+                    "/keys/{id}/tokens/{id2}": {},
+                    "/keys/{id}/tokens/master": {},
+                }
+            }
+        )
+        router = RegexPathsRouter(spec, "paths")
+        full_url = "http://petstore.swagger.io/keys/1/tokens/master"
+
+        list(router(full_url, spec))
+        regexes = dict(router.regexes)
+        list(router(full_url, spec))
+
+        assert list(regexes) == [1]
+        assert router.regexes[1] is regexes[1]
+
+
+class TestLiteralPaths:
+    @pytest.fixture
+    def paths(self):
+        return SchemaPath.from_dict(
+            {"/tokens": {}, "/v1/tokens": {}, "/v1/keys/": {}}
+        )
+
+    @pytest.fixture
+    def literals(self, paths):
+        literals = LiteralPaths()
+        for index, (pattern, path) in enumerate(paths.str_items()):
+            literals.add(index, pattern, path)
+        return literals
+
+    def test_depths(self, literals):
+        assert literals.depths == [1, 2, 3]
+
+    def test_spec_order(self, literals, paths):
+        segments = "http://petstore.swagger.io/v1/tokens".split("/")
+
+        result = literals.match(segments)
+
+        assert result == [
+            (paths / "/tokens", TemplateResult("/tokens", {})),
+            (paths / "/v1/tokens", TemplateResult("/v1/tokens", {})),
+        ]
+
+    def test_trailing_slash(self, literals, paths):
+        segments = "http://petstore.swagger.io/v1/keys/".split("/")
+
+        result = literals.match(segments)
+
+        assert result == [
+            (paths / "/v1/keys/", TemplateResult("/v1/keys/", {})),
+        ]
+
+    def test_not_found(self, literals):
+        segments = "http://petstore.swagger.io/v1/keys".split("/")
+
+        assert literals.match(segments) == []
+
+
+class TestSegmentsFilter:
+    @pytest.fixture
+    def segments_filter(self):
+        segments_filter = SegmentsFilter()
+        segments_filter.add("/keys/{id}/tokens")
+        segments_filter.add("/files/{name}.json")
+        return segments_filter
+
+    @pytest.mark.parametrize(
+        "full_url",
+        [
+            "http://petstore.swagger.io/keys/1/tokens",
+            "http://petstore.swagger.io/v1/files/report.json",
+            "http://petstore.swagger.io/files/report.xml",
+        ],
+    )
+    def test_accepts(self, segments_filter, full_url):
+        assert not segments_filter.rejects(full_url.split("/"))
+
+    @pytest.mark.parametrize(
+        "full_url",
+        [
+            "/1/tokens",
+            "http://petstore.swagger.io/keys/1/secrets",
+        ],
+    )
+    def test_rejects(self, full_url):
+        segments_filter = SegmentsFilter()
+        segments_filter.add("/keys/{id}/tokens")
+
+        assert segments_filter.rejects(full_url.split("/"))
+
+    def test_empty(self):
+        segments_filter = SegmentsFilter()
+
+        assert segments_filter.rejects("http://petstore.swagger.io".split("/"))
+
+
+class TestServersRouter:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "servers": [
+                    {"url": "http://petstore.swagger.io/{version}"},
+                ],
+                "paths": {
+                    "/pets": {
+                        "get": {},
+                        "post": {
+                            "servers": [{"url": "/v2/"}],
+                        },
+                    },
+                    "/tokens": {
+                        "servers": [{"url": "https://tokens.io"}],
+                        "get": {
+                            "servers": [{"url": "/v2"}],
+                        },
+                    },
+                },
+            }
+        )
+
+    def operations(self, spec, path_pattern, method):
+        path = spec / "paths" / path_pattern
+        return iter(
+            [PathOperation(path, path / method, TemplateResult(path_pattern))]
+        )
+
+    def test_table(self, spec):
+        router = ServersRouter(spec, "paths")
+
+        paths = spec / "paths"
+        assert set(router.matchers) == {
+            (paths / "/pets" / "get").parts,
+            (paths / "/pets" / "post").parts,
+            (paths / "/tokens" / "get").parts,
+        }
+
+    def test_spec_servers(self, spec):
+        router = ServersRouter(spec, "paths")
+        operations = self.operations(spec, "/pets", "get")
+
+        result = list(
+            router("http://petstore.swagger.io/v1/pets", operations, spec)
+        )
+
+        assert len(result) == 1
+        assert result[0].server == spec / "servers" / 0
+        assert result[0].server_result == TemplateResult(
+            "http://petstore.swagger.io/{version}", {"version": "v1"}
+        )
+
+    def test_operation_servers(self, spec):
+        router = ServersRouter(spec, "paths")
+        operations = self.operations(spec, "/pets", "post")
+
+        result = list(router("http://any.io/v2/pets", operations, spec))
+
+        assert len(result) == 1
+        assert result[0].server_result == TemplateResult("/v2/", {})
+
+    def test_path_servers_precedence(self, spec):
+        router = ServersRouter(spec, "paths")
+        operations = self.operations(spec, "/tokens", "get")
+
+        result = list(router("https://tokens.io/tokens", operations, spec))
+
+        assert len(result) == 1
+        assert result[0].server == spec / "paths" / "/tokens" / "servers" / 0
+
+    def test_base_url(self, spec):
+        router = ServersRouter(spec, "paths", base_url="http://other.io")
+        operations = self.operations(spec, "/pets", "post")
+
+        result = list(router("http://any.io/v2/pets", operations, spec))
+
+        assert result == []
+
+    def test_default_server(self):
+        spec = SchemaPath.from_dict({"paths": {"/pets": {"get": {}}}})
+        router = ServersRouter(spec, "paths")
+        operations = self.operations(spec, "/pets", "get")
+
+        result = list(router("http://any.io/pets", operations, spec))
+
+        assert len(result) == 1
+        assert result[0].server_result == TemplateResult("/", {})
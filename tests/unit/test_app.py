@@ -2,6 +2,8 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
+from jsonschema_path import SchemaPath
+from openapi_schema_validator import OAS31Validator
 
 from openapi_core import Config
 from openapi_core import OpenAPI
@@ -9,18 +11,27 @@ from openapi_core import V3RequestUnmarshaller
 from openapi_core import V3RequestValidator
 from openapi_core import V3ResponseUnmarshaller
 from openapi_core import V3ResponseValidator
+from openapi_core.casting.schemas import oas31_types_caster
+from openapi_core.casting.schemas.factories import SchemaCastersFactory
 from openapi_core.exceptions import SpecError
 from openapi_core.protocols import Request
 from openapi_core.protocols import Response
 from openapi_core.protocols import WebhookRequest
+from openapi_core.schema.snapshots import SnapshotAccessor
+from openapi_core.unmarshalling.request import V31RequestUnmarshaller
 from openapi_core.unmarshalling.request import V32RequestUnmarshaller
 from openapi_core.unmarshalling.request import V32WebhookRequestUnmarshaller
 from openapi_core.unmarshalling.response import V32ResponseUnmarshaller
 from openapi_core.unmarshalling.response import V32WebhookResponseUnmarshaller
+from openapi_core.unmarshalling.schemas import oas31_types_unmarshaller
+from openapi_core.unmarshalling.schemas.factories import (
+    SchemaUnmarshallersFactory,
+)
 from openapi_core.validation.request import V32RequestValidator
 from openapi_core.validation.request import V32WebhookRequestValidator
 from openapi_core.validation.response import V32ResponseValidator
 from openapi_core.validation.response import V32WebhookResponseValidator
+from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
 
 
 class TestOpenAPIFromPath:
@@ -214,3 +225,125 @@ class TestOpenAPIIterErrors:
 
         assert result is errors_iter
         mock_iter_errors.assert_called_once_with(request, response)
+
+
+class TestOpenAPIPrecompile:
+    @pytest.fixture
+    def spec_dict(self):
+        schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        return {
+            "openapi": "3.1.0",
+            "info": {"title": "Precompile", "version": "0"},
+            "paths": {
+                "/pets/{id}": {
+                    "parameters": [
+                        {
+                            "name": "id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "integer"},
+                        },
+                    ],
+                    "post": {
+                        "parameters": [
+                            {
+                                "name": "filter",
+                                "in": "query",
+                                "content": {
+                                    "application/json": {"schema": schema},
+                                },
+                            },
+                        ],
+                        "requestBody": {
+                            "content": {"application/json": {"schema": schema}}
+                        },
+                        "responses": {
+                            "200": {
+                                "description": "OK",
+                                "headers": {
+                                    "X-Rate-Limit": {
+                                        "schema": {"type": "integer"}
+                                    },
+                                },
+                                "content": {
+                                    "application/json": {"schema": schema}
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            "webhooks": {
+                "newPet": {
+                    "post": {
+                        "requestBody": {
+                            "content": {"application/json": {"schema": schema}}
+                        },
+                        "responses": {"200": {"description": "OK"}},
+                    },
+                },
+            },
+        }
+
+    def test_precompile(self, spec_dict):
+        openapi = OpenAPI.from_dict(spec_dict)
+
+        result = openapi.precompile()
+
+        assert result >= 0
+        assert openapi.request_validator.precompile() == 3
+        assert openapi.response_validator.precompile() == 2
+        assert openapi.webhook_request_unmarshaller.precompile() == 1
+        assert openapi.webhook_response_unmarshaller.precompile() == 0
+
+    def test_precompile_caches_grown(self, spec_dict):
+        spec = SchemaPath.from_dict(spec_dict)
+        schema_validators_factory = SchemaValidatorsFactory(
+            OAS31Validator, cache_maxsize=1
+        )
+        unmarshaller = V31RequestUnmarshaller(
+            spec,
+            schema_unmarshallers_factory=SchemaUnmarshallersFactory(
+                schema_validators_factory,
+                oas31_types_unmarshaller,
+                cache_maxsize=1,
+            ),
+            schema_casters_factory=SchemaCastersFactory(
+                schema_validators_factory, oas31_types_caster
+            ),
+            compile_schema_unmarshallers=True,
+        )
+
+        unmarshaller.precompile()
+
+        cache_info = schema_validators_factory.cache.cache_info()
+        assert cache_info.currsize == 3
+        plans_info = (
+            unmarshaller.schema_unmarshallers_factory.plans.cache_info()
+        )
+        assert plans_info.currsize == 3
+
+    @pytest.mark.parametrize("eager", [False, True])
+    def test_eager(self, spec_dict, eager):
+        config = Config(eager=eager)
+
+        with mock.patch.object(OpenAPI, "precompile") as mock_precompile:
+            OpenAPI.from_dict(spec_dict, config=config)
+
+        assert mock_precompile.called is eager
+
+
+class TestOpenAPISpecSnapshot:
+    def test_default(self, spec_v32):
+        openapi = OpenAPI(spec_v32)
+
+        assert openapi.spec is spec_v32
+
+    def test_snapshot(self, spec_v32):
+        config = Config(spec_snapshot=True)
+
+        openapi = OpenAPI(spec_v32, config=config)
+
+        assert isinstance(openapi.spec.accessor, SnapshotAccessor)
+        assert openapi.spec == spec_v32
+        assert openapi.request_validator.spec is openapi.spec
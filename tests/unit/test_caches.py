@@ -0,0 +1,93 @@
+from copy import deepcopy
+from unittest import mock
+
+import pytest
+
+from openapi_core.caches import LRUCache
+
+
+class TestLRUCache:
+    def test_get_missing(self):
+        cache = LRUCache(maxsize=2)
+
+        result = cache.get("key")
+
+        assert result is None
+        assert cache.cache_info() == (0, 1, 2, 0, None)
+
+    def test_get_hit(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key", "value")
+
+        result = cache.get("key")
+
+        assert result == "value"
+        assert cache.cache_info() == (1, 0, 2, 1, None)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+
+        cache.set("key3", "value3")
+
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") is None
+        assert cache.get("key3") == "value3"
+
+    @mock.patch("openapi_core.caches.monotonic")
+    def test_ttl_expired(self, mock_monotonic):
+        cache = LRUCache(maxsize=2, ttl=10)
+        mock_monotonic.return_value = 100
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 105
+        assert cache.get("key") == "value"
+
+        mock_monotonic.return_value = 111
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_reserve(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key1", "value1")
+
+        cache.reserve(3)
+        for key in ("key2", "key3", "key4"):
+            cache.set(key, key)
+
+        assert cache.maxsize == 4
+        assert cache.get("key1") == "value1"
+
+    def test_reserve_fits(self):
+        cache = LRUCache(maxsize=4)
+
+        cache.reserve(2)
+
+        assert cache.maxsize == 4
+
+    def test_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key", "value")
+        cache.get("key")
+
+        cache.clear()
+
+        assert cache.cache_info() == (0, 0, 2, 0, None)
+
+    def test_deepcopy(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key", ["value"])
+
+        result = deepcopy(cache)
+
+        assert result.get("key") == ["value"]
+        assert result.get("key") is not cache.get("key")
+        result.set("key2", "value2")
+        assert cache.get("key2") is None
+
+    @pytest.mark.parametrize("maxsize,ttl", [(0, None), (1, 0)])
+    def test_invalid(self, maxsize, ttl):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=maxsize, ttl=ttl)
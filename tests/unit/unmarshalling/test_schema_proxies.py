@@ -0,0 +1,51 @@
+from unittest import mock
+
+import pytest
+
+from openapi_core.unmarshalling.schemas.proxies import ArrayProxy
+from openapi_core.unmarshalling.schemas.proxies import ObjectProxy
+
+
+class TestObjectProxy:
+    def test_unmarshalled_once(self):
+        unmarshal = mock.Mock(side_effect=str.upper)
+        proxy = ObjectProxy({"a": (unmarshal, "x"), "b": (unmarshal, "y")})
+
+        assert unmarshal.call_count == 0
+        assert proxy["a"] == "X"
+        assert proxy["a"] == "X"
+        assert unmarshal.call_count == 1
+        assert "b" in proxy
+        assert unmarshal.call_count == 1
+
+    def test_mapping(self):
+        proxy = ObjectProxy({"a": (str.upper, "x"), "b": (str.upper, "y")})
+
+        assert len(proxy) == 2
+        assert list(proxy) == ["a", "b"]
+        assert proxy == {"a": "X", "b": "Y"}
+        assert proxy.get("c") is None
+        with pytest.raises(KeyError):
+            proxy["c"]
+
+
+class TestArrayProxy:
+    def test_unmarshalled_once(self):
+        unmarshal = mock.Mock(side_effect=str.upper)
+        proxy = ArrayProxy(unmarshal, ["x", "y"])
+
+        assert unmarshal.call_count == 0
+        assert proxy[-1] == "Y"
+        assert proxy[1] == "Y"
+        assert unmarshal.call_count == 1
+
+    def test_sequence(self):
+        proxy = ArrayProxy(str.upper, ["x", "y", "z"])
+
+        assert len(proxy) == 3
+        assert proxy == ["X", "Y", "Z"]
+        assert proxy == ArrayProxy(str.upper, ["x", "y", "z"])
+        assert proxy[1:] == ["Y", "Z"]
+        assert "Z" in proxy
+        with pytest.raises(IndexError):
+            proxy[3]
@@ -1,9 +1,13 @@
+from dataclasses import asdict
+from datetime import date
 from functools import partial
+from unittest.mock import patch
 
 import pytest
 from jsonschema_path import SchemaPath
 from openapi_schema_validator import OAS30WriteValidator
 
+from openapi_core.unmarshalling.schemas import oas30_format_unmarshallers
 from openapi_core.unmarshalling.schemas import oas30_types_unmarshaller
 from openapi_core.unmarshalling.schemas.exceptions import (
     FormatterNotFoundError,
@@ -11,6 +15,12 @@ from openapi_core.unmarshalling.schemas.exceptions import (
 from openapi_core.unmarshalling.schemas.factories import (
     SchemaUnmarshallersFactory,
 )
+from openapi_core.unmarshalling.schemas.proxies import ArrayProxy
+from openapi_core.unmarshalling.schemas.proxies import ObjectProxy
+from openapi_core.unmarshalling.schemas.unmarshallers import (
+    CompiledSchemaUnmarshaller,
+)
+from openapi_core.unmarshalling.schemas.unmarshallers import SchemaUnmarshaller
 from openapi_core.validation.schemas import (
     oas30_write_schema_validators_factory,
 )
@@ -259,3 +269,349 @@ class TestOAS30SchemaUnmarshallerUnmarshal:
         result = unmarshaller.unmarshal(value)
 
         assert result == value
+
+
+class TestOAS30SchemaUnmarshallerComposedSchemas:
+    def test_matched_once(self, unmarshaller_factory):
+        schema = {
+            "type": "object",
+            "oneOf": [
+                {
+                    "type": "object",
+                    "properties": {"count": {"type": "integer"}},
+                },
+                {"type": "string"},
+            ],
+            "allOf": [
+                {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                },
+            ],
+        }
+        spec = SchemaPath.from_dict(schema)
+        unmarshaller = unmarshaller_factory(spec)
+        schema_validator = unmarshaller.schema_validator
+        value = {"count": 1, "name": "openapi-core"}
+
+        with patch.object(
+            schema_validator,
+            "get_composed_schemas",
+            wraps=schema_validator.get_composed_schemas,
+        ) as get_composed_schemas:
+            result = unmarshaller.unmarshal(value)
+
+        assert result == value
+        get_composed_schemas.assert_called_once_with(value)
+
+    @pytest.mark.parametrize(
+        "schema,value,expected,calls",
+        [
+            ({"type": "integer", "oneOf": [{"minimum": 0}]}, 1, 1, 0),
+            (
+                {"type": "string", "format": "custom", "oneOf": [{}]},
+                "a",
+                "A",
+                0,
+            ),
+            ({"type": "string", "oneOf": [{"format": "custom"}]}, "a", "A", 1),
+        ],
+    )
+    def test_matched_on_demand(
+        self, unmarshaller_factory, schema, value, expected, calls
+    ):
+        spec = SchemaPath.from_dict(schema)
+        unmarshaller = unmarshaller_factory(
+            spec, extra_format_unmarshallers={"custom": str.upper}
+        )
+        schema_validator = unmarshaller.schema_validator
+
+        with patch.object(
+            schema_validator,
+            "get_composed_schemas",
+            wraps=schema_validator.get_composed_schemas,
+        ) as get_composed_schemas:
+            result = unmarshaller.unmarshal(value)
+
+        assert result == expected
+        assert get_composed_schemas.call_count == calls
+
+    def test_any_of_discriminator_merged(self, unmarshaller_factory):
+        spec = SchemaPath.from_dict(
+            {
+                "components": {
+                    "schemas": {
+                        "Cat": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "format": "custom"},
+                            },
+                        },
+                        "Dog": {
+                            "type": "object",
+                            "properties": {"pet_type": {"type": "string"}},
+                        },
+                        "Pet": {
+                            "anyOf": [
+                                {"$ref": "#/components/schemas/Cat"},
+                                {"$ref": "#/components/schemas/Dog"},
+                            ],
+                            "discriminator": {"propertyName": "pet_type"},
+                        },
+                    }
+                }
+            }
+        )
+        unmarshaller = unmarshaller_factory(
+            spec / "components" / "schemas" / "Pet",
+            extra_format_unmarshallers={"custom": str.upper},
+        )
+
+        result = unmarshaller.unmarshal({"pet_type": "Dog", "name": "rex"})
+
+        assert result == {"pet_type": "Dog", "name": "REX"}
+
+
+class TestOAS30SchemaUnmarshallerCompiledPlan:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "components": {
+                    "schemas": {
+                        "Pet": {
+                            "type": "object",
+                            "x-model": "Pet",
+                            "required": ["name"],
+                            "properties": {
+                                "name": {"type": "string"},
+                                "birthday": {
+                                    "type": "string",
+                                    "format": "date",
+                                },
+                                "tags": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "default": [],
+                                },
+                                "parent": {
+                                    "$ref": "#/components/schemas/Pet",
+                                },
+                                "owner": {
+                                    "nullable": True,
+                                    "oneOf": [
+                                        {"type": "string"},
+                                        {"type": "integer"},
+                                    ],
+                                },
+                            },
+                            "additionalProperties": {
+                                "type": "string",
+                                "format": "uuid",
+                            },
+                        },
+                    },
+                },
+            }
+        )
+
+    @pytest.fixture
+    def factory(self):
+        return SchemaUnmarshallersFactory(
+            oas30_write_schema_validators_factory,
+            oas30_types_unmarshaller,
+            format_unmarshallers=oas30_format_unmarshallers,
+        )
+
+    def create(self, factory, spec, **kwargs):
+        schema = spec / "components" / "schemas" / "Pet"
+        return factory.create(spec, schema, **kwargs)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"name": "Tom"},
+            {"name": "Tom", "birthday": "2020-01-02", "tags": ["cat"]},
+            {"name": "Tom", "owner": "Bob"},
+            {"name": "Tom", "parent": {"name": "Bob", "owner": 1}},
+            {"name": "Tom", "extra": "b5e6b1a4-9d4c-4f3a-a4b1-b3a5b7d8c9e0"},
+        ],
+    )
+    def test_same_result(self, factory, spec, value):
+        unmarshaller = self.create(factory, spec)
+        compiled = self.create(factory, spec, compiled_plan=True)
+
+        result = compiled.unmarshal(value)
+
+        assert isinstance(compiled, CompiledSchemaUnmarshaller)
+        # nested models are created per schema location, compare fields
+        assert type(result).__name__ == "Pet"
+        assert asdict(result) == asdict(unmarshaller.unmarshal(value))
+
+    def test_invalid(self, factory, spec):
+        compiled = self.create(factory, spec, compiled_plan=True)
+
+        with pytest.raises(InvalidSchemaValue):
+            compiled.unmarshal({"name": "Tom", "parent": {"name": 1}})
+
+    def test_plan_reused(self, factory, spec):
+        compiled = self.create(factory, spec, compiled_plan=True)
+
+        result = self.create(factory, spec, compiled_plan=True)
+
+        assert result is not compiled
+        assert result.plan is compiled.plan
+
+    def test_plan_reused_validators_not_cached(self, spec):
+        factory = SchemaUnmarshallersFactory(
+            SchemaValidatorsFactory(OAS30WriteValidator, cache_maxsize=0),
+            oas30_types_unmarshaller,
+            format_unmarshallers=oas30_format_unmarshallers,
+        )
+        compiled = self.create(factory, spec, compiled_plan=True)
+
+        result = self.create(factory, spec, compiled_plan=True)
+
+        assert result.schema_validator is not compiled.schema_validator
+        assert result.plan is compiled.plan
+        assert len(factory.plans) == 1
+
+    def test_plan_not_cached(self, factory, spec):
+        # unhashable format validators
+        extra_format_validators = {"custom": {}}
+
+        compiled = self.create(
+            factory,
+            spec,
+            compiled_plan=True,
+            extra_format_validators=extra_format_validators,
+        )
+        result = self.create(
+            factory,
+            spec,
+            compiled_plan=True,
+            extra_format_validators=extra_format_validators,
+        )
+
+        assert result.plan is not compiled.plan
+        assert len(factory.plans) == 0
+
+    @pytest.mark.parametrize("compiled_plan", [False, True])
+    def test_trusted(self, factory, spec, compiled_plan):
+        unmarshaller = self.create(factory, spec)
+        trusted = self.create(
+            factory, spec, compiled_plan=compiled_plan, trusted=True
+        )
+        value = {
+            "name": "Tom",
+            "birthday": "2020-01-02",
+            "parent": {"name": 1},
+        }
+
+        result = trusted.unmarshal(value)
+
+        assert asdict(result) == {
+            "name": "Tom",
+            "birthday": date(2020, 1, 2),
+            "tags": [],
+            "parent": {"name": 1, "tags": []},
+        }
+        with pytest.raises(InvalidSchemaValue):
+            unmarshaller.unmarshal(value)
+
+    @pytest.mark.parametrize("compiled_plan", [False, True])
+    def test_lazy(self, factory, spec, compiled_plan):
+        spec_dict = spec.read_value()
+        spec_dict["components"]["schemas"]["Owner"] = {
+            "type": "object",
+            "properties": {
+                "pets": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/Pet"},
+                },
+                "born": {"type": "string", "format": "date"},
+            },
+        }
+        spec = SchemaPath.from_dict(spec_dict)
+        schema = spec / "components" / "schemas" / "Owner"
+        lazy = factory.create(
+            spec, schema, compiled_plan=compiled_plan, lazy=True
+        )
+        value = {"pets": [{"name": "Tom"}], "born": "2020-01-02"}
+
+        result = lazy.unmarshal(value)
+
+        assert isinstance(result, ObjectProxy)
+        assert isinstance(result["pets"], ArrayProxy)
+        assert result["pets"] is result["pets"]
+        assert result["born"] == date(2020, 1, 2)
+        assert asdict(result["pets"][0]) == {"name": "Tom", "tags": []}
+
+    def test_lazy_invalid(self, factory, spec):
+        lazy = self.create(factory, spec, lazy=True)
+
+        with pytest.raises(InvalidSchemaValue):
+            lazy.unmarshal({"name": "Tom", "parent": {"name": 1}})
+
+    def test_trusted_plan(self, factory, spec):
+        compiled = self.create(factory, spec, compiled_plan=True)
+
+        result = self.create(factory, spec, compiled_plan=True, trusted=True)
+
+        assert result.trusted is True
+        assert result.plan is not compiled.plan
+
+
+class TestOAS30SchemaUnmarshallerBatch:
+    @pytest.fixture
+    def factory(self):
+        return SchemaUnmarshallersFactory(
+            oas30_write_schema_validators_factory,
+            oas30_types_unmarshaller,
+            format_unmarshallers=oas30_format_unmarshallers,
+        )
+
+    @pytest.mark.parametrize(
+        "schema,value,expected",
+        [
+            ({"type": "integer"}, [1, 2], [1, 2]),
+            ({"type": "string"}, ["a"], ["a"]),
+            (
+                {"type": "string", "format": "date", "nullable": True},
+                ["2020-01-02", None],
+                [date(2020, 1, 2), None],
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("compiled_plan", [False, True])
+    def test_array(self, factory, compiled_plan, schema, value, expected):
+        spec = SchemaPath.from_dict({"type": "array", "items": schema})
+        unmarshaller = factory.create(spec, spec, compiled_plan=compiled_plan)
+
+        with patch.object(
+            SchemaUnmarshaller,
+            "get_batch_unmarshaller",
+            autospec=True,
+            side_effect=SchemaUnmarshaller.get_batch_unmarshaller,
+        ) as mock_get_batch_unmarshaller:
+            result = unmarshaller.unmarshal(value)
+
+        assert result == expected
+        assert mock_get_batch_unmarshaller.called is not compiled_plan
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            {"type": "object"},
+            {"type": "array"},
+            {"type": ["string", "integer"]},
+            {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+        ],
+    )
+    def test_not_primitive(self, factory, schema):
+        spec = SchemaPath.from_dict(schema)
+        unmarshaller = factory.create(spec, spec)
+
+        result = unmarshaller.get_batch_unmarshaller()
+
+        assert result is None
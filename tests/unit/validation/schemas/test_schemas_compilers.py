@@ -0,0 +1,261 @@
+import pytest
+from jsonschema_path import SchemaPath
+from openapi_schema_validator import OAS30ReadValidator
+from openapi_schema_validator import OAS30StrictValidator
+from openapi_schema_validator import OAS30WriteValidator
+from openapi_schema_validator import OAS31Validator
+from openapi_schema_validator import OAS32Validator
+
+from openapi_core.validation.schemas.compilers import KEYWORD_COMPILERS
+from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
+from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
+from openapi_core.validation.schemas.validators import CompiledSchemaValidator
+
+COMPONENTS = {
+    "Cat": {
+        "type": "object",
+        "required": ["pet_type", "name"],
+        "properties": {
+            "pet_type": {"type": "string"},
+            "name": {"type": "string", "minLength": 2},
+        },
+    },
+    "Dog": {
+        "type": "object",
+        "required": ["pet_type"],
+        "properties": {
+            "pet_type": {"type": "string"},
+            "bark": {"type": "boolean", "nullable": True},
+        },
+    },
+    "Node": {
+        "type": "object",
+        "properties": {
+            "value": {"type": "integer"},
+            "next": {"$ref": "#/components/schemas/Node"},
+        },
+    },
+}
+
+SCHEMAS = [
+    {"type": "string", "nullable": True, "maxLength": 3},
+    {"type": "string", "format": "binary"},
+    {"type": "string", "format": "date"},
+    {"type": "string", "pattern": "^a[0-9]+$"},
+    {
+        "type": "integer",
+        "minimum": 1,
+        "maximum": 10,
+        "exclusiveMaximum": True,
+    },
+    {"type": "number", "multipleOf": 0.5},
+    {
+        "type": "array",
+        "items": {"type": "integer"},
+        "minItems": 1,
+        "uniqueItems": True,
+    },
+    {
+        "type": "object",
+        "required": ["id", "secret"],
+        "properties": {
+            "id": {"type": "integer", "readOnly": True},
+            "secret": {"type": "string", "writeOnly": True},
+        },
+        "additionalProperties": False,
+    },
+    {
+        "type": "object",
+        "additionalProperties": {"type": "integer"},
+        "maxProperties": 2,
+    },
+    {
+        "oneOf": [
+            {"$ref": "#/components/schemas/Cat"},
+            {"$ref": "#/components/schemas/Dog"},
+        ],
+        "discriminator": {"propertyName": "pet_type"},
+    },
+    {
+        "anyOf": [
+            {"$ref": "#/components/schemas/Cat"},
+            {"$ref": "#/components/schemas/Dog"},
+        ],
+        "discriminator": {
+            "propertyName": "pet_type",
+            "mapping": {
+                "c": "#/components/schemas/Cat",
+                "m": "#/components/schemas/Missing",
+            },
+        },
+    },
+    {"oneOf": [{"type": "integer"}, {"type": "number"}]},
+    {"allOf": [{"type": "object"}, {"required": ["name"]}]},
+    {"not": {"type": "string"}},
+    {"enum": ["a", 1, None, [1]]},
+    {"enum": [1, [True], {"a": [1.0]}]},
+    {"type": "array", "items": {"const": [1]}},
+    {"$ref": "#/components/schemas/Node"},
+]
+
+VALUES = [
+    None,
+    True,
+    1,
+    10,
+    1.5,
+    "a12",
+    "abcd",
+    "2020-01-01",
+    "2020-13-01",
+    b"data",
+    [],
+    [1, 1],
+    [1, "a"],
+    [True],
+    [[1]],
+    [[True]],
+    {"a": [1]},
+    {"a": [True]},
+    {},
+    {"id": 1},
+    {"secret": "s"},
+    {"id": 1, "secret": "s", "other": 1},
+    {"a": 1, "b": 2, "c": 3},
+    {"pet_type": "Cat", "name": "Tom"},
+    {"pet_type": "Cat", "name": "T"},
+    {"pet_type": "Dog", "bark": None},
+    {"pet_type": "Bird"},
+    {"pet_type": "c", "name": "Tom"},
+    {"pet_type": "m"},
+    {"pet_type": ""},
+    {"name": "Tom"},
+    {"value": 1, "next": {"value": "x"}},
+    {"value": 1, "next": {"value": 2, "next": {}}},
+]
+
+
+def create(validator_cls, schema, **kwargs):
+    spec = SchemaPath.from_dict(
+        {"components": {"schemas": dict(COMPONENTS, Schema=schema)}}
+    )
+    factory = SchemaValidatorsFactory(validator_cls, cache_maxsize=0)
+    return factory.create(
+        spec, spec / "components" / "schemas" / "Schema", **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "validator_cls", [OAS30ReadValidator, OAS30WriteValidator, OAS31Validator]
+)
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_equivalent(validator_cls, schema):
+    validator = create(validator_cls, schema, compiled=True)
+
+    assert isinstance(validator, CompiledSchemaValidator)
+    assert validator.check is not None
+    for value in VALUES:
+        assert validator.check(value) is validator.validator.is_valid(value)
+
+
+# keywords of OpenAPI 3.1+ dialects validated by jsonschema only
+NOT_COMPILED_KEYWORDS = {
+    "$dynamicRef",
+    "contains",
+    "dependentSchemas",
+    "if",
+    "patternProperties",
+    "prefixItems",
+    "propertyNames",
+    "unevaluatedItems",
+    "unevaluatedProperties",
+}
+
+
+@pytest.mark.parametrize(
+    "validator_cls,not_compiled",
+    [
+        (OAS30ReadValidator, set()),
+        (OAS30WriteValidator, set()),
+        (OAS30StrictValidator, set()),
+        (OAS31Validator, NOT_COMPILED_KEYWORDS),
+        (OAS32Validator, NOT_COMPILED_KEYWORDS),
+    ],
+)
+def test_keywords(validator_cls, not_compiled):
+    # keyword functions changed by dependencies must be reviewed
+    result = {
+        keyword
+        for keyword, keyword_validator in validator_cls.VALIDATORS.items()
+        if keyword_validator not in KEYWORD_COMPILERS
+    }
+
+    assert result == not_compiled
+
+
+class TestCompiledSchemaValidator:
+    def test_same_errors(self):
+        schema = SCHEMAS[7]
+        value = {"id": 1, "other": 1}
+        validator = create(OAS30WriteValidator, schema)
+        compiled = create(OAS30WriteValidator, schema, compiled=True)
+
+        with pytest.raises(InvalidSchemaValue) as exc_info:
+            validator.validate(value)
+        with pytest.raises(InvalidSchemaValue) as compiled_exc_info:
+            compiled.validate(value)
+
+        assert str(compiled_exc_info.value) == str(exc_info.value)
+        assert [
+            error.message for error in compiled_exc_info.value.schema_errors
+        ] == [error.message for error in exc_info.value.schema_errors]
+
+    def test_not_compilable(self):
+        schema = {"type": "object", "unevaluatedProperties": False}
+        validator = create(OAS31Validator, schema, compiled=True)
+
+        assert validator.check is None
+        validator.validate({})
+        with pytest.raises(InvalidSchemaValue):
+            validator.validate({"name": "Tom"})
+
+    def test_ref_siblings(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "next": {
+                    "$ref": "#/components/schemas/Node",
+                    "type": "string",
+                },
+            },
+        }
+        validator = create(OAS30WriteValidator, schema, compiled=True)
+
+        assert validator.check is None
+        for value in VALUES:
+            assert validator.is_valid(value) is validator.validator.is_valid(
+                value
+            )
+
+    def test_strict(self):
+        schema = {"type": "object", "properties": {"name": {}}}
+        validator = create(
+            OAS30WriteValidator,
+            schema,
+            compiled=True,
+            forbid_unspecified_additional_properties=True,
+        )
+
+        with pytest.raises(InvalidSchemaValue):
+            validator.validate({"other": 1})
+
+    def test_evolve(self):
+        validator = create(OAS30WriteValidator, SCHEMAS[9], compiled=True)
+
+        subvalidator = validator.evolve(validator.schema / "oneOf" / 0)
+
+        assert isinstance(subvalidator, CompiledSchemaValidator)
+        assert subvalidator.compiler is validator.compiler
+        subvalidator.validate({"pet_type": "Cat", "name": "Tom"})
+        with pytest.raises(InvalidSchemaValue):
+            subvalidator.validate({"pet_type": "Dog"})
@@ -1,12 +1,16 @@
 from typing import cast
 from unittest.mock import patch
 
+import pytest
 from jsonschema._format import FormatChecker
 from jsonschema.protocols import Validator
+from jsonschema_path import SchemaPath
+from openapi_schema_validator import OAS30WriteValidator
 
 from openapi_core.validation.schemas.factories import (
     DialectSchemaValidatorsFactory,
 )
+from openapi_core.validation.schemas.factories import SchemaValidatorsFactory
 
 
 class MockValidator:
@@ -57,3 +61,178 @@ class TestDialectSchemaValidatorsFactoryCaching:
             )
             assert result3 == "MockedClass2"
             mock_validator_for2.assert_called_once()
+
+
+class TestSchemaValidatorsFactoryCache:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {"components": {"schemas": {"Pet": {"type": "object"}}}}
+        )
+
+    @pytest.fixture
+    def schema(self, spec):
+        return spec / "components" / "schemas" / "Pet"
+
+    def test_cached(self, spec, schema):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+
+        validator = factory.create(spec, schema)
+
+        assert factory.create(spec, schema) is validator
+        assert factory.cache.cache_info().hits == 1
+
+    def test_options(self, spec, schema):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+
+        validator = factory.create(spec, schema)
+
+        assert factory.create(spec, schema, format_validators={}) is not (
+            validator
+        )
+        assert (
+            factory.create(spec, schema, enforce_properties_required=True)
+            is not validator
+        )
+        assert (
+            factory.create(
+                spec, schema, forbid_unspecified_additional_properties=True
+            )
+            is not validator
+        )
+        assert factory.create(spec, schema, compiled=True) is not validator
+
+    def test_same_location_other_spec(self, spec, schema):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+        spec_2 = SchemaPath.from_dict(
+            {"components": {"schemas": {"Pet": {"type": "string"}}}}
+        )
+        schema_2 = spec_2 / "components" / "schemas" / "Pet"
+
+        validator = factory.create(spec, schema)
+        validator_2 = factory.create(spec_2, schema_2)
+
+        assert validator_2 is not validator
+        validator_2.validate("dog")
+
+    def test_disabled(self, spec, schema):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator, cache_maxsize=0)
+
+        assert factory.cache is None
+        assert factory.create(spec, schema) is not factory.create(spec, schema)
+
+
+class TestStrictValidatorClasses:
+    def test_memoized(self):
+        spec = SchemaPath.from_dict({"type": "object"})
+        factory = SchemaValidatorsFactory(OAS30WriteValidator, cache_maxsize=0)
+
+        validator = factory.create(
+            spec,
+            spec,
+            forbid_unspecified_additional_properties=True,
+            enforce_properties_required=True,
+        )
+        validator_2 = factory.create(
+            spec,
+            spec,
+            forbid_unspecified_additional_properties=True,
+            enforce_properties_required=True,
+        )
+
+        assert validator.validator.__class__ is validator_2.validator.__class__
+        assert validator.validator.__class__ is not OAS30WriteValidator
+
+
+class TestSchemaValidatorsFactoryFormatChecker:
+    def test_default_shared(self):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+
+        format_checker = factory.get_format_checker()
+
+        assert format_checker is OAS30WriteValidator.FORMAT_CHECKER
+
+    def test_extra_composed_once(self):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+        extra_format_validators = {"custom": lambda value: True}
+
+        format_checker = factory.get_format_checker(
+            extra_format_validators=extra_format_validators
+        )
+
+        assert "custom" in format_checker.checkers
+        assert "custom" not in OAS30WriteValidator.FORMAT_CHECKER.checkers
+        assert (
+            factory.get_format_checker(
+                extra_format_validators=extra_format_validators
+            )
+            is format_checker
+        )
+
+    def test_format_validators(self):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+
+        format_checker = factory.get_format_checker(
+            format_validators={"custom": lambda value: True}
+        )
+
+        assert list(format_checker.checkers) == ["custom"]
+
+    def test_bounded(self):
+        factory = SchemaValidatorsFactory(
+            OAS30WriteValidator, format_checkers_cache_maxsize=1
+        )
+        format_validators = {"custom": lambda value: True}
+        format_checker = factory.get_format_checker(format_validators)
+
+        factory.get_format_checker({"other": lambda value: True})
+
+        assert len(factory._format_checkers) == 1
+        assert factory.get_format_checker(format_validators) is not (
+            format_checker
+        )
+
+    def test_unhashable(self):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+        format_validators = {"custom": {}}
+
+        format_checker = factory.get_format_checker(format_validators)
+
+        assert list(format_checker.checkers) == ["custom"]
+        assert len(factory._format_checkers) == 0
+
+
+class TestSchemaValidatorsFactoryCompilers:
+    @pytest.fixture
+    def validator(self):
+        return OAS30WriteValidator({"type": "string"})
+
+    def test_shared(self, validator):
+        factory = SchemaValidatorsFactory(OAS30WriteValidator)
+        spec = SchemaPath.from_dict({})
+
+        compiler = factory.get_compiler(spec, validator)
+
+        assert factory.get_compiler(spec, validator) is compiler
+
+    def test_bounded(self, validator):
+        factory = SchemaValidatorsFactory(
+            OAS30WriteValidator, compilers_cache_maxsize=1
+        )
+        spec = SchemaPath.from_dict({})
+        compiler = factory.get_compiler(spec, validator)
+
+        factory.get_compiler(SchemaPath.from_dict({}), validator)
+
+        assert len(factory._compilers) == 1
+        assert factory.get_compiler(spec, validator) is not compiler
+
+    def test_disabled(self, validator):
+        factory = SchemaValidatorsFactory(
+            OAS30WriteValidator, compilers_cache_maxsize=0
+        )
+        spec = SchemaPath.from_dict({})
+
+        compiler = factory.get_compiler(spec, validator)
+
+        assert factory.get_compiler(spec, validator) is not compiler
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from jsonschema_path import SchemaPath
 
@@ -5,6 +7,7 @@ from openapi_core.validation.schemas import (
     oas30_write_schema_validators_factory,
 )
 from openapi_core.validation.schemas.exceptions import InvalidSchemaValue
+from openapi_core.validation.schemas.validators import SchemaValidator
 
 
 class TestSchemaValidate:
@@ -356,3 +359,254 @@ class TestSchemaValidate:
                 schema,
                 enforce_properties_required=True,
             ).validate({"name": "openapi-core", "meta": {}})
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [({"name": "openapi-core", "age": 1}, True), ({"age": "1"}, False)],
+    )
+    def test_is_valid(self, value, expected, spec):
+        schema_dict = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+            },
+            "required": ["name"],
+        }
+        schema = SchemaPath.from_dict(schema_dict)
+
+        result = oas30_write_schema_validators_factory.create(
+            spec, schema
+        ).is_valid(value)
+
+        assert result is expected
+
+    @pytest.mark.parametrize(
+        "first_error_only,errors_count", [(False, 2), (True, 1)]
+    )
+    def test_first_error_only(self, first_error_only, errors_count, spec):
+        schema_dict = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+            },
+            "required": ["name"],
+        }
+        schema = SchemaPath.from_dict(schema_dict)
+        validator = oas30_write_schema_validators_factory.create(
+            spec,
+            schema,
+            first_error_only=first_error_only,
+        )
+
+        with pytest.raises(InvalidSchemaValue) as exc_info:
+            validator.validate({"age": "1"})
+
+        assert len(exc_info.value.schema_errors) == errors_count
+
+
+class TestSchemaValidatorEvolve:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "age": {"type": "integer"},
+                },
+            }
+        )
+
+    @pytest.fixture
+    def validator(self, spec):
+        return oas30_write_schema_validators_factory.create(spec, spec)
+
+    def test_memoized(self, validator, spec):
+        schema = spec / "properties" / "name"
+
+        evolved = validator.evolve(schema)
+
+        assert validator.evolve(spec / "properties" / "name") is evolved
+        assert validator.evolve(spec / "properties" / "age") is not evolved
+        evolved.validate("openapi-core")
+
+    def test_other_spec(self, validator, spec):
+        other_spec = SchemaPath.from_dict(
+            {"properties": {"name": {"type": "integer"}}}
+        )
+
+        evolved = validator.evolve(spec / "properties" / "name")
+        other_evolved = validator.evolve(other_spec / "properties" / "name")
+
+        assert other_evolved is not evolved
+        other_evolved.validate(1)
+
+
+class TestSchemaValidatorPrecompile:
+    @pytest.fixture
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "components": {
+                    "schemas": {
+                        "Node": {
+                            "type": "object",
+                            "properties": {
+                                "value": {"type": "integer"},
+                                "children": {
+                                    "type": "array",
+                                    "items": {
+                                        "$ref": "#/components/schemas/Node"
+                                    },
+                                },
+                            },
+                            "additionalProperties": {
+                                "oneOf": [{"type": "string"}]
+                            },
+                        },
+                    }
+                }
+            }
+        )
+
+    def test_recursive(self, spec):
+        schema = spec / "components" / "schemas" / "Node"
+        validator = oas30_write_schema_validators_factory.create(spec, schema)
+
+        validator.precompile()
+
+        children = schema / "properties" / "children"
+        additional = schema / "additionalProperties"
+        # precompiled subschemas are not evolved again
+        with mock.patch.object(
+            type(validator), "_evolve", side_effect=AssertionError
+        ):
+            validator.evolve(schema / "properties" / "value").validate(1)
+            children_validator = validator.evolve(children)
+            children_validator.evolve(children / "items").validate({})
+            additional_validator = validator.evolve(additional)
+            additional_validator.evolve(additional / "oneOf" / 0)
+
+    def test_recursive_bounded(self, spec, monkeypatch):
+        monkeypatch.setattr(SchemaValidator, "evolved_maxsize", 4)
+        schema = spec / "components" / "schemas" / "Node"
+        validator = oas30_write_schema_validators_factory.create(spec, schema)
+        schemas = [schema]
+        for _ in range(8):
+            schemas.append(schemas[-1] / "properties" / "children")
+            schemas.append(schemas[-1] / "items")
+        evolved = [validator]
+        for subschema in schemas[1:]:
+            evolved.append(evolved[-1].evolve(subschema))
+
+        evolved[-1].validate({"value": 1})
+        # the least recently evolved validators are dropped
+        assert validator.evolve(schemas[1]) is not evolved[1]
+        assert validator.evolve(schemas[-1]) is evolved[-1]
+
+
+class TestSchemaValidatorDiscriminator:
+    @pytest.fixture
+    def spec(self):
+        pet = {
+            "type": "object",
+            "required": ["pet_type"],
+            "properties": {"pet_type": {"type": "string"}},
+        }
+        refs = [
+            {"$ref": "#/components/schemas/Cat"},
+            {"$ref": "#/components/schemas/Dog"},
+        ]
+        return SchemaPath.from_dict(
+            {
+                "components": {
+                    "schemas": {
+                        "Cat": pet,
+                        "Dog": pet,
+                        "OneOf": {
+                            "oneOf": refs,
+                            "discriminator": {"propertyName": "pet_type"},
+                        },
+                        "OneOfNames": {
+                            "oneOf": refs,
+                            "discriminator": {
+                                "propertyName": "pet_type",
+                                "mapping": {"cat": "Cat", "dog": "Dog"},
+                            },
+                        },
+                        "OneOfRefs": {
+                            "oneOf": refs,
+                            "discriminator": {
+                                "propertyName": "pet_type",
+                                "mapping": {
+                                    "dog": "#/components/schemas/Dog",
+                                },
+                            },
+                        },
+                        "AnyOf": {
+                            "anyOf": refs,
+                            "discriminator": {
+                                "propertyName": "pet_type",
+                                "mapping": {
+                                    "dog": "#/components/schemas/Dog",
+                                },
+                            },
+                        },
+                    }
+                }
+            }
+        )
+
+    def create(self, spec, name):
+        schema = spec / "components" / "schemas" / name
+        return oas30_write_schema_validators_factory.create(spec, schema)
+
+    def test_one_of(self, spec):
+        validator = self.create(spec, "OneOf")
+        cls = type(validator)
+
+        with mock.patch.object(
+            cls, "_evolve", autospec=True, side_effect=cls._evolve
+        ) as evolve:
+            result = validator.get_one_of_schema({"pet_type": "Dog"})
+
+        assert result == validator.schema / "oneOf" / 1
+        # only the discriminated schema is validated
+        evolve.assert_called_once_with(validator, result)
+
+    @pytest.mark.parametrize("name", ["OneOfNames", "OneOfRefs"])
+    def test_one_of_mapping(self, spec, name):
+        validator = self.create(spec, name)
+
+        result = validator.get_one_of_schema({"pet_type": "dog"})
+
+        assert result == validator.schema / "oneOf" / 1
+
+    def test_one_of_fallback(self, spec):
+        validator = self.create(spec, "OneOf")
+
+        result = validator.get_one_of_schema({"pet_type": "Bird"})
+
+        assert result == validator.schema / "oneOf" / 0
+
+    def test_any_of_all_matches(self, spec):
+        validator = self.create(spec, "AnyOf")
+
+        result = list(validator.iter_any_of_schemas({"pet_type": "dog"}))
+
+        assert result == [
+            validator.schema / "anyOf" / 0,
+            validator.schema / "anyOf" / 1,
+        ]
+
+    def test_any_of_fallback(self, spec):
+        validator = self.create(spec, "AnyOf")
+
+        result = list(validator.iter_any_of_schemas({"pet_type": ""}))
+
+        assert result == [
+            validator.schema / "anyOf" / 0,
+            validator.schema / "anyOf" / 1,
+        ]